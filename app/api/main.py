@@ -2,21 +2,35 @@
 FastAPI backend for the Resume Evaluation System
 Provides REST API endpoints for all operations
 """
-from fastapi import FastAPI, UploadFile, File, HTTPException, Depends
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse, PlainTextResponse, FileResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 import uvicorn
 import json
+import time
+import numpy as np
 
-from app.db.database import get_db
+from app.db.database import get_db, SessionLocal
 from app.db import crud, models
 from app.parsing.files import extract_text
 from app.parsing.jd_parser import parse_jd_freeform
-from app.services.evaluator import evaluate_resume_against_job
-from app.services.llm_evaluator import llm_evaluator
-from app.nlp.advanced_processor import text_processor
+from app.services.evaluator import evaluate_resume_against_job, evaluation_report
+from app.services.llm_evaluator import get_llm_evaluator, peek_llm_evaluator
+from app.services.vector_index import normalize_location
+from app.services.retrieval import top_candidates_for_job, recommend_jobs_for_resume, recommend_jobs
+from app.services.resume_features import get_resume_features
+from app.services.job_artifacts import get_job_artifacts
+from app.services.rescoring import rescore_evaluations
+from app.services.export import iter_evaluation_pages, iter_csv, iter_parquet, parquet_available
+from app.services.warmup import warm_up, warm_up_in_background, warm_up_status
+from app.config import WARM_UP_ON_STARTUP
+from app.nlp.resources import resource_status
+from app.metrics import HTTP_REQUEST_SECONDS, render as render_metrics
+from app.profiling import capture, request_profiling, list_traces, load_trace, trace_file
 
 # Pydantic models for API
 class JobCreate(BaseModel):
@@ -26,6 +40,20 @@ class JobCreate(BaseModel):
     nice_skills: List[str]
     location: Optional[str] = ""
 
+class JobUpdate(BaseModel):
+    title: Optional[str] = None
+    jd_text: Optional[str] = None
+    must_skills: Optional[List[str]] = None
+    nice_skills: Optional[List[str]] = None
+    location: Optional[str] = None
+
+class JobBatchItem(BaseModel):
+    title: Optional[str] = None  # parsed from the JD when missing
+    jd_text: str
+    must_skills: Optional[List[str]] = None  # parsed from the JD when both lists are missing
+    nice_skills: Optional[List[str]] = None
+    location: Optional[str] = ""
+
 class JobResponse(BaseModel):
     id: int
     title: str
@@ -33,6 +61,22 @@ class JobResponse(BaseModel):
     must_skills: List[str]
     nice_skills: List[str]
     created_at: str
+    jd_text: Optional[str] = None
+    qualifications: Optional[str] = None
+
+class JDText(BaseModel):
+    jd_text: str
+
+class ResumeText(BaseModel):
+    resume_text: str
+    limit: int = 5
+
+class TextEvaluationRequest(BaseModel):
+    job_id: int
+    student_name: str
+    resume_text: str
+    file_name: Optional[str] = ""
+    location: Optional[str] = ""
 
 class ResumeCreate(BaseModel):
     student_name: str
@@ -47,11 +91,31 @@ class EvaluationResponse(BaseModel):
     llm_feedback: Optional[Dict[str, Any]] = None
     created_at: str
 
+class ResumeResponse(BaseModel):
+    id: int
+    student_name: Optional[str]
+    file_name: Optional[str]
+    location: Optional[str]
+    text: str
+    created_at: str
+
+class EvaluationListItem(BaseModel):
+    id: int
+    job_id: int
+    resume_id: int
+    score: float
+    verdict: str
+    missing_skills: List[str]
+    suggestions: Optional[str]
+    created_at: str
+    job: Optional[JobResponse] = None
+    resume: Optional[ResumeResponse] = None
+
 class AdvancedEvaluationResponse(BaseModel):
     basic_evaluation: EvaluationResponse
     llm_analysis: Optional[Dict[str, Any]] = None
     extracted_entities: Dict[str, Any]
-    text_summary: Dict[str, int]
+    text_summary: Dict[str, float]
 
 class StudentApplicationCreate(BaseModel):
     job_id: int
@@ -61,6 +125,20 @@ class StudentApplicationCreate(BaseModel):
     location: Optional[str] = ""
     cover_letter: Optional[str] = ""
 
+def student_application_form(
+    job_id: int = Form(...),
+    student_name: str = Form(...),
+    email: str = Form(...),
+    phone: str = Form(""),
+    location: str = Form(""),
+    cover_letter: str = Form(""),
+) -> StudentApplicationCreate:
+    """Application fields sent as form fields next to the resume file (JSON bodies cannot be mixed with uploads)"""
+    return StudentApplicationCreate(
+        job_id=job_id, student_name=student_name, email=email,
+        phone=phone, location=location, cover_letter=cover_letter,
+    )
+
 class StudentApplicationResponse(BaseModel):
     id: int
     job_id: int
@@ -73,6 +151,19 @@ class StudentApplicationResponse(BaseModel):
     status: str
     created_at: str
     job_title: str
+    resume_text: Optional[str] = None
+    evaluation_id: Optional[int] = None
+
+class SkillUpsert(BaseModel):
+    name: str
+    category: Optional[str] = None
+    aliases: Optional[List[str]] = None
+
+class SkillResponse(BaseModel):
+    id: int
+    name: str
+    category: Optional[str]
+    aliases: List[str]
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -90,6 +181,41 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template, not raw path, to keep the series count bounded
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=status,
+        )
+
+@app.middleware("http")
+async def profile_on_request(request: Request, call_next):
+    # Opt in with "X-Profile: 1" or "?profile=1"; the trace id comes back in X-Profile-Trace
+    flag = request.headers.get("x-profile") or request.query_params.get("profile")
+    if (flag or "").lower() not in ("1", "true", "yes"):
+        return await call_next(request)
+    with request_profiling(True), capture(f"{request.method} {request.url.path}", profile=True) as trace:
+        response = await call_next(request)
+    response.headers["X-Profile-Trace"] = trace.id
+    return response
+
+@app.on_event("startup")
+async def startup_warm_up():
+    # Load models in the background so the server accepts requests immediately
+    if WARM_UP_ON_STARTUP:
+        warm_up_in_background()
+
 @app.get("/")
 async def root():
     return {
@@ -103,15 +229,129 @@ async def root():
         ]
     }
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 @app.get("/health")
 async def health_check():
+    # Report on the evaluator only if it is loaded; a health probe must not trigger model loading
+    llm_evaluator = peek_llm_evaluator()
+    if llm_evaluator is None:
+        return {
+            "status": "healthy",
+            "models_loaded": False,
+            "warmed_up": warm_up_status(),
+            "nlp_resources": resource_status(),
+            "llm_available": None,
+            "vector_store_available": None,
+            "vector_backend": None
+        }
     return {
         "status": "healthy",
+        "models_loaded": True,
+        "warmed_up": warm_up_status(),
+        "nlp_resources": resource_status(),
         "llm_available": llm_evaluator.llm is not None,
-        "vector_store_available": llm_evaluator.collection is not None
+        "vector_store_available": llm_evaluator.vector_index is not None,
+        "vector_backend": llm_evaluator.vector_index.name if llm_evaluator.vector_index else None
     }
 
+@app.post("/admin/warm-up")
+async def warm_up_models():
+    """Load the embedding model, spaCy/NLTK and the LLM evaluator now instead of on first use"""
+    return {"loaded": await run_in_threadpool(warm_up)}
+
+@app.get("/admin/profiles")
+async def list_profiles():
+    """Stored slow/profiled request traces, newest first"""
+    return {"traces": list_traces()}
+
+@app.get("/admin/profiles/{trace_id}")
+async def get_profile(trace_id: str, format: str = "json"):
+    """A stored trace: ``json`` (spans and top functions) or ``prof`` (cProfile dump for pstats/snakeviz)"""
+    if format == "json":
+        trace = load_trace(trace_id)
+        if trace is None:
+            raise HTTPException(status_code=404, detail="Trace not found")
+        return trace
+    if format != "prof":
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'prof'")
+    path = trace_file(trace_id, "prof")
+    if path is None:
+        raise HTTPException(status_code=404, detail="No profile stored for this trace")
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{trace_id}.prof")
+
+@app.post("/admin/rescore")
+async def rescore(dry_run: bool = False, db: Session = Depends(get_db)):
+    """Recompute all evaluation scores/verdicts from stored components with the current weights"""
+    return await run_in_threadpool(rescore_evaluations, db, dry_run=dry_run)
+
+# Skill taxonomy endpoints
+def _skill_response(skill) -> SkillResponse:
+    return SkillResponse(id=skill.id, name=skill.name, category=skill.category, aliases=sorted(a.alias for a in skill.aliases))
+
+@app.get("/skills", response_model=List[SkillResponse])
+async def list_skills(db: Session = Depends(get_db)):
+    """Canonical skills with their category and aliases"""
+    return [_skill_response(s) for s in crud.list_skills(db)]
+
+@app.post("/skills", response_model=SkillResponse)
+async def upsert_skill(skill: SkillUpsert, db: Session = Depends(get_db)):
+    """Create or update a skill; given aliases replace the existing ones. Takes effect immediately
+    for new extractions (stored resume skills are refreshed by reindexing)."""
+    try:
+        return _skill_response(crud.upsert_skill(db, name=skill.name, category=skill.category, aliases=skill.aliases))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.delete("/skills/{skill_id}")
+async def delete_skill(skill_id: int, db: Session = Depends(get_db)):
+    """Remove a skill and its aliases from the taxonomy"""
+    if not crud.delete_skill(db, skill_id):
+        raise HTTPException(status_code=404, detail="Skill not found")
+    return {"message": "Skill deleted", "skill_id": skill_id}
+
 # Job Description endpoints
+def _job_response(job) -> JobResponse:
+    """Job with its JD text and qualifications (for clients that render job details)"""
+    return JobResponse(
+        id=job.id,
+        title=job.title,
+        location=job.location,
+        must_skills=json.loads(job.must_skills_json or '[]'),
+        nice_skills=json.loads(job.nice_skills_json or '[]'),
+        created_at=job.created_at.isoformat(),
+        jd_text=job.jd_text,
+        qualifications=job.qualifications
+    )
+
+def _resume_response(resume) -> ResumeResponse:
+    return ResumeResponse(
+        id=resume.id,
+        student_name=resume.student_name,
+        file_name=resume.file_name,
+        location=resume.location,
+        text=resume.text,
+        created_at=resume.created_at.isoformat()
+    )
+
+def _index_resume(db: Session, resume, job_id: int):
+    """Add a resume to the vector store for the resume search endpoints"""
+    get_llm_evaluator().add_to_vector_store(
+        text=resume.text,
+        metadata={
+            "type": "resume",
+            "student_name": resume.student_name,
+            "job_id": job_id,
+            "resume_id": resume.id,
+            "location": normalize_location(resume.location or "")
+        },
+        doc_id=f"resume_{resume.id}",
+        embedding=get_resume_features(db, resume).embedding
+    )
+
 @app.post("/jobs/", response_model=JobResponse)
 async def create_job(job: JobCreate, db: Session = Depends(get_db)):
     """Create a new job description"""
@@ -126,24 +366,18 @@ async def create_job(job: JobCreate, db: Session = Depends(get_db)):
         )
         
         # Add to vector store for semantic search
-        llm_evaluator.add_to_vector_store(
+        get_llm_evaluator().add_to_vector_store(
             text=job.jd_text,
             metadata={
                 "type": "job_description",
                 "title": job.title,
-                "job_id": db_job.id
+                "job_id": db_job.id,
+                "location": normalize_location(job.location)
             },
             doc_id=f"job_{db_job.id}"
         )
         
-        return JobResponse(
-            id=db_job.id,
-            title=db_job.title,
-            location=db_job.location,
-            must_skills=json.loads(db_job.must_skills_json or '[]'),
-            nice_skills=json.loads(db_job.nice_skills_json or '[]'),
-            created_at=db_job.created_at.isoformat()
-        )
+        return _job_response(db_job)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -151,17 +385,7 @@ async def create_job(job: JobCreate, db: Session = Depends(get_db)):
 async def list_jobs(db: Session = Depends(get_db)):
     """List all job descriptions"""
     jobs = crud.list_jobs(db)
-    return [
-        JobResponse(
-            id=job.id,
-            title=job.title,
-            location=job.location,
-            must_skills=json.loads(job.must_skills_json or '[]'),
-            nice_skills=json.loads(job.nice_skills_json or '[]'),
-            created_at=job.created_at.isoformat()
-        )
-        for job in jobs
-    ]
+    return [_job_response(job) for job in jobs]
 
 @app.get("/jobs/{job_id}")
 async def get_job(job_id: int, db: Session = Depends(get_db)):
@@ -170,15 +394,140 @@ async def get_job(job_id: int, db: Session = Depends(get_db)):
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return JobResponse(
-        id=job.id,
-        title=job.title,
-        location=job.location,
-        must_skills=json.loads(job.must_skills_json or '[]'),
-        nice_skills=json.loads(job.nice_skills_json or '[]'),
-        created_at=job.created_at.isoformat()
+    return _job_response(job)
+
+@app.put("/jobs/{job_id}", response_model=JobResponse)
+async def update_job(job_id: int, update: JobUpdate, db: Session = Depends(get_db)):
+    """Edit a job description; its precomputed scoring artifacts are rebuilt and its vector
+    index entry is replaced (an HNSW FAISS index is rebuilt for it, see ``vector_index``)"""
+    job = crud.update_job(
+        db,
+        job_id,
+        title=update.title,
+        jd_text=update.jd_text,
+        must_skills=update.must_skills,
+        nice_skills=update.nice_skills,
+        location=update.location
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if update.jd_text is not None or update.title is not None or update.location is not None:
+        get_llm_evaluator().add_to_vector_store(
+            text=job.jd_text,
+            metadata={
+                "type": "job_description",
+                "title": job.title,
+                "job_id": job.id,
+                "location": normalize_location(job.location)
+            },
+            doc_id=f"job_{job.id}",
+            # Just rebuilt by update_job; the index gets the same vector the scorer uses
+            embedding=get_job_artifacts(db, job).jd_embedding
+        )
+
+    return _job_response(job)
+
+@app.get("/jobs/{job_id}/candidates")
+async def get_job_candidates(
+    job_id: int,
+    limit: int = 50,
+    pool: int = 300,
+    db: Session = Depends(get_db)
+):
+    """Top-K resumes for a job: vector + skill prefilter, then full hard/soft reranking"""
+    job = crud.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    try:
+        candidates = top_candidates_for_job(
+            db, job, limit=limit, pool=max(pool, limit), vector_index=get_llm_evaluator().vector_index
+        )
+        return {
+            "job_id": job_id,
+            "job_title": job.title,
+            "total_results": len(candidates),
+            "candidates": candidates
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Candidate retrieval failed: {str(e)}")
+
+@app.post("/jobs/batch")
+async def create_jobs_batch(items: List[JobBatchItem], db: Session = Depends(get_db)):
+    """Create many job descriptions (e.g. a bulk export) and their artifacts in one transaction"""
+    if not items:
+        raise HTTPException(status_code=400, detail="No jobs given")
+    specs, parsed_items = [], []
+    for i, item in enumerate(items):
+        if not item.jd_text.strip():
+            raise HTTPException(status_code=400, detail=f"Job {i}: empty jd_text")
+        needs_parse = not item.title or (item.must_skills is None and item.nice_skills is None)
+        parsed = parse_jd_freeform(item.jd_text) if needs_parse else {}
+        parsed_items.append(parsed)
+        title = item.title or parsed.get("role_title") or "Not specified"
+        specs.append({
+            "title": title,
+            "jd_text": item.jd_text,
+            "must_skills": item.must_skills if item.must_skills is not None else parsed.get("must", []),
+            "nice_skills": item.nice_skills if item.nice_skills is not None else parsed.get("nice", []),
+            "qualifications": "\n".join(parsed.get("qualifications", [])),
+            "location": item.location or "",
+        })
+
+    try:
+        jobs = crud.create_jobs(db, specs)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to create jobs: {str(e)}")
+
+    # Add to vector store in one write, reusing the JD embeddings computed for the artifacts
+    vecs = [get_job_artifacts(db, job).jd_embedding for job in jobs]
+    get_llm_evaluator().add_many_to_vector_store(
+        texts=[job.jd_text for job in jobs],
+        metadatas=[
+            {
+                "type": "job_description",
+                "title": job.title,
+                "job_id": job.id,
+                "location": normalize_location(job.location)
+            }
+            for job in jobs
+        ],
+        doc_ids=[f"job_{job.id}" for job in jobs],
+        embeddings=None if any(v is None for v in vecs) else np.stack(vecs)
     )
 
+    return {
+        "created": len(jobs),
+        "jobs": [
+            {
+                "id": job.id,
+                "title": job.title,
+                "location": job.location,
+                "must_skills": json.loads(job.must_skills_json or '[]'),
+                "nice_skills": json.loads(job.nice_skills_json or '[]'),
+                "created_at": job.created_at.isoformat(),
+                "certifications": parsed.get("certifications", []),
+                "requires_projects": parsed.get("requires_projects"),
+            }
+            for job, parsed in zip(jobs, parsed_items)
+        ],
+    }
+
+@app.post("/jobs/parse")
+async def parse_job_description(body: JDText):
+    """Suggested title, must/nice skills, qualifications and certifications for a JD text"""
+    return parse_jd_freeform(body.jd_text)
+
+@app.post("/jobs/recommend")
+async def recommend_jobs_for_text(body: ResumeText, db: Session = Depends(get_db)):
+    """Rank all open jobs for a resume text that is not stored (e.g. a student browsing positions)"""
+    try:
+        recommendations = recommend_jobs(db, body.resume_text, limit=body.limit)
+        return {"total_results": len(recommendations), "recommendations": recommendations}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Job recommendation failed: {str(e)}")
+
 @app.post("/jobs/upload")
 async def upload_job_file(
     title: str,
@@ -204,12 +553,13 @@ async def upload_job_file(
         )
         
         # Add to vector store
-        llm_evaluator.add_to_vector_store(
+        get_llm_evaluator().add_to_vector_store(
             text=jd_text,
             metadata={
                 "type": "job_description",
                 "title": title,
-                "job_id": db_job.id
+                "job_id": db_job.id,
+                "location": normalize_location(location)
             },
             doc_id=f"job_{db_job.id}"
         )
@@ -252,81 +602,130 @@ async def evaluate_resume(
             location=location
         )
         
-        # Basic evaluation
         basic_eval = evaluate_resume_against_job(db, job, resume)
+        report = evaluation_report(db, job, resume, basic_eval)
         
-        # Advanced text processing
-        entities = text_processor.extract_entities(resume_text)
-        text_summary = text_processor.get_text_summary(resume_text)
+        _index_resume(db, resume, job_id)
         
-        # LLM-powered evaluation
-        llm_analysis = None
-        if llm_evaluator.llm:
-            llm_result = llm_evaluator.evaluate_with_llm(resume_text, job.jd_text)
-            llm_analysis = {
-                "semantic_score": llm_result.semantic_score,
-                "detailed_feedback": llm_result.detailed_feedback,
-                "skill_gaps": llm_result.skill_gaps,
-                "strengths": llm_result.strengths,
-                "improvement_suggestions": llm_result.improvement_suggestions,
-                "relevance_explanation": llm_result.relevance_explanation,
-                "confidence_score": llm_result.confidence_score
-            }
-        
-        # Add resume to vector store
-        llm_evaluator.add_to_vector_store(
-            text=resume_text,
-            metadata={
-                "type": "resume",
-                "student_name": student_name,
-                "job_id": job_id,
-                "resume_id": resume.id
-            },
-            doc_id=f"resume_{resume.id}"
-        )
+        return AdvancedEvaluationResponse(**report)
         
-        return AdvancedEvaluationResponse(
-            basic_evaluation=EvaluationResponse(
-                id=basic_eval.id,
-                score=basic_eval.score,
-                verdict=basic_eval.verdict,
-                missing_skills=json.loads(basic_eval.missing_json or '[]'),
-                suggestions=basic_eval.suggestions,
-                created_at=basic_eval.created_at.isoformat()
-            ),
-            llm_analysis=llm_analysis,
-            extracted_entities={
-                "skills": entities.skills,
-                "experience_years": entities.experience_years,
-                "education": entities.education,
-                "certifications": entities.certifications,
-                "technologies": entities.technologies,
-                "companies": entities.companies,
-                "locations": entities.locations,
-                "contact_info": entities.contact_info
-            },
-            text_summary=text_summary
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Evaluation failed: {str(e)}")
+
+@app.post("/evaluate/text", response_model=AdvancedEvaluationResponse)
+async def evaluate_resume_text(body: TextEvaluationRequest, db: Session = Depends(get_db)):
+    """Evaluate already-extracted resume text (e.g. a stored application) against a job"""
+    job = crud.get_job(db, body.job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    try:
+        resume = crud.create_resume(
+            db=db,
+            student_name=body.student_name,
+            file_name=body.file_name or "",
+            text=body.resume_text,
+            location=body.location or ""
         )
-        
+        evaluation = evaluate_resume_against_job(db, job, resume)
+        report = evaluation_report(db, job, resume, evaluation)
+        _index_resume(db, resume, job.id)
+        return AdvancedEvaluationResponse(**report)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Evaluation failed: {str(e)}")
 
+@app.get("/evaluations/", response_model=List[EvaluationListItem])
+async def list_evaluations(
+    job_id: Optional[int] = None,
+    min_score: Optional[float] = None,
+    location: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Evaluations with their job and resume, best score first"""
+    jobs = {}
+    items = []
+    for ev in crud.list_evaluations(db, job_id=job_id, min_score=min_score, location=location):
+        if ev.job_id not in jobs and ev.job is not None:
+            jobs[ev.job_id] = _job_response(ev.job)
+        items.append(EvaluationListItem(
+            id=ev.id,
+            job_id=ev.job_id,
+            resume_id=ev.resume_id,
+            score=ev.score,
+            verdict=ev.verdict,
+            missing_skills=json.loads(ev.missing_json or '[]'),
+            suggestions=ev.suggestions,
+            created_at=ev.created_at.isoformat(),
+            job=jobs.get(ev.job_id),
+            resume=_resume_response(ev.resume) if ev.resume else None
+        ))
+    return items
+
+@app.get("/resumes/", response_model=List[ResumeResponse])
+async def list_resumes(db: Session = Depends(get_db)):
+    """All resumes, newest first"""
+    return [_resume_response(r) for r in crud.list_resumes(db)]
+
+@app.get("/resumes/{resume_id}/features")
+async def get_resume_entities(resume_id: int, db: Session = Depends(get_db)):
+    """Entities and text summary extracted from a resume at ingest"""
+    resume = crud.get_resume(db, resume_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    features = get_resume_features(db, resume)
+    return {
+        "resume_id": resume_id,
+        "extracted_entities": features.entities_dict(),
+        "text_summary": features.summary
+    }
+
+def _search_filters(doc_type: str, job_id: Optional[int] = None, location: Optional[str] = None) -> Dict[str, Any]:
+    """Metadata filters pushed down into the vector query"""
+    where: Dict[str, Any] = {"type": doc_type}
+    if job_id is not None:
+        where["job_id"] = job_id
+    if location:
+        where["location"] = normalize_location(location)
+    return where
+
+@app.get("/resumes/{resume_id}/recommended-jobs")
+async def get_recommended_jobs(
+    resume_id: int,
+    limit: int = 10,
+    db: Session = Depends(get_db)
+):
+    """Rank all open jobs for a resume in one vectorized pass"""
+    resume = crud.get_resume(db, resume_id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    
+    try:
+        recommendations = recommend_jobs_for_resume(db, resume, limit=limit)
+        return {
+            "resume_id": resume_id,
+            "student_name": resume.student_name,
+            "total_results": len(recommendations),
+            "recommendations": recommendations
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Job recommendation failed: {str(e)}")
+
 @app.get("/search/resumes")
 async def search_resumes(
     query: str,
     limit: int = 10,
+    job_id: Optional[int] = None,
+    location: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Semantic search for resumes"""
+    """Semantic search for resumes, optionally restricted to a job and/or location"""
     try:
-        results = llm_evaluator.semantic_search(query, n_results=limit)
-        
-        # Filter for resume documents
-        resume_results = [r for r in results if r["metadata"].get("type") == "resume"]
+        results = get_llm_evaluator().semantic_search(
+            query, n_results=limit, where=_search_filters("resume", job_id, location)
+        )
         
         return {
             "query": query,
-            "results": resume_results[:limit]
+            "results": results
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Search failed: {str(e)}")
@@ -335,18 +734,18 @@ async def search_resumes(
 async def search_jobs(
     query: str,
     limit: int = 10,
+    location: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Semantic search for job descriptions"""
+    """Semantic search for job descriptions, optionally restricted to a location"""
     try:
-        results = llm_evaluator.semantic_search(query, n_results=limit)
-        
-        # Filter for job documents
-        job_results = [r for r in results if r["metadata"].get("type") == "job_description"]
+        results = get_llm_evaluator().semantic_search(
+            query, n_results=limit, where=_search_filters("job_description", location=location)
+        )
         
         return {
             "query": query,
-            "results": job_results[:limit]
+            "results": results
         }
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Search failed: {str(e)}")
@@ -394,11 +793,12 @@ async def get_dashboard_analytics(db: Session = Depends(get_db)):
 
 @app.post("/student-applications/", response_model=StudentApplicationResponse)
 async def submit_student_application(
-    application: StudentApplicationCreate,
+    application: StudentApplicationCreate = Depends(student_application_form),
     file: UploadFile = File(...),
+    evaluate: bool = False,
     db: Session = Depends(get_db)
 ):
-    """Submit a student application with resume"""
+    """Submit a student application with resume; ``evaluate`` also scores it for the admin review"""
     try:
         # Verify job exists
         job = crud.get_job(db, application.job_id)
@@ -422,6 +822,23 @@ async def submit_student_application(
             cover_letter=application.cover_letter
         )
         
+        if evaluate:
+            # Continue even if analysis fails; the admin dashboard can re-run it
+            try:
+                resume = crud.create_resume(
+                    db=db,
+                    student_name=application.student_name,
+                    file_name=file.filename,
+                    text=resume_text,
+                    location=application.location
+                )
+                evaluation = evaluate_resume_against_job(db, job, resume)
+                db_application.evaluation_id = evaluation.id
+                db.commit()
+                _index_resume(db, resume, job.id)
+            except Exception as e:
+                print(f"Analysis error: {e}")
+        
         return StudentApplicationResponse(
             id=db_application.id,
             job_id=db_application.job_id,
@@ -433,7 +850,8 @@ async def submit_student_application(
             cover_letter=db_application.cover_letter,
             status=db_application.status,
             created_at=db_application.created_at.isoformat(),
-            job_title=job.title
+            job_title=job.title,
+            evaluation_id=db_application.evaluation_id
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Application submission failed: {str(e)}")
@@ -459,7 +877,9 @@ async def list_student_applications(
             cover_letter=app.cover_letter,
             status=app.status,
             created_at=app.created_at.isoformat(),
-            job_title=app.job.title
+            job_title=app.job.title,
+            resume_text=app.resume_text,
+            evaluation_id=app.evaluation_id
         )
         for app in applications
     ]
@@ -601,5 +1021,45 @@ async def get_shortlisted_resumes(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to get shortlisted resumes: {str(e)}")
 
+@app.get("/export/evaluations")
+def export_evaluations(
+    format: str = "csv",
+    job_id: Optional[int] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    verdict: Optional[str] = None,
+    location: Optional[str] = None,
+    skills: Optional[str] = None
+):
+    """Stream all matching evaluations (joined to job and resume) as CSV or Parquet"""
+    if format not in ("csv", "parquet"):
+        raise HTTPException(status_code=400, detail="format must be 'csv' or 'parquet'")
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+
+    def body():
+        # The generator owns its session: it outlives the request handler
+        db = SessionLocal()
+        try:
+            pages = iter_evaluation_pages(
+                db,
+                job_id=job_id,
+                min_score=min_score,
+                max_score=max_score,
+                verdict=verdict,
+                location=location,
+                skills=skills.split(",") if skills else None
+            )
+            yield from (iter_csv(pages) if format == "csv" else iter_parquet(pages))
+        finally:
+            db.close()
+
+    media_type = "text/csv" if format == "csv" else "application/vnd.apache.parquet"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="evaluations.{format}"'}
+    )
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -9,6 +9,7 @@ IS_CLOUD_DEPLOYMENT = DEPLOYMENT_MODE == "cloud"
 # Scoring weights
 HARD_MATCH_WEIGHT = 0.6
 SOFT_MATCH_WEIGHT = 0.4
+LLM_BLEND_WEIGHT = 0.7  # share of the LLM semantic score in the blended soft score
 
 # Verdict thresholds
 VERDICT_THRESHOLDS = {
@@ -19,6 +20,55 @@ VERDICT_THRESHOLDS = {
 # Embeddings configuration
 EMBEDDINGS_MODEL = "sentence-transformers/all-MiniLM-L6-v2"  # used if available
 USE_EMBEDDINGS = True and not IS_CLOUD_DEPLOYMENT  # Disable embeddings on cloud to avoid rate limiting
+EMBEDDINGS_BACKEND = os.getenv("EMBEDDINGS_BACKEND", "torch")  # "torch" or "onnx" (int8-quantized export)
+ONNX_MODEL_DIR = os.getenv("ONNX_MODEL_DIR", "data/onnx/all-MiniLM-L6-v2")
+ONNX_NUM_THREADS = int(os.getenv("ONNX_NUM_THREADS", "0"))  # 0 = onnxruntime default
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+# Long documents are split into chunks below the model's 256-token limit for similarity
+EMBEDDING_CHUNKING = os.getenv("EMBEDDING_CHUNKING", "true").lower() == "true"
+EMBEDDING_CHUNK_WORDS = int(os.getenv("EMBEDDING_CHUNK_WORDS", "150"))
+EMBEDDING_MAX_CHUNKS = int(os.getenv("EMBEDDING_MAX_CHUNKS", "16"))  # per document
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "4096"))  # cached chunk vectors
+
+# Vector store configuration
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "chroma")  # "chroma" or "faiss"
+CHROMA_PERSIST_DIR = os.getenv("VECTOR_STORE_PERSIST_DIRECTORY", "./data/chroma_db")
+FAISS_INDEX_DIR = os.getenv("FAISS_INDEX_DIR", "data/faiss")
+FAISS_INDEX_TYPE = os.getenv("FAISS_INDEX_TYPE", "hnsw")  # "flat", "ivf" or "hnsw"
+FAISS_IVF_NLIST = int(os.getenv("FAISS_IVF_NLIST", "256"))
+FAISS_IVF_NPROBE = int(os.getenv("FAISS_IVF_NPROBE", "16"))
+FAISS_HNSW_M = int(os.getenv("FAISS_HNSW_M", "32"))
+FAISS_HNSW_EF_SEARCH = int(os.getenv("FAISS_HNSW_EF_SEARCH", "64"))
+FAISS_MMAP = os.getenv("FAISS_MMAP", "true").lower() == "true"  # memory-map the index file on load
+FAISS_FLUSH_EVERY = int(os.getenv("FAISS_FLUSH_EVERY", "50"))  # persist after this many single adds
+
+# Startup: heavy NLP/LLM components load lazily on first use; set to preload them in the background
+WARM_UP_ON_STARTUP = os.getenv("WARM_UP_ON_STARTUP", "false").lower() == "true"
+
+# Offline NLP resources (NLTK data and spaCy model; see app/nlp/resources.py)
+NLP_RESOURCE_DIR = os.getenv("NLP_RESOURCE_DIR", "data/nlp_resources")
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+
+# Skill taxonomy (see app/nlp/taxonomy.py): seconds between checks for edits made by other processes
+TAXONOMY_RELOAD_SECONDS = float(os.getenv("TAXONOMY_RELOAD_SECONDS", "30"))
+
+# Streamlit data access (see app/web/backend.py): "local" runs the evaluation stack inside the
+# Streamlit process; "api" makes Streamlit a thin HTTP client of the FastAPI app at API_BASE_URL
+WEB_BACKEND = os.getenv("WEB_BACKEND", "local")
+API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+API_TIMEOUT_SECONDS = float(os.getenv("API_TIMEOUT_SECONDS", "120"))  # evaluations may wait on the LLM
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "10"))  # pooled keep-alive connections to the API
+
+# Streamlit list caches (see app/web/cache.py): seconds before lists are reloaded to pick up
+# writes made outside the Streamlit app (its own writes invalidate them immediately)
+WEB_JOBS_TTL_SECONDS = float(os.getenv("WEB_JOBS_TTL_SECONDS", "300"))
+WEB_RESULTS_TTL_SECONDS = float(os.getenv("WEB_RESULTS_TTL_SECONDS", "30"))  # evaluations, resumes, applications
+
+# Profiling (see app/profiling.py): evaluations slower than PROFILE_SLOW_SECONDS keep a span
+# trace (0 disables); opt-in profiled requests also keep a cProfile dump
+PROFILE_DIR = os.getenv("PROFILE_DIR", "data/profiles")
+PROFILE_KEEP_TRACES = int(os.getenv("PROFILE_KEEP_TRACES", "20"))
+PROFILE_SLOW_SECONDS = float(os.getenv("PROFILE_SLOW_SECONDS", "10"))
 
 # Misc
 APP_NAME = "AI Resume Evaluation Engine"
@@ -1,7 +1,18 @@
+from datetime import datetime
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import List, Optional, Tuple
 from app.db import models
 from app.utils import dumps_json, loads_json
+from app.nlp.skills import extract_candidate_skills
+from app.parsing.sections import segment_resume
+from app.nlp.taxonomy import normalize_skill, seed_taxonomy, invalidate_taxonomy
+from app.services.job_artifacts import (
+    refresh_job_artifacts, invalidate_job_artifacts, build_job_artifacts_many, stage_job_artifacts,
+    remember_job_artifacts,
+)
+from app.services.resume_features import refresh_resume_features
+from app.metrics import timed_write
 
 
 # Jobs
@@ -16,11 +27,103 @@ def create_job(db: Session, *, title: str, jd_text: str, must_skills: List[str],
         location=location,
     )
     db.add(job)
-    db.commit()
+    with timed_write("create_job"):
+        db.commit()
+    db.refresh(job)
+    _build_job_artifacts(db, job)
+    return job
+
+
+def create_jobs(db: Session, specs: List[dict]) -> List[models.Job]:
+    """Create several jobs and their precomputed artifacts in one transaction.
+
+    Each spec takes the keyword arguments of ``create_job``. All JDs are encoded in one
+    batch; if that fails the jobs are still created and their artifacts built lazily.
+    """
+    jobs = [
+        models.Job(
+            title=spec["title"].strip(),
+            jd_text=spec["jd_text"],
+            must_skills_json=dumps_json([s.strip() for s in spec.get("must_skills") or [] if s.strip()]),
+            nice_skills_json=dumps_json([s.strip() for s in spec.get("nice_skills") or [] if s.strip()]),
+            qualifications=spec.get("qualifications") or "",
+            location=spec.get("location") or "",
+        )
+        for spec in specs
+    ]
+    if not jobs:
+        return []
+    db.add_all(jobs)
+    db.flush()  # assigns ids for the artifact rows
+
+    try:
+        artifacts = build_job_artifacts_many(jobs)
+    except Exception as e:
+        artifacts = []
+        print(f"Failed to precompute artifacts for {len(jobs)} jobs: {e}")
+
+    try:
+        for a in artifacts:
+            stage_job_artifacts(db, a)
+        with timed_write("create_jobs"):
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    remember_job_artifacts(artifacts)
+    for job in jobs:
+        db.refresh(job)
+    return jobs
+
+
+def update_job(
+    db: Session,
+    job_id: int,
+    *,
+    title: Optional[str] = None,
+    jd_text: Optional[str] = None,
+    must_skills: Optional[List[str]] = None,
+    nice_skills: Optional[List[str]] = None,
+    qualifications: Optional[str] = None,
+    location: Optional[str] = None,
+) -> Optional[models.Job]:
+    """Update the given fields of a job and rebuild its precomputed artifacts"""
+    job = get_job(db, job_id)
+    if not job:
+        return None
+    if title is not None:
+        job.title = title.strip()
+    if jd_text is not None:
+        job.jd_text = jd_text
+    if must_skills is not None:
+        job.must_skills_json = dumps_json([s.strip() for s in must_skills if s.strip()])
+    if nice_skills is not None:
+        job.nice_skills_json = dumps_json([s.strip() for s in nice_skills if s.strip()])
+    if qualifications is not None:
+        job.qualifications = qualifications
+    if location is not None:
+        job.location = location
+    with timed_write("update_job"):
+        db.commit()
     db.refresh(job)
+
+    invalidate_job_artifacts(db, job.id)
+    _build_job_artifacts(db, job)
+    from app.services.retrieval import invalidate_job_matrix
+    invalidate_job_matrix()
     return job
 
 
+def _build_job_artifacts(db: Session, job: models.Job):
+    # Artifacts are an optimization: a failure here must not fail the write, they are
+    # rebuilt lazily on first evaluation
+    try:
+        refresh_job_artifacts(db, job)
+    except Exception as e:
+        db.rollback()
+        print(f"Failed to precompute artifacts for job {job.id}: {e}")
+
+
 def list_jobs(db: Session) -> List[models.Job]:
     return db.query(models.Job).order_by(models.Job.created_at.desc()).all()
 
@@ -36,21 +139,125 @@ def create_resume(db: Session, *, student_name: str, file_name: str, text: str,
         student_name=student_name,
         file_name=file_name,
         text=text,
+        sections_json=dumps_json(segment_resume(text)),
         location=location,
     )
+    resume.skills = [models.ResumeSkill(skill=s) for s in extract_candidate_skills(text)]
     db.add(resume)
-    db.commit()
+    with timed_write("create_resume"):
+        db.commit()
     db.refresh(resume)
+    # Like job artifacts, the feature bundle is rebuilt lazily if this fails
+    try:
+        refresh_resume_features(db, resume)
+    except Exception as e:
+        db.rollback()
+        print(f"Failed to precompute features for resume {resume.id}: {e}")
     return resume
 
 
+def get_resume(db: Session, resume_id: int) -> Optional[models.Resume]:
+    return db.query(models.Resume).filter(models.Resume.id == resume_id).first()
+
+
+def reindex_resume_skills(db: Session) -> int:
+    """Rebuild the resume_skills table for every resume (e.g. after the skill inventory changes)"""
+    db.query(models.ResumeSkill).delete()
+    count = 0
+    for resume_id, text in db.query(models.Resume.id, models.Resume.text).yield_per(500):
+        db.add_all(models.ResumeSkill(resume_id=resume_id, skill=s) for s in extract_candidate_skills(text))
+        count += 1
+    with timed_write("reindex_resume_skills"):
+        db.commit()
+    return count
+
+
+def resumes_by_skill_overlap(db: Session, skills: List[str], *, limit: int) -> List[Tuple[int, int]]:
+    """Return (resume_id, matched_skill_count) for resumes sharing any of ``skills``, best first"""
+    skills = [s.strip().lower() for s in skills if s.strip()]
+    if not skills:
+        return []
+    hits = func.count(models.ResumeSkill.id)
+    q = (
+        db.query(models.ResumeSkill.resume_id, hits)
+        .filter(models.ResumeSkill.skill.in_(skills))
+        .group_by(models.ResumeSkill.resume_id)
+        .order_by(hits.desc(), models.ResumeSkill.resume_id.desc())
+        .limit(limit)
+    )
+    return [(rid, int(n)) for rid, n in q.all()]
+
+
 def list_resumes(db: Session) -> List[models.Resume]:
     return db.query(models.Resume).order_by(models.Resume.created_at.desc()).all()
 
 
+# Skill taxonomy
+
+def list_skills(db: Session) -> List[models.Skill]:
+    seed_taxonomy(db)
+    return db.query(models.Skill).order_by(models.Skill.category, models.Skill.name).all()
+
+
+def upsert_skill(db: Session, *, name: str, category: Optional[str] = None, aliases: Optional[List[str]] = None) -> models.Skill:
+    """Create or update a canonical skill; ``aliases``, when given, replace the existing ones"""
+    seed_taxonomy(db)
+    name = normalize_skill(name)
+    if not name:
+        raise ValueError("Skill name is required")
+    if db.query(models.SkillAlias).filter(models.SkillAlias.alias == name).first():
+        raise ValueError(f"'{name}' is already an alias of another skill")
+    skill = db.query(models.Skill).filter(models.Skill.name == name).first()
+    if skill is None:
+        skill = models.Skill(name=name)
+        db.add(skill)
+    if category is not None:
+        skill.category = category.strip() or None
+    if aliases is not None:
+        wanted = sorted({normalize_skill(a) for a in aliases} - {"", name})
+        taken = [a.alias for a in db.query(models.SkillAlias).filter(models.SkillAlias.alias.in_(wanted)) if a.skill_id != skill.id]
+        taken += [s.name for s in db.query(models.Skill.name).filter(models.Skill.name.in_(wanted))]
+        if taken:
+            db.rollback()
+            raise ValueError(f"Already used by other skills: {', '.join(sorted(taken))}")
+        # Keep rows for unchanged aliases: the flush inserts before it deletes orphans
+        existing = {a.alias: a for a in skill.aliases}
+        skill.aliases = [existing.get(a) or models.SkillAlias(alias=a) for a in wanted]
+    # Touch the row so the taxonomy fingerprint changes even when only aliases were removed
+    skill.updated_at = datetime.utcnow()
+    with timed_write("upsert_skill"):
+        db.commit()
+    db.refresh(skill)
+    invalidate_taxonomy()
+    return skill
+
+
+def delete_skill(db: Session, skill_id: int) -> bool:
+    skill = db.query(models.Skill).filter(models.Skill.id == skill_id).first()
+    if skill is None:
+        return False
+    db.delete(skill)
+    with timed_write("delete_skill"):
+        db.commit()
+    invalidate_taxonomy()
+    return True
+
+
 # Evaluations
 
-def create_evaluation(db: Session, *, job_id: int, resume_id: int, score: float, verdict: str, missing: List[str], suggestions: str = "") -> models.Evaluation:
+def create_evaluation(
+    db: Session,
+    *,
+    job_id: int,
+    resume_id: int,
+    score: float,
+    verdict: str,
+    missing: List[str],
+    suggestions: str = "",
+    hard_score: Optional[float] = None,
+    soft_score: Optional[float] = None,
+    llm_score: Optional[float] = None,
+) -> models.Evaluation:
     # Validate required fields
     if not job_id:
         raise ValueError("job_id is required for evaluation")
@@ -64,9 +271,13 @@ def create_evaluation(db: Session, *, job_id: int, resume_id: int, score: float,
         verdict=verdict,
         missing_json=dumps_json(missing),
         suggestions=suggestions,
+        hard_score=hard_score,
+        soft_score=soft_score,
+        llm_score=llm_score,
     )
     db.add(ev)
-    db.commit()
+    with timed_write("create_evaluation"):
+        db.commit()
     db.refresh(ev)
     return ev
 
@@ -116,7 +327,8 @@ def create_student_application(
         status="pending"
     )
     db.add(application)
-    db.commit()
+    with timed_write("create_student_application"):
+        db.commit()
     db.refresh(application)
     return application
 
@@ -144,6 +356,7 @@ def update_application_status(db: Session, application_id: int, status: str) ->
     application = get_student_application(db, application_id)
     if application:
         application.status = status
-        db.commit()
+        with timed_write("update_application_status"):
+            db.commit()
         db.refresh(application)
     return application
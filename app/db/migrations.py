@@ -0,0 +1,19 @@
+"""
+Minimal additive schema migrations for SQLite.
+
+``Base.metadata.create_all`` only creates missing tables, so nullable columns added to an
+existing model are added here with ``ALTER TABLE ... ADD COLUMN``.
+"""
+from typing import Dict
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+
+def ensure_columns(engine: Engine, table: str, columns: Dict[str, str]):
+    """Add each missing ``name: SQL type`` column to ``table`` (new columns are NULL)"""
+    with engine.begin() as conn:
+        existing = {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+        for name, ddl in columns.items():
+            if name not in existing:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Index, LargeBinary
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from app.db.database import Base, engine
+from app.db.migrations import ensure_columns
 
 
 class Job(Base):
@@ -19,6 +20,25 @@ class Job(Base):
 
     evaluations = relationship("Evaluation", back_populates="job", cascade="all, delete-orphan")
     applications = relationship("StudentApplication", back_populates="job", cascade="all, delete-orphan")
+    artifacts = relationship("JobArtifact", back_populates="job", uselist=False, cascade="all, delete-orphan")
+
+
+class JobArtifact(Base):
+    """Job-side scoring state precomputed when a job is created or edited"""
+    __tablename__ = "job_artifacts"
+
+    job_id = Column(Integer, ForeignKey("jobs.id"), primary_key=True)
+    jd_hash = Column(String(40), nullable=False)  # sha1 of the JD text and skill lists it was built from
+    embedding_model = Column(String(512))  # None when built without an embedding model
+    must_skills_json = Column(Text)  # parsed and normalized requirements
+    nice_skills_json = Column(Text)
+    term_counts_json = Column(Text)  # tokenized JD: TF-IDF analyzer term counts
+    embedding_dim = Column(Integer)
+    jd_embedding = Column(LargeBinary)  # float32 whole-document vector
+    chunk_embeddings = Column(LargeBinary)  # float32 (chunks x dim) matrix
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    job = relationship("Job", back_populates="artifacts")
 
 
 class Resume(Base):
@@ -28,10 +48,67 @@ class Resume(Base):
     student_name = Column(String(255))
     file_name = Column(String(512))
     text = Column(Text, nullable=False)
+    sections_json = Column(Text)  # JSON object: section name -> text (app.parsing.sections)
     location = Column(String(255))
     created_at = Column(DateTime, default=datetime.utcnow)
 
     evaluations = relationship("Evaluation", back_populates="resume", cascade="all, delete-orphan")
+    skills = relationship("ResumeSkill", back_populates="resume", cascade="all, delete-orphan")
+    features = relationship("ResumeFeature", back_populates="resume", uselist=False, cascade="all, delete-orphan")
+
+
+class ResumeFeature(Base):
+    """Resume-side features computed once at ingest and reused for every job evaluation"""
+    __tablename__ = "resume_features"
+
+    resume_id = Column(Integer, ForeignKey("resumes.id"), primary_key=True)
+    text_hash = Column(String(40), nullable=False)  # sha1 of the resume text it was built from
+    embedding_model = Column(String(512))  # None when built without an embedding model
+    embedding_dim = Column(Integer)
+    embedding = Column(LargeBinary)  # float32 whole-document vector
+    chunk_embeddings = Column(LargeBinary)  # float32 (chunks x dim) matrix
+    payload = Column(LargeBinary)  # zlib-compressed JSON: normalized text, tokens, skills, entities, summary, term counts
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    resume = relationship("Resume", back_populates="features")
+
+
+class ResumeSkill(Base):
+    """Skills detected in a resume at ingest time; used to prefilter candidates for a job"""
+    __tablename__ = "resume_skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False, index=True)
+    skill = Column(String(128), nullable=False)
+
+    resume = relationship("Resume", back_populates="skills")
+
+    __table_args__ = (Index("ix_resume_skills_skill_resume", "skill", "resume_id"),)
+
+
+class Skill(Base):
+    """Canonical skill in the taxonomy used by skill extraction and keyword matching"""
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(128), nullable=False, unique=True)  # normalized (lowercase, single spaces)
+    category = Column(String(128))  # parent category, e.g. "databases"
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    aliases = relationship("SkillAlias", back_populates="skill", cascade="all, delete-orphan")
+
+
+class SkillAlias(Base):
+    """Alternative spelling of a skill ("k8s" for kubernetes)"""
+    __tablename__ = "skill_aliases"
+
+    id = Column(Integer, primary_key=True, index=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), nullable=False, index=True)
+    alias = Column(String(128), nullable=False, unique=True)  # normalized like Skill.name
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    skill = relationship("Skill", back_populates="aliases")
 
 
 class StudentApplication(Base):
@@ -63,11 +140,29 @@ class Evaluation(Base):
     verdict = Column(String(32), nullable=False)
     missing_json = Column(Text)  # JSON array (string)
     suggestions = Column(Text)
+    # Score components, so score/verdict can be recomputed when weights or thresholds change
+    hard_score = Column(Float)
+    soft_score = Column(Float)
+    llm_score = Column(Float)  # LLM semantic score before blending; NULL if none
     created_at = Column(DateTime, default=datetime.utcnow)
 
     job = relationship("Job", back_populates="evaluations")
     resume = relationship("Resume", back_populates="evaluations")
 
+    # Not stored: the LLMEvaluationResult behind llm_score on a freshly created evaluation,
+    # so reports reuse it instead of asking the LLM again
+    llm_result = None
+
 
 # Create tables if not exist
 Base.metadata.create_all(bind=engine)
+
+# create_all does not alter existing tables; add columns introduced since they were created
+ensure_columns(engine, "evaluations", {
+    "hard_score": "FLOAT",
+    "soft_score": "FLOAT",
+    "llm_score": "FLOAT",
+})
+ensure_columns(engine, "resumes", {
+    "sections_json": "TEXT",
+})
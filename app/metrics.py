@@ -0,0 +1,185 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Dependency-free counters and histograms with labels, plus ``timed(stage)`` which records
+the duration of a pipeline stage (usable as a context manager or a decorator). The API
+serves ``render()`` on ``/metrics``; counts are per process.
+"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.profiling import span
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: Optional[Dict[str, str]] = None) -> str:
+    pairs = list(zip(names, values)) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label values -> [per-bucket counts..., sum, count]
+        self._series: Dict[LabelValues, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0.0
+                for bound, count in zip(self.buckets, series):
+                    cumulative += count
+                    le = {"le": _format_value(bound)}
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(cumulative)}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+                lines.append(f"{self.name}_count{labels} {_format_value(series[-1])}")
+        return lines
+
+
+_registry: List[object] = []
+
+
+def _register(metric):
+    _registry.append(metric)
+    return metric
+
+
+STAGE_SECONDS = _register(Histogram(
+    "resume_engine_stage_seconds",
+    "Time spent in each evaluation pipeline stage",
+    ("stage",),
+))
+DB_WRITE_SECONDS = _register(Histogram(
+    "resume_engine_db_write_seconds",
+    "Time spent committing CRUD writes",
+    ("operation",),
+))
+HTTP_REQUEST_SECONDS = _register(Histogram(
+    "resume_engine_http_request_seconds",
+    "API request latency",
+    ("method", "route", "status"),
+))
+EVALUATIONS = _register(Counter(
+    "resume_engine_evaluations_total",
+    "Completed resume evaluations by verdict",
+    ("verdict",),
+))
+CACHE_EVENTS = _register(Counter(
+    "resume_engine_cache_events_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ("cache", "result"),
+))
+FALLBACKS = _register(Counter(
+    "resume_engine_fallbacks_total",
+    "Times a component fell back to a degraded path",
+    ("component",),
+))
+LLM_FAILURES = _register(Counter(
+    "resume_engine_llm_failures_total",
+    "LLM evaluation calls that raised and used the fallback evaluation",
+))
+STAGE_ERRORS = _register(Counter(
+    "resume_engine_stage_errors_total",
+    "Exceptions raised out of a timed stage",
+    ("stage",),
+))
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Record the duration of ``stage`` (also works as a function decorator); a span when profiling"""
+    start = time.perf_counter()
+    try:
+        with span(stage):
+            yield
+    except Exception:
+        STAGE_ERRORS.inc(stage=stage)
+        raise
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage=stage)
+
+
+@contextmanager
+def timed_write(operation: str) -> Iterator[None]:
+    """Record the duration of a CRUD commit"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        DB_WRITE_SECONDS.observe(time.perf_counter() - start, operation=operation)
+
+
+def cache_event(cache: str, hit: bool, count: int = 1):
+    if count:
+        CACHE_EVENTS.inc(count, cache=cache, result="hit" if hit else "miss")
+
+
+def render() -> str:
+    """All metrics in the Prometheus text format"""
+    lines: List[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
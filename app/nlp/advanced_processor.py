@@ -1,50 +1,15 @@
 """
 Enhanced text processing with spaCy and NLTK for better entity extraction
 """
-import re
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, Optional
 from dataclasses import dataclass
 
-try:
-    import spacy
-    from spacy.matcher import Matcher
-    SPACY_AVAILABLE = True
-    
-    # Try to load spaCy model
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        # If model not found, use blank model
-        nlp = spacy.blank("en")
-        SPACY_AVAILABLE = False
-except ImportError:
-    SPACY_AVAILABLE = False
-    nlp = None
-
-try:
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize, sent_tokenize
-    from nltk.stem import WordNetLemmatizer
-    NLTK_AVAILABLE = True
-    
-    # Download required NLTK data
-    try:
-        nltk.data.find('tokenizers/punkt')
-        nltk.data.find('corpora/stopwords')
-        nltk.data.find('corpora/wordnet')
-    except LookupError:
-        nltk.download('punkt', quiet=True)
-        nltk.download('stopwords', quiet=True)
-        nltk.download('wordnet', quiet=True)
-    
-    stop_words = set(stopwords.words('english'))
-    lemmatizer = WordNetLemmatizer()
-    
-except ImportError:
-    NLTK_AVAILABLE = False
-    stop_words = set()
-    lemmatizer = None
+# spaCy and NLTK are resolved offline and cached by app.nlp.resources
+from app.nlp.resources import get_spacy as _get_nlp, get_nltk as _get_nltk
+from app.metrics import timed, FALLBACKS
+from app.nlp.taxonomy import get_taxonomy
+from app.nlp import regex_bank
+from app.parsing.sections import section_text
 
 @dataclass
 class ExtractedEntities:
@@ -64,40 +29,26 @@ class AdvancedTextProcessor:
     """
     
     def __init__(self):
-        self.skill_patterns = self._load_skill_patterns()
         self.tech_patterns = self._load_tech_patterns()
         self.education_patterns = self._load_education_patterns()
-        
-        if SPACY_AVAILABLE and nlp.has_pipe('ner'):
-            self.matcher = Matcher(nlp.vocab)
+        self._matcher = None
+    
+    @property
+    def matcher(self):
+        """spaCy Matcher with custom patterns, built on first use (None without spaCy)"""
+        if self._matcher is None:
+            nlp = _get_nlp()
+            if nlp is None:
+                return None
+            from spacy.matcher import Matcher
+            self._matcher = Matcher(nlp.vocab)
             self._setup_custom_patterns()
+        return self._matcher
     
-    def _load_skill_patterns(self) -> List[str]:
-        """Extended skill patterns for better detection"""
-        return [
-            # Programming Languages
-            "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust", "scala", "kotlin",
-            "php", "ruby", "swift", "objective-c", "dart", "r", "matlab", "perl", "shell", "bash",
-            
-            # Web Technologies
-            "html", "css", "react", "angular", "vue", "node.js", "express", "django", "flask", "fastapi",
-            "bootstrap", "tailwind", "sass", "less", "webpack", "vite", "next.js", "nuxt.js",
-            
-            # Databases
-            "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch", "cassandra", "neo4j",
-            "sqlite", "oracle", "sql server", "dynamodb", "firebase",
-            
-            # Cloud & DevOps
-            "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible", "jenkins",
-            "gitlab ci", "github actions", "ci/cd", "nginx", "apache", "linux", "ubuntu",
-            
-            # Data Science & ML
-            "pandas", "numpy", "sklearn", "pytorch", "tensorflow", "keras", "jupyter", "matplotlib",
-            "seaborn", "plotly", "apache spark", "hadoop", "airflow", "dbt", "tableau", "power bi",
-            
-            # Other Technologies
-            "git", "jira", "confluence", "slack", "figma", "adobe", "photoshop", "illustrator"
-        ]
+    @property
+    def skill_patterns(self) -> List[str]:
+        """Every skill name and alias in the current taxonomy"""
+        return get_taxonomy().terms
     
     def _load_tech_patterns(self) -> List[str]:
         """Technology and framework patterns"""
@@ -109,14 +60,11 @@ class AdvancedTextProcessor:
     
     def _load_education_patterns(self) -> List[str]:
         """Education degree patterns"""
-        return [
-            "bachelor", "master", "phd", "doctorate", "mba", "b.tech", "m.tech", "b.sc", "m.sc",
-            "bca", "mca", "be", "me", "diploma", "certificate", "associate degree"
-        ]
+        return list(regex_bank.EDUCATION_DEGREES)
     
     def _setup_custom_patterns(self):
         """Setup custom spaCy patterns for better entity recognition"""
-        if not hasattr(self, 'matcher'):
+        if self._matcher is None:
             return
             
         # Experience patterns
@@ -131,54 +79,46 @@ class AdvancedTextProcessor:
     
     def normalize_text(self, text: str) -> str:
         """Advanced text normalization"""
-        # Remove special characters and normalize whitespace
-        text = re.sub(r'[^\w\s\-\.]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove common resume artifacts
-        text = re.sub(r'\b(page \d+ of \d+|confidential|resume|cv)\b', '', text, flags=re.IGNORECASE)
-        
-        # Normalize common abbreviations
-        replacements = {
-            r'\byrs?\b': 'years',
-            r'\bexp\b': 'experience',
-            r'\btech\b': 'technology',
-            r'\buniv\b': 'university',
-            r'\bcert\b': 'certification'
-        }
-        
-        for pattern, replacement in replacements.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
-        return text.strip()
-    
-    def extract_entities(self, text: str) -> ExtractedEntities:
-        """Extract structured entities from text"""
+        # Punctuation ("+", "#" and "/" are kept for c++, c#, ci/cd), resume artifacts and
+        # abbreviations, with patterns precompiled in app.nlp.regex_bank
+        return regex_bank.normalize(text)
+    
+    @timed("extract_entities")
+    def extract_entities(self, text: str, sections: Optional[Dict[str, str]] = None) -> ExtractedEntities:
+        """
+        Extract structured entities from text. With resume ``sections`` (see
+        app.parsing.sections) education, certifications, experience and contact details are
+        only searched in their sections, falling back to the whole text when a section is missing.
+        """
         normalized_text = self.normalize_text(text)
+        if _get_nlp() is None:
+            FALLBACKS.inc(component="spacy")
+
+        def part(*names: str) -> str:
+            if not sections:
+                return normalized_text
+            return self.normalize_text(section_text(sections, names, text))
         
         return ExtractedEntities(
-            skills=self._extract_skills(normalized_text),
-            experience_years=self._extract_experience_years(normalized_text),
-            education=self._extract_education(normalized_text),
-            certifications=self._extract_certifications(normalized_text),
+            skills=self._extract_skills(text, normalized_text),
+            experience_years=self._extract_experience_years(part("summary", "experience", "header")),
+            education=self._extract_education(part("education")),
+            certifications=self._extract_certifications(part("certifications", "education")),
             technologies=self._extract_technologies(normalized_text),
             companies=self._extract_companies(normalized_text),
             locations=self._extract_locations(normalized_text),
-            contact_info=self._extract_contact_info(normalized_text)
+            contact_info=self._extract_contact_info(part("header"))
         )
     
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, text: str, normalized_text: str) -> List[str]:
         """Extract technical skills from text"""
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in self.skill_patterns:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
+        # Raw text: ambiguous skill names need the list punctuation normalization strips
+        found_skills = get_taxonomy().find_in(text)
         
         # Use spaCy for additional skill extraction if available
-        if SPACY_AVAILABLE and nlp.has_pipe('ner'):
-            doc = nlp(text)
+        nlp = _get_nlp()
+        if nlp is not None:
+            doc = nlp(normalized_text)
             for ent in doc.ents:
                 if ent.label_ in ['PRODUCT', 'ORG'] and len(ent.text) > 2:
                     found_skills.append(ent.text)
@@ -187,65 +127,27 @@ class AdvancedTextProcessor:
     
     def _extract_experience_years(self, text: str) -> List[int]:
         """Extract years of experience"""
-        experience_patterns = [
-            r'(\d+)\s*(?:\+)?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)',
-            r'experience\s*[:\-]\s*(\d+)\s*(?:years?|yrs?)',
-            r'(\d+)\s*(?:\+)?\s*(?:years?|yrs?)\s*in',
-            r'over\s*(\d+)\s*(?:years?|yrs?)',
-            r'more\s*than\s*(\d+)\s*(?:years?|yrs?)'
-        ]
-        
-        years = []
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            years.extend([int(match) for match in matches if match.isdigit()])
-        
-        return sorted(list(set(years)), reverse=True)
+        return regex_bank.experience_years(text)
     
     def _extract_education(self, text: str) -> List[str]:
         """Extract education information"""
-        education = []
-        
-        for degree in self.education_patterns:
-            pattern = rf'\b{degree}[\w\s]*(?:in|of)\s+[\w\s]+(?:science|engineering|technology|business|arts|studies)?'
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            education.extend(matches)
-        
-        return education
+        return regex_bank.education_mentions(text)
     
     def _extract_certifications(self, text: str) -> List[str]:
         """Extract certifications"""
-        cert_patterns = [
-            r'certified?\s+[\w\s]+(?:professional|specialist|expert|developer|administrator)',
-            r'[\w\s]+\s+certification',
-            r'aws\s+[\w\s]+(?:associate|professional)',
-            r'microsoft\s+[\w\s]+(?:associate|expert)',
-            r'google\s+[\w\s]+(?:associate|professional)',
-            r'cisco\s+[\w\s]+(?:associate|professional)'
-        ]
-        
-        certifications = []
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            certifications.extend(matches)
-        
-        return certifications
+        return regex_bank.certification_mentions(text)
     
     def _extract_technologies(self, text: str) -> List[str]:
         """Extract technology mentions"""
-        technologies = []
-        
-        for tech in self.tech_patterns:
-            if tech.lower() in text.lower():
-                technologies.append(tech)
-        
-        return technologies
+        text_lower = text.lower()
+        return [tech for tech in self.tech_patterns if tech.lower() in text_lower]
     
     def _extract_companies(self, text: str) -> List[str]:
         """Extract company names using spaCy NER"""
         companies = []
         
-        if SPACY_AVAILABLE and nlp.has_pipe('ner'):
+        nlp = _get_nlp()
+        if nlp is not None:
             doc = nlp(text)
             for ent in doc.ents:
                 if ent.label_ == 'ORG':
@@ -257,7 +159,8 @@ class AdvancedTextProcessor:
         """Extract location information"""
         locations = []
         
-        if SPACY_AVAILABLE and nlp.has_pipe('ner'):
+        nlp = _get_nlp()
+        if nlp is not None:
             doc = nlp(text)
             for ent in doc.ents:
                 if ent.label_ in ['GPE', 'LOC']:
@@ -269,31 +172,21 @@ class AdvancedTextProcessor:
         """Extract contact information"""
         contact = {}
         
-        # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        if emails:
-            contact['email'] = emails[0]
-        
-        # Phone pattern
-        phone_pattern = r'[\+]?[1-9]?[\d\s\-\(\)]{8,15}\d'
-        phones = re.findall(phone_pattern, text)
-        if phones:
-            contact['phone'] = phones[0]
-        
-        # LinkedIn pattern
-        linkedin_pattern = r'linkedin\.com/in/[\w\-]+'
-        linkedin = re.findall(linkedin_pattern, text, re.IGNORECASE)
-        if linkedin:
-            contact['linkedin'] = linkedin[0]
+        for field, pattern in (("email", regex_bank.EMAIL), ("phone", regex_bank.PHONE), ("linkedin", regex_bank.LINKEDIN)):
+            m = pattern.search(text)
+            if m:
+                contact[field] = m.group(0)
         
         return contact
     
-    def get_text_summary(self, text: str) -> Dict[str, int]:
+    @timed("text_summary")
+    def get_text_summary(self, text: str) -> Dict[str, float]:
         """Get text statistics and summary"""
-        if NLTK_AVAILABLE:
-            sentences = sent_tokenize(text)
-            words = word_tokenize(text.lower())
+        nltk_tools = _get_nltk()
+        if nltk_tools:
+            sentences = nltk_tools["sent_tokenize"](text)
+            words = nltk_tools["word_tokenize"](text.lower())
+            stop_words = nltk_tools["stop_words"]
             words_no_stop = [word for word in words if word.isalnum() and word not in stop_words]
         else:
             sentences = text.split('.')
@@ -308,5 +201,26 @@ class AdvancedTextProcessor:
             'avg_sentence_length': len(words) / max(len(sentences), 1)
         }
 
-# Global instance
-text_processor = AdvancedTextProcessor()
\ No newline at end of file
+_text_processor: Optional[AdvancedTextProcessor] = None
+
+
+def get_text_processor() -> AdvancedTextProcessor:
+    """Shared processor instance, constructed on first use"""
+    global _text_processor
+    if _text_processor is None:
+        _text_processor = AdvancedTextProcessor()
+    return _text_processor
+
+
+def warm_up():
+    """Load spaCy and NLTK resources now instead of on the first extraction"""
+    _get_nlp()
+    _get_nltk()
+    get_text_processor()
+
+
+def __getattr__(name):
+    # Backwards compatibility for ``from app.nlp.advanced_processor import text_processor``
+    if name == "text_processor":
+        return get_text_processor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
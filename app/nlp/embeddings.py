@@ -1,27 +1,42 @@
-from typing import Optional
+import hashlib
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
-from app.config import EMBEDDINGS_MODEL, USE_EMBEDDINGS
+from app.metrics import timed, cache_event, FALLBACKS
+from app.config import (
+    EMBEDDINGS_MODEL,
+    USE_EMBEDDINGS,
+    EMBEDDINGS_BACKEND,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CHUNKING,
+    EMBEDDING_CHUNK_WORDS,
+    EMBEDDING_MAX_CHUNKS,
+    EMBEDDING_CACHE_SIZE,
+)
 
-try:
-    from sentence_transformers import SentenceTransformer
-    _st_model: Optional[SentenceTransformer] = None
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except Exception:
-    SentenceTransformer = None
-    _st_model = None
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+# sentence-transformers (and torch) are imported on first use, not at module import
+_st_model: Optional[object] = None
+SENTENCE_TRANSFORMERS_AVAILABLE: Optional[bool] = None
+_onnx_model: Optional[object] = None
+ONNX_AVAILABLE: Optional[bool] = None
 
 
 def _get_st_model() -> Optional[object]:
-    global _st_model
+    global _st_model, SENTENCE_TRANSFORMERS_AVAILABLE
     if not USE_EMBEDDINGS:
         return None
-    if not SENTENCE_TRANSFORMERS_AVAILABLE:
+    if SENTENCE_TRANSFORMERS_AVAILABLE is False:
         return None
     if _st_model is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+            SENTENCE_TRANSFORMERS_AVAILABLE = True
+        except Exception:
+            SENTENCE_TRANSFORMERS_AVAILABLE = False
+            return None
         try:
             _st_model = SentenceTransformer(EMBEDDINGS_MODEL)
         except Exception as e:
@@ -32,11 +47,200 @@ def _get_st_model() -> Optional[object]:
     return _st_model
 
 
+def _get_onnx_model() -> Optional[object]:
+    global _onnx_model, ONNX_AVAILABLE
+    if ONNX_AVAILABLE is None:
+        try:
+            from app.nlp.onnx_embedder import OnnxEmbedder
+            _onnx_model = OnnxEmbedder()
+            ONNX_AVAILABLE = True
+        except Exception as e:
+            print(f"Failed to load ONNX embedding model, using sentence-transformers: {e}")
+            ONNX_AVAILABLE = False
+    return _onnx_model
+
+
+def _get_model() -> Optional[object]:
+    """Embedding model for the configured backend (ONNX falls back to sentence-transformers)"""
+    if not USE_EMBEDDINGS:
+        return None
+    if EMBEDDINGS_BACKEND == "onnx":
+        model = _get_onnx_model()
+        if model is not None:
+            return model
+    return _get_st_model()
+
+
+def embedding_model_id() -> Optional[str]:
+    """Identity of the loaded embedding model (stored with precomputed vectors), or None"""
+    model = _get_model()
+    if model is None:
+        return None
+    if model is _onnx_model:
+        return f"onnx:{model.model_path}"
+    return f"torch:{EMBEDDINGS_MODEL}"
+
+
+def warm_up():
+    """Load the embedding model now instead of on the first similarity call"""
+    _get_model()
+
+
+@timed("embedding_encode")
+def encode_texts(texts: List[str]) -> Optional[np.ndarray]:
+    """Encode texts into L2-normalized float32 vectors; None when no embedding model is available."""
+    model = _get_model()
+    if model is None:
+        return None
+    try:
+        vecs = model.encode(list(texts), batch_size=EMBEDDING_BATCH_SIZE, normalize_embeddings=True)
+        return np.asarray(vecs, dtype=np.float32)
+    except Exception as e:
+        print(f"Embedding encode failed: {e}")
+        return None
+
+
+_SECTION_BREAK = re.compile(r"\n\s*\n|\n(?=[A-Z][A-Za-z &/]{2,40}:?\s*\n)")
+
+
+def split_into_chunks(text: str, max_words: int = EMBEDDING_CHUNK_WORDS, max_chunks: int = EMBEDDING_MAX_CHUNKS) -> List[str]:
+    """
+    Split a document into section-aligned chunks of at most ``max_words`` words.
+
+    Paragraphs/sections are packed together until a chunk is full; oversized sections are
+    cut into word windows. Beyond ``max_chunks`` an evenly spaced subset is kept so the
+    whole document is still represented at bounded cost.
+    """
+    chunks, current = [], []
+    for section in _SECTION_BREAK.split(text or ""):
+        words = section.split()
+        if not words:
+            continue
+        if current and len(current) + len(words) > max_words:
+            chunks.append(" ".join(current))
+            current = []
+        while len(words) > max_words:
+            chunks.append(" ".join(words[:max_words]))
+            words = words[max_words:]
+        current.extend(words)
+    if current:
+        chunks.append(" ".join(current))
+    if len(chunks) > max_chunks:
+        keep = np.linspace(0, len(chunks) - 1, max_chunks).round().astype(int)
+        chunks = [chunks[i] for i in sorted(set(keep))]
+    return chunks
+
+
+_chunk_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_chunk_cache_lock = threading.Lock()
+
+
+def _chunk_key(chunk: str) -> str:
+    return hashlib.sha1(chunk.encode("utf-8")).hexdigest()
+
+
+def encode_chunks(chunks: List[str]) -> Optional[np.ndarray]:
+    """Encode chunks (normalized) through an LRU cache; uncached chunks are encoded in one batch"""
+    keys = [_chunk_key(c) for c in chunks]
+    with _chunk_cache_lock:
+        cached = {k: _chunk_cache[k] for k in keys if k in _chunk_cache}
+        for k in cached:
+            _chunk_cache.move_to_end(k)
+    todo = {k: c for k, c in zip(keys, chunks) if k not in cached}
+    cache_event("embedding_chunks", hit=True, count=len(keys) - len(todo))
+    cache_event("embedding_chunks", hit=False, count=len(todo))
+    if todo:
+        vecs = encode_texts(list(todo.values()))
+        if vecs is None:
+            return None
+        fresh = dict(zip(todo.keys(), vecs))
+        cached.update(fresh)
+        with _chunk_cache_lock:
+            _chunk_cache.update(fresh)
+            while len(_chunk_cache) > EMBEDDING_CACHE_SIZE:
+                _chunk_cache.popitem(last=False)
+    return np.vstack([cached[k] for k in keys]) if keys else None
+
+
+def chunked_similarity_to(query_vecs: np.ndarray, doc_text: str) -> Optional[float]:
+    """``chunked_similarity`` with the query side already encoded (e.g. precomputed JD chunks)"""
+    doc_chunks = split_into_chunks(doc_text)
+    if len(query_vecs) == 0 or not doc_chunks:
+        return 0.0
+    doc_vecs = encode_chunks(doc_chunks)
+    if doc_vecs is None:
+        return None
+    return float((query_vecs @ doc_vecs.T).max(axis=1).mean())
+
+
+def chunked_similarity(query_text: str, doc_text: str) -> Optional[float]:
+    """
+    How well ``doc_text`` covers ``query_text``: each query chunk is matched to its most
+    similar doc chunk and the matches are averaged. None when no embedding model is available.
+    """
+    query_chunks = split_into_chunks(query_text)
+    doc_chunks = split_into_chunks(doc_text)
+    if not query_chunks or not doc_chunks:
+        return 0.0
+    # Both documents' chunks go through a single encode call
+    vecs = encode_chunks(query_chunks + doc_chunks)
+    if vecs is None:
+        return None
+    sims = vecs[:len(query_chunks)] @ vecs[len(query_chunks):].T
+    return float(sims.max(axis=1).mean())
+
+
+_tfidf_analyzer = None
+
+
+def tfidf_term_counts(text: str) -> Dict[str, int]:
+    """Unigram+bigram counts using the same analyzer as the TF-IDF fallback"""
+    global _tfidf_analyzer
+    if _tfidf_analyzer is None:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        _tfidf_analyzer = TfidfVectorizer(min_df=1, ngram_range=(1, 2)).build_analyzer()
+    return dict(Counter(_tfidf_analyzer(text)))
+
+
+def tfidf_similarity_from_counts(counts_a: Dict[str, int], text_b: str) -> float:
+    """
+    TF-IDF cosine of two documents, equal to fitting ``TfidfVectorizer`` on the pair, but with
+    the first document's term counts precomputed. With smooth idf over two documents a term
+    in both gets idf 1 and a term in only one gets ln(1.5) + 1.
+    """
+    return tfidf_similarity(counts_a, tfidf_term_counts(text_b))
+
+
+def tfidf_similarity(counts_a: Dict[str, int], counts_b: Dict[str, int]) -> float:
+    """Pairwise TF-IDF cosine from both documents' term counts (see ``tfidf_similarity_from_counts``)"""
+    single = np.log(1.5) + 1.0
+
+    def weights(counts, other):
+        return {t: c * (1.0 if t in other else single) for t, c in counts.items()}
+
+    wa, wb = weights(counts_a, counts_b), weights(counts_b, counts_a)
+    norm = np.sqrt(sum(v * v for v in wa.values())) * np.sqrt(sum(v * v for v in wb.values()))
+    if norm == 0:
+        return 0.0
+    dot = sum(v * wb[t] for t, v in wa.items() if t in wb)
+    return max(0.0, min(1.0, float(dot / norm)))
+
+
+@timed("embedding_similarity")
 def embedding_similarity(text_a: str, text_b: str) -> float:
-    """Return cosine similarity between two texts using embeddings if available; TF-IDF fallback."""
-    model = _get_st_model()
+    """
+    Return cosine similarity between two texts using embeddings if available; TF-IDF fallback.
+
+    With chunking enabled the score is directional: how well ``text_b`` (e.g. a resume)
+    covers ``text_a`` (e.g. a JD), see ``chunked_similarity``.
+    """
+    model = _get_model()
     if model is not None:
         try:
+            if EMBEDDING_CHUNKING:
+                sim = chunked_similarity(text_a, text_b)
+                if sim is not None:
+                    return max(0.0, min(1.0, sim))
             vecs = model.encode([text_a, text_b], normalize_embeddings=True)
             # cosine similarity of normalized vectors is dot product
             sim = float(np.dot(vecs[0], vecs[1]))
@@ -44,10 +248,8 @@ def embedding_similarity(text_a: str, text_b: str) -> float:
         except Exception:
             pass
     # Fallback to TF-IDF cosine
+    FALLBACKS.inc(component="tfidf_similarity")
     try:
-        tfidf = TfidfVectorizer(min_df=1, ngram_range=(1, 2))
-        X = tfidf.fit_transform([text_a, text_b])
-        sim = cosine_similarity(X[0], X[1])[0, 0]
-        return max(0.0, min(1.0, float(sim)))
+        return tfidf_similarity_from_counts(tfidf_term_counts(text_a), text_b)
     except Exception:
         return 0.0
@@ -1,26 +1,130 @@
-from typing import List, Dict, Any
-from rapidfuzz import fuzz
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+import numpy as np
+from rapidfuzz import fuzz, process
 import re
 
+from app.nlp.taxonomy import TermIndex, get_taxonomy
+
+_TOKEN = re.compile(r"[a-zA-Z0-9+#.]+")
+
+# Longest candidate phrase, in tokens, compared against the keywords
+MAX_NGRAM_TOKENS = 4
+# Shorter keywords are only matched exactly: one edit in "junit" or "perl" already
+# clears the threshold against ordinary words ("unit", "per")
+MIN_FUZZY_LENGTH = 6
+# Below this many keyword x n-gram comparisons a single thread is faster than a pool
+PARALLEL_MIN_CELLS = 200_000
+
 
 def tokenize(text: str) -> List[str]:
     text = text.lower()
     # simple tokenization on non-word boundaries
-    return re.findall(r"[a-zA-Z0-9+#.]+", text)
+    return _TOKEN.findall(text)
+
+
+@dataclass
+class KeywordHit:
+    """Best match of a keyword in a text: the matched span and its similarity (0-100)"""
+    keyword: str
+    matched: str
+    score: float
+    start: int
+    end: int
+
+
+def candidate_ngrams(text_lower: str, max_tokens: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """Distinct 1..max_tokens token n-grams of ``text_lower`` with the span of their first occurrence"""
+    tokens = []
+    for m in _TOKEN.finditer(text_lower):
+        token, start = m.group(0).rstrip("."), m.start()
+        if token:
+            tokens.append((token, start, start + len(token)))
+    seen: Dict[str, Tuple[int, int]] = {}
+    for n in range(1, max_tokens + 1):
+        for i in range(len(tokens) - n + 1):
+            phrase = " ".join(t for t, _, _ in tokens[i:i + n])
+            if phrase not in seen:
+                seen[phrase] = (tokens[i][1], tokens[i + n - 1][2])
+    return list(seen), list(seen.values())
+
+
+class KeywordMatcher:
+    """
+    Keyword list normalized once so it can be matched against many texts.
+
+    Keywords found as whole terms, under their own spelling or a taxonomy alias ("k8s" for
+    kubernetes), are matched by one ``TermIndex`` scan of the text. The rest (if not too
+    short) are compared with every token n-gram of the text in a single
+    ``rapidfuzz.process.cdist`` call (threaded for large inputs), so typos and spacing
+    variants ("kubernets", "tensor flow") still match.
+    """
+
+    def __init__(self, keywords: List[str], *, fuzzy_threshold: int = 85):
+        self.keywords = [(kw, kw.strip().lower()) for kw in keywords if kw.strip()]
+        self.fuzzy_threshold = fuzzy_threshold
+        longest = max((len(tokenize(k)) for _, k in self.keywords), default=1)
+        # One extra token so a keyword written with a space ("tensor flow") is still a candidate
+        self.max_ngram_tokens = min(MAX_NGRAM_TOKENS, longest + 1)
+        self._taxonomy_version = None
+        self._index: Optional[TermIndex] = None
+        self._owners: Dict[str, List[int]] = {}
+
+    def _term_index(self) -> TermIndex:
+        """Index over every spelling of every keyword; rebuilt when the taxonomy changes"""
+        taxonomy = get_taxonomy()
+        if self._index is None or taxonomy.version != self._taxonomy_version:
+            owners: Dict[str, List[int]] = {}
+            for i, (_, k) in enumerate(self.keywords):
+                for variant in taxonomy.variants(k):
+                    owners.setdefault(variant, []).append(i)
+            self._owners = owners
+            self._index = TermIndex(owners)
+            self._taxonomy_version = taxonomy.version
+        return self._index
+
+    def matches(self, text: str) -> Dict[str, Optional[KeywordHit]]:
+        """Best hit for each keyword, or None when nothing reaches ``fuzzy_threshold``"""
+        text_lower = text.lower()
+        found: Dict[int, KeywordHit] = {}
+        for term, start, end in self._term_index().scan(text, overlapping=True):
+            for i in self._owners[term]:
+                if i not in found:
+                    found[i] = KeywordHit(self.keywords[i][0], text[start:end], 100.0, start, end)
+        hits: Dict[str, Optional[KeywordHit]] = {}
+        fuzzy = []
+        for i, (kw, k) in enumerate(self.keywords):
+            hits[kw] = found.get(i)
+            if hits[kw] is None and len(k) >= MIN_FUZZY_LENGTH:
+                fuzzy.append((kw, k))
+        if not fuzzy:
+            return hits
+
+        ngrams, spans = candidate_ngrams(text_lower, self.max_ngram_tokens)
+        if not ngrams:
+            return hits
+        queries = [k for _, k in fuzzy]
+        workers = -1 if len(queries) * len(ngrams) >= PARALLEL_MIN_CELLS else 1
+        scores = process.cdist(
+            queries, ngrams,
+            scorer=fuzz.ratio,
+            score_cutoff=self.fuzzy_threshold,
+            dtype=np.uint8,
+            workers=workers,
+        )
+        best = scores.argmax(axis=1)
+        for row, (kw, _) in enumerate(fuzzy):
+            col = int(best[row])
+            score = float(scores[row, col])
+            if score >= self.fuzzy_threshold:
+                start, end = spans[col]
+                hits[kw] = KeywordHit(kw, text[start:end], score, start, end)
+        return hits
+
+    def presence(self, text: str) -> Dict[str, bool]:
+        return {kw: hit is not None for kw, hit in self.matches(text).items()}
 
 
 def keyword_presence(text: str, keywords: List[str], *, fuzzy_threshold: int = 85) -> Dict[str, bool]:
-    """Return presence map of each keyword using exact or fuzzy partial match."""
-    text_lower = text.lower()
-    present = {}
-    for kw in keywords:
-        k = kw.strip().lower()
-        if not k:
-            continue
-        if k in text_lower:
-            present[kw] = True
-            continue
-        # fuzzy partial ratio on sliding windows is expensive; instead compare directly
-        score = fuzz.partial_ratio(k, text_lower)
-        present[kw] = score >= fuzzy_threshold
-    return present
+    """Return presence map of each keyword using exact or fuzzy (typo-tolerant) phrase match."""
+    return KeywordMatcher(keywords, fuzzy_threshold=fuzzy_threshold).presence(text)
@@ -0,0 +1,141 @@
+"""
+int8-quantized ONNX Runtime version of the sentence-transformers embedding model.
+
+Produces the same vectors as ``SentenceTransformer(EMBEDDINGS_MODEL).encode`` (mean pooling
+over the attention mask, then L2 normalization) without importing torch at runtime.
+Enable with ``EMBEDDINGS_BACKEND=onnx`` after exporting the model once:
+
+    python -m app.nlp.onnx_embedder --export data/onnx/all-MiniLM-L6-v2
+
+Export needs torch and transformers; inference only needs onnxruntime and tokenizers.
+"""
+import argparse
+import json
+import os
+from typing import List, Optional
+
+import numpy as np
+
+from app.config import EMBEDDINGS_MODEL, ONNX_MODEL_DIR, ONNX_NUM_THREADS, EMBEDDING_BATCH_SIZE
+
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+META_FILE = "embedder.json"
+DEFAULT_MAX_LENGTH = 256  # max_seq_length of all-MiniLM-L6-v2
+
+
+class OnnxEmbedder:
+    """Batched CPU inference over an exported (preferably quantized) transformer encoder"""
+
+    def __init__(self, model_dir: str = ONNX_MODEL_DIR, num_threads: int = ONNX_NUM_THREADS, batch_size: int = EMBEDDING_BATCH_SIZE):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        meta = {}
+        meta_path = os.path.join(model_dir, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+        self.model_name = meta.get("model", EMBEDDINGS_MODEL)
+        self.max_length = int(meta.get("max_length", DEFAULT_MAX_LENGTH))
+        self.batch_size = batch_size
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=self.max_length)
+        pad_token = meta.get("pad_token", "[PAD]")
+        pad_id = self.tokenizer.token_to_id(pad_token)
+        self.tokenizer.enable_padding(pad_id=pad_id if pad_id is not None else 0, pad_token=pad_token)
+
+        model_path = os.path.join(model_dir, QUANTIZED_MODEL_FILE)
+        if not os.path.exists(model_path):
+            model_path = os.path.join(model_dir, MODEL_FILE)
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads > 0:
+            options.intra_op_num_threads = num_threads
+            options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.model_path = model_path
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+
+        hidden = self.session.run(None, feeds)[0]  # (batch, seq, dim)
+        mask = attention_mask[..., None].astype(np.float32)
+        return (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+    def encode(self, texts: List[str], batch_size: Optional[int] = None, normalize_embeddings: bool = True, **kwargs) -> np.ndarray:
+        """Same contract as ``SentenceTransformer.encode`` for a list of strings"""
+        texts = list(texts)
+        batch_size = batch_size or self.batch_size
+        # Batch texts of similar length together so little time is spent on padding
+        order = np.argsort([len(t) for t in texts], kind="stable")
+        vecs: Optional[np.ndarray] = None
+        for start in range(0, len(texts), batch_size):
+            idx = order[start:start + batch_size]
+            pooled = self._embed_batch([texts[i] for i in idx])
+            if vecs is None:
+                vecs = np.empty((len(texts), pooled.shape[1]), dtype=np.float32)
+            vecs[idx] = pooled
+        if vecs is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        if normalize_embeddings:
+            vecs /= np.clip(np.linalg.norm(vecs, axis=1, keepdims=True), 1e-12, None)
+        return vecs
+
+
+def export_model(out_dir: str, model_name: str = EMBEDDINGS_MODEL, max_length: int = DEFAULT_MAX_LENGTH, quantize: bool = True):
+    """Export ``model_name`` to ONNX in ``out_dir`` and write a dynamically int8-quantized copy"""
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name).eval()
+    tokenizer.save_pretrained(out_dir)  # writes tokenizer.json for the fast tokenizer
+
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    input_names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+    dynamic = {n: {0: "batch", 1: "sequence"} for n in input_names}
+    dynamic["last_hidden_state"] = {0: "batch", 1: "sequence"}
+    model_path = os.path.join(out_dir, MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[n] for n in input_names),
+            model_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic,
+            opset_version=14,
+        )
+    print(f"Exported {model_name} -> {model_path}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        quantized_path = os.path.join(out_dir, QUANTIZED_MODEL_FILE)
+        quantize_dynamic(model_path, quantized_path, weight_type=QuantType.QInt8)
+        print(f"Quantized (int8) -> {quantized_path}")
+
+    with open(os.path.join(out_dir, META_FILE), "w") as f:
+        json.dump({"model": model_name, "max_length": max_length, "pad_token": tokenizer.pad_token}, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the embedding model to quantized ONNX")
+    parser.add_argument("--export", metavar="DIR", default=ONNX_MODEL_DIR)
+    parser.add_argument("--model", default=EMBEDDINGS_MODEL)
+    parser.add_argument("--max-length", type=int, default=DEFAULT_MAX_LENGTH)
+    parser.add_argument("--no-quantize", action="store_true")
+    args = parser.parse_args()
+    export_model(args.export, args.model, args.max_length, quantize=not args.no_quantize)
+
+
+if __name__ == "__main__":
+    main()
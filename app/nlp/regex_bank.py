@@ -0,0 +1,104 @@
+"""
+Precompiled regular expressions for resume/JD entity extraction.
+
+Each pattern family (experience, education, certifications, abbreviations) is compiled
+once at import as a single alternation, so extracting a family is one ``finditer`` pass
+over the text instead of one ``re.findall`` per pattern. Shared by
+``AdvancedTextProcessor`` and ``jd_parser``.
+"""
+import re
+from typing import Dict, List
+
+# Degree keywords searched by the education extractor ("." also matches a missing dot: btech)
+EDUCATION_DEGREES = [
+    "bachelor", "master", "phd", "doctorate", "mba", "b.tech", "m.tech", "b.sc", "m.sc",
+    "bca", "mca", "be", "me", "diploma", "certificate", "associate degree",
+]
+
+ABBREVIATIONS: Dict[str, str] = {
+    "yr": "years",
+    "yrs": "years",
+    "exp": "experience",
+    "tech": "technology",
+    "univ": "university",
+    "cert": "certification",
+}
+
+NON_TEXT = re.compile(r"[^\w\s\-\.+#/]")
+SPACES = re.compile(r"[^\S\n]+")
+LINE_BREAKS = re.compile(r" ?\n[\s]*")
+ARTIFACTS = re.compile(r"\b(?:page \d{1,4} of \d{1,4}|confidential|resume|cv)\b", re.IGNORECASE)
+# Not inside dotted words: "b.tech" is a degree, not "b.technology"
+ABBREVIATION = re.compile(r"(?<!\.)\b(?:yrs?|exp|tech|univ|cert)\b(?!\.\w)", re.IGNORECASE)
+
+# Every pattern below is line-scoped (``[ \t]`` instead of ``\s``) and every repetition is
+# capped, so the work per start position is bounded and a pass stays linear in the text
+# length however long or whitespace-heavy the input is (see benchmarks.regex_safety).
+_SP = r"[ \t]{0,3}"
+_WORD = r"\w{1,40}[ \t]{1,3}"
+
+# One capture group per alternative holds the number of years. Factored so alternatives
+# sharing a prefix ("5 years of experience" / "5 years in", "over 5" / "more than 5") are
+# tried together
+EXPERIENCE = re.compile(
+    "|".join([
+        rf"\b(?:over|more{_SP}than){_SP}(\d{{1,2}}){_SP}(?:years?|yrs?)\b",
+        rf"\bexperience{_SP}[:\-]?{_SP}(\d{{1,2}}){_SP}(?:years?|yrs?)\b",
+        rf"\b(\d{{1,2}}){_SP}\+?{_SP}(?:years?|yrs?){_SP}(?:(?:of{_SP})?(?:experience|exp)|in)\b",
+    ]),
+    re.IGNORECASE,
+)
+
+_DEGREE_ALTERNATION = "|".join(
+    re.escape(d).replace(r"\.", r"\.?") for d in sorted(EDUCATION_DEGREES, key=len, reverse=True)
+)
+# Degree, up to a few words, "in"/"of", then the field: the rest of the line, up to nine
+# words, so multi-word fields are kept whole ("Computer Science and Engineering", "Science
+# in Physics") whether or not they end in a keyword such as "engineering"
+EDUCATION = re.compile(
+    rf"\b(?:{_DEGREE_ALTERNATION})\b[ \t]{{1,3}}(?:{_WORD}){{0,6}}?(?:in|of)[ \t]{{1,3}}"
+    rf"(?:{_WORD}){{0,8}}\w{{1,40}}",
+    re.IGNORECASE,
+)
+
+# Vendor-specific forms first: at a given position the first alternative that matches wins.
+# Each form spans at most a few words; the generic one takes up to eight words before
+# "certification", starting at the earliest of them
+CERTIFICATION = re.compile(
+    "|".join([
+        rf"\b(?:aws|google|cisco)[ \t]{{1,3}}(?:{_WORD}){{0,8}}?(?:associate|professional)\b",
+        rf"\bmicrosoft[ \t]{{1,3}}(?:{_WORD}){{0,8}}?(?:associate|expert)\b",
+        rf"\bcertified?[ \t]{{1,3}}(?:{_WORD}){{0,8}}?(?:professional|specialist|expert|developer|administrator)\b",
+        rf"\b(?:{_WORD}){{1,8}}certifications?\b",
+    ]),
+    re.IGNORECASE,
+)
+
+EMAIL = re.compile(r"\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9-]{1,63}(?:\.[A-Za-z0-9-]{1,63}){0,8}\.[A-Za-z]{2,24}\b")
+PHONE = re.compile(r"\+?[1-9]?[\d \t\-()]{8,15}\d")
+LINKEDIN = re.compile(r"linkedin\.com/in/[\w\-]{1,100}", re.IGNORECASE)
+
+
+def normalize(text: str) -> str:
+    """Strip punctuation (keeping - . + # /), resume artifacts and common abbreviations.
+    Line breaks are kept (blank lines collapsed) so line-scoped patterns see the lines."""
+    text = LINE_BREAKS.sub("\n", SPACES.sub(" ", NON_TEXT.sub(" ", text)))
+    text = ARTIFACTS.sub("", text)
+    text = ABBREVIATION.sub(lambda m: ABBREVIATIONS[m.group(0).lower()], text)
+    return text.strip()
+
+
+def experience_years(text: str) -> List[int]:
+    """Distinct years-of-experience figures, largest first"""
+    years = set()
+    for m in EXPERIENCE.finditer(text):
+        years.add(int(next(g for g in m.groups() if g)))
+    return sorted(years, reverse=True)
+
+
+def education_mentions(text: str) -> List[str]:
+    return [m.group(0) for m in EDUCATION.finditer(text)]
+
+
+def certification_mentions(text: str) -> List[str]:
+    return [m.group(0) for m in CERTIFICATION.finditer(text)]
@@ -0,0 +1,185 @@
+"""
+Offline resolution of NLTK corpora and spaCy models.
+
+Resources are looked up in a local bundle directory (``NLP_RESOURCE_DIR``) before the
+usual installed locations, verified once per process and cached. Nothing is ever
+downloaded at runtime: a missing resource puts that component in degraded mode and
+callers fall back to the plain-regex code paths.
+
+Bundle layout::
+
+    <NLP_RESOURCE_DIR>/nltk_data/{tokenizers,corpora}/...
+    <NLP_RESOURCE_DIR>/spacy/<SPACY_MODEL>/          (output of nlp.to_disk)
+
+Populate a bundle on a machine with network access, then ship the directory:
+
+    python -m app.nlp.resources --bundle data/nlp_resources
+"""
+import argparse
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from app.config import NLP_RESOURCE_DIR, SPACY_MODEL
+
+# (package id used by nltk.download, path checked with nltk.data.find)
+NLTK_RESOURCES = [
+    ("punkt", "tokenizers/punkt"),
+    ("stopwords", "corpora/stopwords"),
+    ("wordnet", "corpora/wordnet"),
+]
+# Newer NLTK releases tokenize sentences with the pickle-free punkt_tab data
+NLTK_PUNKT_TAB = ("punkt_tab", "tokenizers/punkt_tab")
+
+# Held for a whole load (spacy.load can take seconds); one per resource
+_spacy_lock = threading.Lock()
+_nltk_lock = threading.Lock()
+# Guards ``_status`` only, never held while loading, so ``resource_status`` (the /health
+# endpoint) does not wait for a warm-up in progress
+_status_lock = threading.Lock()
+_nlp = None
+_nltk = None
+_status: Dict[str, Any] = {"spacy": None, "nltk": None, "missing": []}
+
+
+def nltk_data_dir(bundle_dir: str = NLP_RESOURCE_DIR) -> str:
+    return os.path.join(bundle_dir, "nltk_data")
+
+
+def spacy_model_dir(bundle_dir: str = NLP_RESOURCE_DIR, model: str = SPACY_MODEL) -> str:
+    return os.path.join(bundle_dir, "spacy", model)
+
+
+def _nltk_resources(nltk) -> List[tuple]:
+    version = tuple(int(p) for p in nltk.__version__.split(".")[:3] if p.isdigit())
+    return NLTK_RESOURCES + ([NLTK_PUNKT_TAB] if version >= (3, 8, 2) else [])
+
+
+def _missing_nltk_resources(nltk) -> List[str]:
+    missing = []
+    for _package, path in _nltk_resources(nltk):
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(f"nltk:{path}")
+    return missing
+
+
+def _publish(name: str, available: bool, missing: List[str]):
+    with _status_lock:
+        _status["missing"].extend(missing)
+        _status[name] = available
+
+
+def get_nltk() -> Optional[Dict[str, Any]]:
+    """NLTK tokenizers, stopwords and lemmatizer as a dict, or None in degraded mode"""
+    global _nltk
+    if _status["nltk"] is None:
+        with _nltk_lock:
+            if _status["nltk"] is None:
+                try:
+                    import nltk
+                    bundle = nltk_data_dir()
+                    if os.path.isdir(bundle) and bundle not in nltk.data.path:
+                        nltk.data.path.insert(0, bundle)
+                    missing = _missing_nltk_resources(nltk)
+                    if missing:
+                        print(f"NLTK data not found ({', '.join(missing)}); running without NLTK")
+                    else:
+                        from nltk.corpus import stopwords
+                        from nltk.tokenize import word_tokenize, sent_tokenize
+                        from nltk.stem import WordNetLemmatizer
+                        _nltk = {
+                            "stop_words": set(stopwords.words('english')),
+                            "lemmatizer": WordNetLemmatizer(),
+                            "word_tokenize": word_tokenize,
+                            "sent_tokenize": sent_tokenize,
+                        }
+                except Exception as e:
+                    print(f"NLTK unavailable: {e}")
+                    missing = ["nltk"]
+                    _nltk = None
+                _publish("nltk", _nltk is not None, missing)
+    return _nltk
+
+
+def get_spacy():
+    """spaCy pipeline with NER from the bundle or an installed package, or None in degraded mode"""
+    global _nlp
+    if _status["spacy"] is None:
+        with _spacy_lock:
+            if _status["spacy"] is None:
+                try:
+                    import spacy
+                    bundled = spacy_model_dir()
+                    _nlp = spacy.load(bundled if os.path.isdir(bundled) else SPACY_MODEL)
+                    if not _nlp.has_pipe('ner'):
+                        print(f"spaCy model {SPACY_MODEL} has no NER component; running without spaCy")
+                        _nlp = None
+                except Exception as e:
+                    print(f"spaCy model {SPACY_MODEL} unavailable: {e}")
+                    _nlp = None
+                _publish("spacy", _nlp is not None, [] if _nlp is not None else [f"spacy:{SPACY_MODEL}"])
+    return _nlp
+
+
+def verify() -> Dict[str, Any]:
+    """Resolve every resource now (no network) and return ``resource_status()``"""
+    get_spacy()
+    get_nltk()
+    return resource_status()
+
+
+def resource_status() -> Dict[str, Any]:
+    """
+    Current state without loading anything: ``spacy``/``nltk`` are True/False once
+    resolved and None before; ``degraded`` is True if any resolved resource is missing.
+    """
+    with _status_lock:
+        return {
+            "spacy": _status["spacy"],
+            "nltk": _status["nltk"],
+            "degraded": _status["spacy"] is False or _status["nltk"] is False,
+            "missing": list(_status["missing"]),
+            "bundle_dir": NLP_RESOURCE_DIR,
+        }
+
+
+def build_bundle(bundle_dir: str, model: str = SPACY_MODEL):
+    """Download NLTK data and the spaCy model into ``bundle_dir`` (needs network access)"""
+    import nltk
+    import spacy
+
+    target = nltk_data_dir(bundle_dir)
+    os.makedirs(target, exist_ok=True)
+    for package, _path in _nltk_resources(nltk):
+        if not nltk.download(package, download_dir=target, quiet=True):
+            raise RuntimeError(f"Failed to download NLTK package {package}")
+        print(f"NLTK {package} -> {target}")
+
+    try:
+        nlp = spacy.load(model)
+    except OSError:
+        from spacy.cli import download
+        download(model)
+        nlp = spacy.load(model)
+    nlp.to_disk(spacy_model_dir(bundle_dir, model))
+    print(f"spaCy {model} -> {spacy_model_dir(bundle_dir, model)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or check the offline NLP resource bundle")
+    parser.add_argument("--bundle", metavar="DIR", help="download resources into DIR")
+    parser.add_argument("--model", default=SPACY_MODEL)
+    args = parser.parse_args()
+
+    if args.bundle:
+        build_bundle(args.bundle, args.model)
+    else:
+        status = verify()
+        print(status)
+        raise SystemExit(1 if status["degraded"] else 0)
+
+
+if __name__ == "__main__":
+    main()
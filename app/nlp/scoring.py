@@ -1,20 +1,32 @@
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from app.nlp.keyword_match import keyword_presence
+import numpy as np
+
+from app.nlp.keyword_match import KeywordMatcher
 from app.nlp.embeddings import embedding_similarity
-from app.config import HARD_MATCH_WEIGHT, SOFT_MATCH_WEIGHT, VERDICT_THRESHOLDS
+from app.config import HARD_MATCH_WEIGHT, SOFT_MATCH_WEIGHT, LLM_BLEND_WEIGHT, VERDICT_THRESHOLDS
 
 
-def hard_match_score(resume_text: str, must_skills: List[str], nice_skills: List[str]) -> Tuple[float, List[str], Dict[str, bool]]:
+def hard_match_score(
+    resume_text: str,
+    must_skills: List[str],
+    nice_skills: List[str],
+    *,
+    must_matcher: Optional[KeywordMatcher] = None,
+    nice_matcher: Optional[KeywordMatcher] = None,
+) -> Tuple[float, List[str], Dict[str, bool]]:
     """
     Returns:
       - hard_score in [0,1]
       - missing_must (list of missing must-have skills)
       - presence_map for all skills
+
+    Pass prebuilt matchers (see app.services.job_artifacts) to skip per-call keyword setup.
     """
-    must_presence = keyword_presence(resume_text, must_skills)
-    nice_presence = keyword_presence(resume_text, nice_skills) if nice_skills else {}
+    must_matcher = must_matcher or KeywordMatcher(must_skills)
+    must_presence = must_matcher.presence(resume_text)
+    nice_presence = (nice_matcher or KeywordMatcher(nice_skills)).presence(resume_text) if nice_skills else {}
 
     must_total = max(1, len([s for s in must_skills if s.strip()]))
     must_hit = sum(1 for k, v in must_presence.items() if v)
@@ -35,6 +47,13 @@ def soft_match_score(resume_text: str, jd_text: str) -> float:
     return float(embedding_similarity(jd_text, resume_text))
 
 
+def blended_semantic_score(soft: float, llm_semantic: Optional[float]) -> float:
+    """Blend the LLM semantic score into the soft score (the soft score alone when the LLM gave none)"""
+    if llm_semantic is not None and llm_semantic > 0:
+        return LLM_BLEND_WEIGHT * llm_semantic + (1.0 - LLM_BLEND_WEIGHT) * soft
+    return soft
+
+
 def weighted_score(hard: float, soft: float) -> float:
     score = HARD_MATCH_WEIGHT * hard + SOFT_MATCH_WEIGHT * soft
     return round(100.0 * max(0.0, min(1.0, score)), 2)
@@ -48,6 +67,21 @@ def verdict_for_score(score: float) -> str:
     return "Low"
 
 
+def rescore_arrays(hard: np.ndarray, soft: np.ndarray, llm_semantic: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized ``blended_semantic_score`` + ``weighted_score`` + ``verdict_for_score`` over
+    component arrays (NaN in ``llm_semantic`` means no LLM score). Returns (scores, verdicts).
+    """
+    llm = np.nan_to_num(llm_semantic, nan=0.0)
+    semantic = np.where(llm > 0, LLM_BLEND_WEIGHT * llm + (1.0 - LLM_BLEND_WEIGHT) * soft, soft)
+    scores = np.round(100.0 * np.clip(HARD_MATCH_WEIGHT * hard + SOFT_MATCH_WEIGHT * semantic, 0.0, 1.0), 2)
+    verdicts = np.where(
+        scores >= VERDICT_THRESHOLDS["high"], "High",
+        np.where(scores >= VERDICT_THRESHOLDS["medium"], "Medium", "Low"),
+    )
+    return scores, verdicts
+
+
 def suggestions_for_missing(missing: List[str]) -> str:
     if not missing:
         return "Good alignment. Consider highlighting quantifiable achievements and relevant projects."
@@ -1,18 +1,11 @@
 from typing import Tuple, List
 import re
 
-# A small, extendable skill inventory. In production, consider maintaining in DB.
-DEFAULT_SKILLS = [
-    # Programming languages
-    "python", "java", "javascript", "typescript", "c++", "c#", "go", "ruby", "php", "rust", "scala", "kotlin",
-    # Data / ML
-    "sql", "mysql", "postgresql", "mongodb", "redis", "hadoop", "spark", "pandas", "numpy", "sklearn", "pytorch", "tensorflow",
-    # Web / Cloud / DevOps
-    "html", "css", "react", "angular", "vue", "node", "express", "django", "flask", "fastapi",
-    "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ci/cd", "jenkins", "github actions",
-    # Security / QA
-    "owasp", "pentest", "selenium", "cypress", "junit",
-]
+from app.nlp.taxonomy import TermIndex, default_entries, get_taxonomy
+
+# Canonical skills of the built-in taxonomy; the live inventory (with aliases) is the
+# skills table, see app.nlp.taxonomy
+DEFAULT_SKILLS = sorted(name for name, _, _ in default_entries())
 
 
 def normalize_token(s: str) -> str:
@@ -20,11 +13,9 @@ def normalize_token(s: str) -> str:
 
 
 def extract_candidate_skills(text: str, extra_skills: List[str] = None) -> List[str]:
-    tokens = set()
-    text_norm = normalize_token(text)
-    inventory = set(DEFAULT_SKILLS + (extra_skills or []))
-    # Exact token and phrase presence
-    for skill in inventory:
-        if skill in text_norm:
-            tokens.add(skill)
+    """Canonical taxonomy skills mentioned in ``text``, plus any of ``extra_skills`` present"""
+    tokens = set(get_taxonomy().find_in(text))
+    if extra_skills:
+        index = TermIndex(normalize_token(s) for s in extra_skills if s.strip())
+        tokens.update(term for term, _, _ in index.scan(text, overlapping=True))
     return sorted(tokens)
@@ -0,0 +1,282 @@
+"""
+Skill taxonomy: canonical skills with aliases and a parent category.
+
+The taxonomy lives in the ``skills`` / ``skill_aliases`` tables (seeded from
+``DEFAULT_TAXONOMY`` on first use) and is compiled into a ``SkillTaxonomy``: one
+normalized lookup from every name and alias to its canonical skill, matched against text
+with a token-level ``TermIndex`` (whole terms only), shared by
+``extract_candidate_skills``, the entity extractor and ``KeywordMatcher``, so "k8s",
+"postgres" and "node" are reported and matched as kubernetes, postgresql and node.js.
+
+Some spellings are also everyday words or names ("go", "r", "less", "express", see
+``AMBIGUOUS_TERMS``). ``find_in`` (skill extraction) reports them only in a list context:
+between commas, bullets, "and"/"or", line ends or other skills ("Python, Go and R"), not
+in "go to market" or "R&D". ``KeywordMatcher`` still matches them anywhere when a job
+lists them explicitly.
+
+``get_taxonomy()`` returns the compiled taxonomy and recompiles it when the tables change:
+immediately for edits made through ``crud`` in this process (``invalidate_taxonomy``),
+and within ``TAXONOMY_RELOAD_SECONDS`` for edits made by other processes. Stored resume
+skill indexes are not rewritten; run ``crud.reindex_resume_skills`` after large edits.
+"""
+import re
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.config import TAXONOMY_RELOAD_SECONDS
+
+# category -> canonical skill -> aliases
+DEFAULT_TAXONOMY: Dict[str, Dict[str, List[str]]] = {
+    "programming languages": {
+        "python": [], "java": [], "javascript": ["js", "ecmascript"], "typescript": ["ts"],
+        "c++": ["cpp"], "c#": ["csharp"], "go": ["golang"], "rust": [], "scala": [], "kotlin": [],
+        "php": [], "ruby": [], "swift": [], "objective-c": ["objc"], "dart": [], "r": [],
+        "matlab": [], "perl": [], "shell": ["shell scripting"], "bash": [],
+    },
+    "web": {
+        "html": ["html5"], "css": ["css3"], "react": ["react.js", "reactjs"], "angular": ["angularjs", "angular.js"],
+        "vue": ["vue.js", "vuejs"], "node.js": ["node", "nodejs"], "express": ["express.js", "expressjs"],
+        "django": [], "flask": [], "fastapi": [], "bootstrap": [], "tailwind": ["tailwindcss", "tailwind css"],
+        "sass": ["scss"], "less": [], "webpack": [], "vite": [], "next.js": ["nextjs"], "nuxt.js": ["nuxtjs"],
+    },
+    "databases": {
+        "sql": [], "mysql": [], "postgresql": ["postgres", "psql"], "mongodb": ["mongo"], "redis": [],
+        "elasticsearch": ["elastic search"], "cassandra": [], "neo4j": [], "sqlite": [], "oracle": [],
+        "sql server": ["mssql", "ms sql server"], "dynamodb": [], "firebase": [],
+    },
+    "cloud & devops": {
+        "aws": ["amazon web services"], "azure": ["microsoft azure"], "gcp": ["google cloud", "google cloud platform"],
+        "docker": [], "kubernetes": ["k8s"], "terraform": [], "ansible": [], "jenkins": [],
+        "gitlab ci": [], "github actions": [], "ci/cd": ["cicd"], "nginx": [], "apache": [],
+        "linux": [], "ubuntu": [],
+    },
+    "data & ml": {
+        "pandas": [], "numpy": [], "sklearn": ["scikit-learn", "scikit learn"], "pytorch": [], "tensorflow": [],
+        "keras": [], "jupyter": [], "matplotlib": [], "seaborn": [], "plotly": [],
+        "apache spark": ["spark", "pyspark"], "hadoop": [], "airflow": ["apache airflow"], "dbt": [],
+        "tableau": [], "power bi": ["powerbi"],
+    },
+    "security & qa": {
+        "owasp": [], "pentest": ["penetration testing"], "selenium": [], "cypress": [], "junit": [],
+    },
+    "tools": {
+        "git": [], "jira": [], "confluence": [], "slack": [], "figma": [], "adobe": [],
+        "photoshop": [], "illustrator": [],
+    },
+}
+
+# Spellings that are also common words or names; extracted only in a list context
+AMBIGUOUS_TERMS = {
+    "go", "r", "less", "express", "node", "shell", "swift", "rust", "dart", "spark",
+    "ruby", "slack", "bootstrap",
+}
+# Characters that separate list items around an ambiguous term ("-" only as a bullet)
+_LEFT_LIST_MARKS = set(",;:|/()[]•·*-–")
+_RIGHT_LIST_MARKS = set(",;:|/()[].")
+_LIST_WORD_BEFORE = re.compile(r"(?:^|\s)(?:and|or)$", re.IGNORECASE)
+_LIST_WORD_AFTER = re.compile(r"(?:and|or)\b", re.IGNORECASE)
+
+# A token is a run of letters/digits/"+"/"#", possibly dotted ("node.js", ".net"); "/" and
+# "-" are tokens of their own so "ci/cd" and "objective-c" match but "python/django" splits
+_TERM_TOKEN = re.compile(r"(?:(?<![a-z0-9+#])\.)?[a-z0-9+#]+(?:\.[a-z0-9+#]+)*|[/\-]")
+
+
+def normalize_skill(s: str) -> str:
+    return re.sub(r"\s+", " ", (s or "").strip().lower())
+
+
+def default_entries() -> List[Tuple[str, str, List[str]]]:
+    """``DEFAULT_TAXONOMY`` as (name, category, aliases) rows"""
+    return [
+        (name, category, aliases)
+        for category, skills in DEFAULT_TAXONOMY.items()
+        for name, aliases in skills.items()
+    ]
+
+
+def term_tokens(text_lower: str) -> List[Tuple[str, int, int]]:
+    """(token, start, end) for every term token of already lowercased text"""
+    return [(m.group(0), m.start(), m.end()) for m in _TERM_TOKEN.finditer(text_lower)]
+
+
+class TermIndex:
+    """
+    Hash lookup of multi-word terms over a tokenized text.
+
+    The text is tokenized once and each position is looked up by its first token, so the
+    cost grows with the text length and not with the number of terms, and a term only
+    matches whole tokens ("go" is not found in "google", "c" not in "c++").
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: Dict[Tuple[str, ...], str] = {}
+        # first token -> longest term (in tokens) starting with it
+        self._longest: Dict[str, int] = {}
+        for term in terms:
+            key = tuple(t for t, _, _ in term_tokens(normalize_skill(term)))
+            if key:
+                self.terms.setdefault(key, term)
+                self._longest[key[0]] = max(self._longest.get(key[0], 0), len(key))
+
+    def scan(self, text: str, *, overlapping: bool = False) -> Iterator[Tuple[str, int, int]]:
+        """
+        Yield (term, start, end) for term occurrences in ``text``. By default matches do not
+        overlap and the longest term wins at each position ("sql server" over "sql").
+        """
+        tokens = term_tokens(text.lower())
+        words = [t for t, _, _ in tokens]
+        i = 0
+        while i < len(words):
+            longest = self._longest.get(words[i])
+            step = 1
+            if longest:
+                for n in range(min(longest, len(words) - i), 0, -1):
+                    term = self.terms.get(tuple(words[i:i + n]))
+                    if term is not None:
+                        yield term, tokens[i][1], tokens[i + n - 1][2]
+                        if not overlapping:
+                            step = n
+                            break
+            i += step
+
+
+class SkillTaxonomy:
+    """Compiled taxonomy: normalized name/alias lookup and a matcher over all of them"""
+
+    def __init__(self, entries: Iterable[Tuple[str, Optional[str], Iterable[str]]], version=None):
+        self.version = version
+        self.categories: Dict[str, Optional[str]] = {}
+        self.aliases: Dict[str, Set[str]] = {}
+        self.lookup: Dict[str, str] = {}
+        alias_rows = []
+        for name, category, aliases in entries:
+            name = normalize_skill(name)
+            if not name:
+                continue
+            self.categories[name] = category
+            self.aliases.setdefault(name, set())
+            self.lookup[name] = name
+            alias_rows.extend((normalize_skill(a), name) for a in aliases)
+        # Canonical names win over an alias spelled the same way
+        for alias, name in alias_rows:
+            if alias and alias not in self.lookup:
+                self.lookup[alias] = name
+                self.aliases[name].add(alias)
+        self.skills = sorted(self.categories)
+        self.terms = sorted(self.lookup, key=lambda t: (-len(t), t))
+        self.index = TermIndex(self.terms)
+        self.ambiguous = AMBIGUOUS_TERMS & set(self.lookup)
+
+    def canonical(self, term: str) -> str:
+        """Canonical name for a skill name or alias (the normalized input if unknown)"""
+        term = normalize_skill(term)
+        return self.lookup.get(term, term)
+
+    def variants(self, term: str) -> Set[str]:
+        """Every spelling of ``term``'s skill: canonical name and aliases"""
+        name = self.canonical(term)
+        return {name, normalize_skill(term)} | self.aliases.get(name, set())
+
+    def category(self, term: str) -> Optional[str]:
+        return self.categories.get(self.canonical(term))
+
+    def find_in(self, text: str) -> List[str]:
+        """Canonical skills mentioned in ``text`` as whole terms, sorted; ambiguous spellings
+        only in a list context"""
+        matches = list(self.index.scan(text))
+        found = set()
+        for i, (term, start, end) in enumerate(matches):
+            if term in self.ambiguous:
+                prev_end = matches[i - 1][2] if i else None
+                next_start = matches[i + 1][1] if i + 1 < len(matches) else None
+                if not _list_context(text, start, end, prev_end, next_start):
+                    continue
+            found.add(self.lookup[term])
+        return sorted(found)
+
+
+def _list_context(text: str, start: int, end: int, prev_end: Optional[int], next_start: Optional[int]) -> bool:
+    """True if the term at ``text[start:end]`` is separated like a list item on both sides:
+    line boundary, list punctuation, "and"/"or", or an adjacent skill"""
+    i = start
+    while i > 0 and text[i - 1] in " \t":
+        i -= 1
+    left = (
+        i == 0 or text[i - 1] == "\n" or text[i - 1] in _LEFT_LIST_MARKS or i == prev_end
+        or _LIST_WORD_BEFORE.search(text, max(0, i - 4), i) is not None
+    )
+    if not left:
+        return False
+    j = end
+    while j < len(text) and text[j] in " \t":
+        j += 1
+    return (
+        j == len(text) or text[j] == "\n" or text[j] in _RIGHT_LIST_MARKS or j == next_start
+        or _LIST_WORD_AFTER.match(text, j) is not None
+    )
+
+
+def seed_taxonomy(db) -> int:
+    """Insert ``DEFAULT_TAXONOMY`` into an empty taxonomy; returns the number of skills added"""
+    from app.db import models
+    if db.query(models.Skill.id).first() is not None:
+        return 0
+    names = {name for name, _, _ in default_entries()}
+    for name, category, aliases in default_entries():
+        skill = models.Skill(name=name, category=category)
+        skill.aliases = [models.SkillAlias(alias=a) for a in aliases if a not in names]
+        db.add(skill)
+    db.commit()
+    return len(names)
+
+
+def _fingerprint(db):
+    from sqlalchemy import func
+    from app.db import models
+    skills = db.query(func.count(models.Skill.id), func.max(models.Skill.updated_at)).one()
+    aliases = db.query(func.count(models.SkillAlias.id), func.max(models.SkillAlias.updated_at)).one()
+    return tuple(skills) + tuple(aliases)
+
+
+def load_taxonomy(db) -> SkillTaxonomy:
+    """Compile the taxonomy stored in the database (seeding it if empty)"""
+    from app.db import models
+    seed_taxonomy(db)
+    rows = db.query(models.Skill).all()
+    entries = [(s.name, s.category, [a.alias for a in s.aliases]) for s in rows]
+    return SkillTaxonomy(entries, version=_fingerprint(db))
+
+
+_taxonomy: Optional[SkillTaxonomy] = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def invalidate_taxonomy():
+    """Force a reload on the next ``get_taxonomy`` call (after editing the tables)"""
+    global _checked_at
+    with _lock:
+        _checked_at = 0.0
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """Shared compiled taxonomy, reloaded when the stored taxonomy changes"""
+    global _taxonomy, _checked_at
+    with _lock:
+        if _taxonomy is not None and time.monotonic() - _checked_at < TAXONOMY_RELOAD_SECONDS:
+            return _taxonomy
+        try:
+            from app.db.database import SessionLocal
+            db = SessionLocal()
+            try:
+                if _taxonomy is None or _checked_at == 0.0 or _fingerprint(db) != _taxonomy.version:
+                    _taxonomy = load_taxonomy(db)
+            finally:
+                db.close()
+        except Exception as e:
+            print(f"Skill taxonomy unavailable, using built-in defaults: {e}")
+            if _taxonomy is None:
+                _taxonomy = SkillTaxonomy(default_entries(), version="default")
+        _checked_at = time.monotonic()
+        return _taxonomy
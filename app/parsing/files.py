@@ -5,12 +5,19 @@ import pdfplumber
 import docx2txt
 import tempfile
 
+from app.metrics import timed
+
+
+_SPACES = re.compile(r"[^\S\n]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
 
 def _normalize(text: str) -> str:
-    # Basic normalization: strip, collapse whitespace, remove excessive headers/footers hints
-    text = text.replace("\x00", " ")
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # Collapse spaces within lines but keep the line structure (one blank line at most
+    # between blocks): section segmentation and line-scoped extractors rely on it
+    text = text.replace("\x00", " ").replace("\r\n", "\n").replace("\r", "\n")
+    lines = [_SPACES.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
 
 
 def extract_text_from_pdf_bytes(data: bytes) -> str:
@@ -32,6 +39,7 @@ def extract_text_from_docx_bytes(data: bytes) -> str:
     return _normalize(text)
 
 
+@timed("extract_text")
 def extract_text(file_bytes: bytes, filename: str) -> Tuple[str, str]:
     """
     Returns (text, ext)
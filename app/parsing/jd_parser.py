@@ -1,119 +1,95 @@
-import re
 from typing import Dict, List, Tuple
 
 from app.nlp.skills import extract_candidate_skills
+from app.nlp.regex_bank import certification_mentions
 
 
-def _extract_role_title(text: str) -> str:
-    """Extract role/job title from JD text using common patterns"""
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
-    
-    # Look for title patterns in first few lines
-    for i, line in enumerate(lines[:5]):
-        line_lower = line.lower()
-        # Common title indicators
-        if any(indicator in line_lower for indicator in [
-            "job title:", "position:", "role:", "job role:", "designation:",
-            "hiring for", "looking for", "we are seeking"
-        ]):
-            # Extract title after the indicator
-            for indicator in ["job title:", "position:", "role:", "job role:", "designation:"]:
-                if indicator in line_lower:
-                    title = line.split(":", 1)[-1].strip()
-                    if title:
-                        return title
-        
-        # If first line doesn't contain common words, it might be the title
-        if i == 0 and not any(word in line_lower for word in [
-            "company", "about", "description", "overview", "we are", "location"
-        ]):
-            return line
-    
-    # Fallback: look for job-related terms
-    for line in lines[:10]:
-        if any(term in line.lower() for term in [
-            "engineer", "developer", "analyst", "manager", "specialist", 
-            "coordinator", "associate", "senior", "junior", "lead"
-        ]):
-            return line.strip()
-    
-    return "Not specified"
+TITLE_LABELS = ["job title:", "position:", "role:", "job role:", "designation:"]
+TITLE_INDICATORS = TITLE_LABELS + ["hiring for", "looking for", "we are seeking"]
+NOT_TITLE_WORDS = ["company", "about", "description", "overview", "we are", "location"]
+TITLE_TERMS = ["engineer", "developer", "analyst", "manager", "specialist",
+               "coordinator", "associate", "senior", "junior", "lead"]
+MUST_HINTS = ["must have", "required", "requirements:", "mandatory", "essential"]
+NICE_HINTS = ["nice to have", "good to have", "preferred", "plus", "bonus", "desirable"]
+QUALIFICATION_HINTS = ["qualification", "qualifications", "education", "degree", "bachelor", "master", "phd",
+                       "experience:", "required experience"]
+PROJECT_HINTS = ["project", "capstone", "portfolio"]
 
 
-def _extract_qualification_lines(text_l: str) -> List[str]:
-    """Extract lines that likely contain qualification requirements."""
-    lines = [l.strip() for l in text_l.splitlines() if l.strip()]
-    quals = []
-    for l in lines:
-        if any(k in l for k in ["qualification", "qualifications", "education", "degree", "bachelor", "master", "phd", "experience:", "required experience"]):
-            quals.append(l)
-    return quals
+def _title_from(line: str, line_l: str, index: int):
+    """Role title carried by the ``index``-th non-empty line, if any (only the first five count)"""
+    if any(indicator in line_l for indicator in TITLE_INDICATORS):
+        for label in TITLE_LABELS:
+            if label in line_l:
+                title = line.split(":", 1)[-1].strip()
+                if title:
+                    return title
+    # A first line without company/overview words is usually the title itself
+    if index == 0 and not any(word in line_l for word in NOT_TITLE_WORDS):
+        return line
+    return None
 
 
-def _extract_certifications(text_l: str) -> List[str]:
-    """Heuristically extract certification mentions from JD text."""
-    cert_patterns = [
-        r'certified?\s+[\w\s]+(?:professional|specialist|expert|developer|administrator)',
-        r'[\w\s]+\s+certification',
-        r'aws\s+[\w\s]+(?:associate|professional)',
-        r'microsoft\s+[\w\s]+(?:associate|expert)',
-        r'google\s+[\w\s]+(?:associate|professional)',
-        r'cisco\s+[\w\s]+(?:associate|professional)'
-    ]
-    found = []
-    for pattern in cert_patterns:
-        matches = re.findall(pattern, text_l, re.IGNORECASE)
-        found.extend([m.strip() for m in matches])
-    # Normalize duplicates (case-insensitive)
-    norm = []
-    seen = set()
-    for c in found:
-        k = c.lower()
+def _dedupe(items: List[str]) -> List[str]:
+    """Drop case-insensitive duplicates, keeping the first occurrence"""
+    seen, out = set(), []
+    for item in items:
+        k = item.lower()
         if k not in seen:
             seen.add(k)
-            norm.append(c)
-    return norm
-
-
-def _requires_projects(text_l: str) -> bool:
-    return any(k in text_l for k in ["project", "capstone", "portfolio"])  # coarse heuristic
+            out.append(item)
+    return out
 
 
 def parse_jd_freeform(text: str) -> Dict[str, List[str]]:
     """Heuristic extraction of must-have and nice-to-have skills from a JD text.
     Additionally extracts role title, qualifications, certifications, and whether projects are expected.
+
+    Each non-empty line is classified once (title candidate, must/nice hint, qualification,
+    certifications, project mention) instead of rescanning the text per field.
     """
-    text_l = text.lower()
-    
-    # Extract role title first
-    role_title = _extract_role_title(text)
-    
-    # naive hints: lines with 'must', 'required', 'nice', 'preferred'
-    lines = [l.strip() for l in text_l.splitlines() if l.strip()]
-    must_lines, nice_lines = [], []
-    for l in lines:
-        if any(k in l for k in ["must have", "required", "requirements:", "mandatory", "essential"]):
+    role_title = None
+    fallback_title = None
+    must_lines, nice_lines, quals, certs = [], [], [], []
+    needs_projects = False
+
+    index = 0
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        l = line.lower()
+        if role_title is None and index < 5:
+            role_title = _title_from(line, l, index)
+        if fallback_title is None and index < 10 and any(term in l for term in TITLE_TERMS):
+            fallback_title = line
+        index += 1
+
+        # naive hints: lines with 'must', 'required', 'nice', 'preferred'
+        if any(k in l for k in MUST_HINTS):
             must_lines.append(l)
-        if any(k in l for k in ["nice to have", "good to have", "preferred", "plus", "bonus", "desirable"]):
+        if any(k in l for k in NICE_HINTS):
             nice_lines.append(l)
-    
+        if any(k in l for k in QUALIFICATION_HINTS):
+            quals.append(l)
+        # Certification patterns are line-scoped, so matching per line finds the same mentions
+        certs.extend(m.strip() for m in certification_mentions(l))
+        if not needs_projects and any(k in l for k in PROJECT_HINTS):
+            needs_projects = True
+
     # fallback: whole text
+    text_l = text.lower()
     must_text = "\n".join(must_lines) if must_lines else text_l
     nice_text = "\n".join(nice_lines) if nice_lines else text_l
 
     must_skills = extract_candidate_skills(must_text)
     nice_skills = [s for s in extract_candidate_skills(nice_text) if s not in must_skills]
 
-    # Additional extractions
-    quals = _extract_qualification_lines(text_l)
-    certs = _extract_certifications(text_l)
-    needs_projects = _requires_projects(text_l)
-
     return {
-        "role_title": role_title,
+        "role_title": role_title or fallback_title or "Not specified",
         "must": must_skills,
         "nice": nice_skills,
         "qualifications": quals,
-        "certifications": certs,
+        "certifications": _dedupe(certs),
         "requires_projects": needs_projects,
     }
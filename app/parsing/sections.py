@@ -0,0 +1,142 @@
+"""
+Resume section segmentation.
+
+Splits layout-preserving resume text (one line per line of the document, see
+``app.parsing.files``) into sections by their headings ("SKILLS", "Work Experience:",
+"Education & Certifications" ...). A heading may also carry content on the same line
+("Skills: Python, SQL"). Text before the first heading is the ``header`` (name, contact
+details); sections with headings we do not use (hobbies, languages ...) go to ``other``.
+
+Inline headings only open a main section from the header or an "other" section. Once a
+main section is open, "label: value" lines ("Languages: Python, Java" in SKILLS, "Tech
+stack: Django" in EXPERIENCE) are its content; only standalone heading lines switch.
+
+Sections are computed once at ingest and stored on the resume (``Resume.sections_json``)
+so extractors can scan only the part they need and LLM prompts can leave contact details
+out (``prompt_text``).
+"""
+import re
+from typing import Dict, Iterable, Optional
+
+from app.nlp.regex_bank import EMAIL, LINKEDIN, PHONE
+from app.utils import loads_json
+
+SECTIONS = ("summary", "skills", "experience", "projects", "education", "certifications")
+
+SECTION_HEADINGS: Dict[str, list] = {
+    "summary": ["summary", "professional summary", "profile", "professional profile", "objective",
+                "career objective", "about me", "about"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "core competencies", "competencies",
+               "technologies", "tech stack", "tools", "skills and tools", "tools and technologies",
+               "programming languages", "skill set", "skillset"],
+    "experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history", "career history", "internships", "internship",
+                   "relevant experience"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects", "selected projects",
+                 "project experience"],
+    "education": ["education", "academic background", "academics", "educational qualifications",
+                  "qualifications", "education and training"],
+    "certifications": ["certifications", "certification", "certificates", "licenses and certifications",
+                       "certifications and courses", "courses", "training", "awards and certifications"],
+    "other": ["hobbies", "interests", "languages", "references", "achievements", "awards", "publications",
+              "volunteering", "volunteer experience", "extracurricular activities", "activities",
+              "personal details", "declaration", "contact", "contact information"],
+}
+
+_HEADING_LOOKUP = {h: section for section, headings in SECTION_HEADINGS.items() for h in headings}
+# Longest heading is five words; anything longer on its own line is content
+_MAX_HEADING_CHARS = 40
+_HEADING_CLEAN = re.compile(r"[^a-z ]+")
+_INLINE_HEADING = re.compile(r"^\s*([A-Za-z][A-Za-z &/]{1,38}?)\s*[:–—-]\s*(\S.*)$")
+_URL = re.compile(r"https?://|www\.|github\.com/", re.IGNORECASE)
+# Prompts fall back to the whole text when the main sections hold less than this share of
+# it (unusual headings left most of the resume in the header)
+PROMPT_MIN_SECTION_SHARE = 0.5
+
+
+def _heading_key(line: str) -> str:
+    """Lowercased heading text with punctuation dropped and "&"/"/" read as "and" """
+    line = line.lower().replace("&", " and ").replace("/", " and ")
+    return " ".join(_HEADING_CLEAN.sub(" ", line).split())
+
+
+def _heading(line: str, inline: bool = True):
+    """(section, inline content) if ``line`` is a section heading, else None; ``inline``
+    also accepts "Skills: Python, SQL" style headings"""
+    stripped = line.strip().lstrip("#*•-– ").strip()
+    if not stripped:
+        return None
+    if len(stripped) <= _MAX_HEADING_CHARS:
+        section = _HEADING_LOOKUP.get(_heading_key(stripped))
+        if section:
+            return section, ""
+    m = _INLINE_HEADING.match(stripped) if inline else None
+    if m:
+        section = _HEADING_LOOKUP.get(_heading_key(m.group(1)))
+        # Inline "other" labels are sub-labels of the current section ("Languages: Python")
+        if section in SECTIONS:
+            return section, m.group(2).strip()
+    return None
+
+
+def segment_resume(text: str) -> Dict[str, str]:
+    """Section name -> text (lines joined with newlines); only sections that occur are present"""
+    parts: Dict[str, list] = {}
+    current = "header"
+    for line in (text or "").splitlines():
+        # Inside a main section, "label: value" lines are content of that section
+        heading = _heading(line, inline=current not in SECTIONS)
+        if heading:
+            current, inline = heading
+            if inline:
+                parts.setdefault(current, []).append(inline)
+            else:
+                parts.setdefault(current, [])
+            continue
+        if line.strip():
+            parts.setdefault(current, []).append(line.strip())
+    return {name: "\n".join(lines) for name, lines in parts.items() if lines}
+
+
+def has_sections(sections: Dict[str, str]) -> bool:
+    return any(name in sections for name in SECTIONS)
+
+
+def resume_sections(resume) -> Dict[str, str]:
+    """Stored sections of a resume row, segmenting its text when none are stored (older rows)"""
+    stored = loads_json(getattr(resume, "sections_json", None))
+    return stored if isinstance(stored, dict) else segment_resume(resume.text)
+
+
+def section_text(sections: Optional[Dict[str, str]], names: Iterable[str], fallback: str) -> str:
+    """Text of the named sections, or ``fallback`` (the whole resume) when none of them was found"""
+    if not sections:
+        return fallback
+    found = [sections[n] for n in names if sections.get(n)]
+    return "\n".join(found) if found else fallback
+
+
+def _contact_line(line: str) -> bool:
+    if EMAIL.search(line) or LINKEDIN.search(line) or _URL.search(line):
+        return True
+    phone = PHONE.search(line)
+    return bool(phone) and sum(c.isdigit() for c in phone.group(0)) >= 10
+
+
+def prompt_text(sections: Optional[Dict[str, str]], fallback: str) -> str:
+    """Resume text for LLM prompts: the main sections under their headings, then any other
+    body text (header without contact lines, unrecognized sections). The whole text when
+    unsegmented or when the main sections cover too little of it."""
+    if not sections or not has_sections(sections):
+        return fallback
+    main = [f"{name.upper()}\n{sections[name]}" for name in SECTIONS if sections.get(name)]
+    extra = [line for line in sections.get("header", "").splitlines() if not _contact_line(line)]
+    if sections.get("other"):
+        extra.append(sections["other"])
+    main_chars = sum(len(sections[name]) for name in SECTIONS if sections.get(name))
+    extra_chars = sum(len(line) for line in extra)
+    if main_chars < PROMPT_MIN_SECTION_SHARE * (main_chars + extra_chars):
+        return fallback
+    if extra:
+        main.append("OTHER\n" + "\n".join(extra))
+    return "\n\n".join(main)
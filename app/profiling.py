@@ -0,0 +1,208 @@
+"""
+Opt-in request profiling and slow-evaluation traces.
+
+``capture(name)`` records a span trace of the pipeline stages run inside it (every
+``metrics.timed`` stage is also a span) and, when profiling was requested, a cProfile of
+the same work. Profiled captures and captures slower than ``PROFILE_SLOW_SECONDS`` are
+written to ``PROFILE_DIR`` (``<id>.json`` with spans and the top functions, ``<id>.prof``
+loadable with pstats/snakeviz); only the last ``PROFILE_KEEP_TRACES`` are kept.
+
+The API profiles a request when it has an ``X-Profile: 1`` header or ``?profile=1``; the
+Streamlit admin sidebar has a toggle for evaluations run from the UI.
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.config import PROFILE_DIR, PROFILE_KEEP_TRACES, PROFILE_SLOW_SECONDS
+
+TOP_FUNCTIONS = 40
+
+
+@dataclass
+class Trace:
+    id: str
+    name: str
+    started_at: str
+    profiled: bool = False
+    duration: float = 0.0
+    spans: List[Dict[str, Any]] = field(default_factory=list)
+    profile_top: Optional[str] = None
+    _start: float = field(default=0.0, repr=False)
+    _depth: int = field(default=0, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop("_start")
+        data.pop("_depth")
+        return data
+
+
+_active: ContextVar[Optional[Trace]] = ContextVar("profiling_trace", default=None)
+_requested: ContextVar[bool] = ContextVar("profiling_requested", default=False)
+
+# Only one cProfile can run per process (Python 3.12+) and we do not want two anyway
+_profiler_lock = threading.Lock()
+_store_lock = threading.Lock()
+_TRACE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+@contextmanager
+def request_profiling(enabled: bool = True) -> Iterator[None]:
+    """Profile captures started within this block"""
+    token = _requested.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _requested.reset(token)
+
+
+def set_profiling_requested(enabled: bool):
+    """Like ``request_profiling`` for the rest of the current context (Streamlit script runs)"""
+    _requested.set(bool(enabled))
+
+
+def current_trace() -> Optional[Trace]:
+    return _active.get()
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Record ``name`` in the active trace; a no-op outside ``capture``"""
+    trace = _active.get()
+    if trace is None:
+        yield
+        return
+    entry = {"name": name, "start": round(time.perf_counter() - trace._start, 6), "depth": trace._depth}
+    trace.spans.append(entry)
+    trace._depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        trace._depth -= 1
+        entry["duration"] = round(time.perf_counter() - start, 6)
+
+
+@contextmanager
+def capture(name: str, profile: Optional[bool] = None) -> Iterator[Optional[Trace]]:
+    """
+    Trace the block; profile it too if ``profile`` (default: whether profiling was requested).
+    Nested captures are recorded as spans of the outer one.
+    """
+    if _active.get() is not None:
+        with span(name):
+            yield _active.get()
+        return
+
+    profile = _requested.get() if profile is None else profile
+    trace = Trace(id=uuid.uuid4().hex, name=name, started_at=datetime.utcnow().isoformat())
+    profiler = None
+    if profile and _profiler_lock.acquire(blocking=False):
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:  # another profiling tool is active
+            print(f"Profiling unavailable: {e}")
+            profiler = None
+            _profiler_lock.release()
+    trace.profiled = profiler is not None
+
+    token = _active.set(trace)
+    trace._start = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        trace.duration = round(time.perf_counter() - trace._start, 6)
+        _active.reset(token)
+        if profiler is not None:
+            profiler.disable()
+            _profiler_lock.release()
+        slow = PROFILE_SLOW_SECONDS > 0 and trace.duration >= PROFILE_SLOW_SECONDS
+        if profiler is not None or slow:
+            try:
+                _store(trace, profiler)
+            except Exception as e:
+                print(f"Failed to store profile trace: {e}")
+
+
+def _store(trace: Trace, profiler: Optional[cProfile.Profile]):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    if profiler is not None:
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        trace.profile_top = out.getvalue()
+        profiler.dump_stats(os.path.join(PROFILE_DIR, f"{trace.id}.prof"))
+    with open(os.path.join(PROFILE_DIR, f"{trace.id}.json"), "w", encoding="utf-8") as f:
+        json.dump(trace.to_dict(), f, indent=2)
+    _prune()
+
+
+def _prune():
+    with _store_lock:
+        traces = sorted(
+            (os.path.join(PROFILE_DIR, name) for name in os.listdir(PROFILE_DIR) if name.endswith(".json")),
+            key=os.path.getmtime,
+        )
+        for path in traces[:max(0, len(traces) - PROFILE_KEEP_TRACES)]:
+            for ext in (".json", ".prof"):
+                try:
+                    os.remove(path[:-len(".json")] + ext)
+                except FileNotFoundError:
+                    pass
+
+
+def list_traces() -> List[Dict[str, Any]]:
+    """Stored traces, newest first (without spans or profile output)"""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    summaries = []
+    for name in os.listdir(PROFILE_DIR):
+        if not name.endswith(".json"):
+            continue
+        trace = load_trace(name[:-len(".json")])
+        if trace is None:
+            continue
+        summaries.append({
+            "id": trace["id"],
+            "name": trace["name"],
+            "started_at": trace["started_at"],
+            "duration": trace["duration"],
+            "profiled": trace["profiled"],
+            "spans": len(trace["spans"]),
+        })
+    return sorted(summaries, key=lambda t: t["started_at"], reverse=True)
+
+
+def trace_file(trace_id: str, kind: str = "json") -> Optional[str]:
+    """Path of a stored trace file (``json`` or ``prof``), or None"""
+    if not _TRACE_ID.match(trace_id or "") or kind not in ("json", "prof"):
+        return None
+    path = os.path.join(PROFILE_DIR, f"{trace_id}.{kind}")
+    return path if os.path.exists(path) else None
+
+
+def load_trace(trace_id: str) -> Optional[Dict[str, Any]]:
+    path = trace_file(trace_id)
+    if path is None:
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Failed to read profile trace {trace_id}: {e}")
+        return None
@@ -1,19 +1,23 @@
-from typing import List, Tuple
+from typing import Any, Dict, List, Tuple
 from sqlalchemy.orm import Session
 
 from app.db import crud, models
-from app.utils import loads_json
 from app.nlp.scoring import (
-    hard_match_score,
-    soft_match_score,
+    blended_semantic_score,
     weighted_score,
     verdict_for_score,
     suggestions_for_missing,
 )
-from app.services.llm_evaluator import llm_evaluator
-from app.nlp.advanced_processor import text_processor
+from app.services.llm_evaluator import get_llm_evaluator
+from app.services.job_artifacts import get_job_artifacts
+from app.services.resume_features import get_resume_features
+from app.metrics import timed, EVALUATIONS
+from app.profiling import capture
+from app.parsing.sections import prompt_text, resume_sections
+from app.utils import loads_json
 
 
+@timed("evaluate")
 def evaluate_resume_against_job(db: Session, job: models.Job, resume: models.Resume) -> models.Evaluation:
     """
     Enhanced evaluation with LLM integration and advanced text processing
@@ -22,24 +26,45 @@ def evaluate_resume_against_job(db: Session, job: models.Job, resume: models.Res
     if not resume.id:
         raise ValueError("Resume must be saved to database before evaluation. Use crud.create_resume() to save it first.")
     
-    must = loads_json(job.must_skills_json) or []
-    nice = loads_json(job.nice_skills_json) or []
+    # Slow evaluations keep a stage trace; profiled requests also get a cProfile dump
+    with capture(f"evaluate job={job.id} resume={resume.id}"):
+        return _evaluate(db, job, resume)
+
+
+def _evaluate(db: Session, job: models.Job, resume: models.Resume) -> models.Evaluation:
+    # Both sides are precomputed: job artifacts at job creation, resume features at ingest
+    with timed("load_job_artifacts"):
+        artifacts = get_job_artifacts(db, job)
+    with timed("load_resume_features"):
+        features = get_resume_features(db, resume)
 
     # Basic hybrid scoring
-    hard, missing, _presence = hard_match_score(resume.text, must, nice)
-    soft = soft_match_score(resume.text, job.jd_text)
+    with timed("hard_match"):
+        hard, missing, presence = artifacts.hard_match(resume.text)
+    with timed("soft_match"):
+        soft = artifacts.soft_match(resume.text, features)
     
     # LLM-enhanced scoring if available
-    llm_score = soft  # Default to basic soft score
+    llm_semantic = None
+    llm_result = None
     enhanced_suggestions = suggestions_for_missing(missing)
     
     try:
         # Get LLM evaluation
-        llm_result = llm_evaluator.evaluate_with_llm(resume.text, job.jd_text)
+        # Resume sections under their headings, without contact details
+        resume_prompt = prompt_text(resume_sections(resume), resume.text)
+        # Without an LLM the fallback reuses the soft score and both sides' precomputed skills
+        llm_result = get_llm_evaluator().evaluate_with_llm(
+            resume_prompt,
+            job.jd_text,
+            soft_score=soft,
+            jd_skills=artifacts.must + artifacts.nice,
+            # Taxonomy skills found at ingest plus the job's skills the keyword match found
+            resume_skills=features.skills + [s for s, found in presence.items() if found],
+        )
         
-        # Blend LLM score with traditional soft score (70% LLM, 30% traditional)
-        if llm_result.semantic_score > 0:
-            llm_score = 0.7 * llm_result.semantic_score + 0.3 * soft
+        # Blended with the traditional soft score below (LLM_BLEND_WEIGHT)
+        llm_semantic = llm_result.semantic_score
         
         # Enhanced suggestions from LLM
         if llm_result.improvement_suggestions:
@@ -53,9 +78,9 @@ def evaluate_resume_against_job(db: Session, job: models.Job, resume: models.Res
     except Exception as e:
         print(f"LLM evaluation failed, using fallback: {e}")
     
-    # Extract enhanced entities for better missing skill detection
+    # Use entities extracted at ingest for better missing skill detection
     try:
-        entities = text_processor.extract_entities(resume.text)
+        entities = features.entities
         
         # Add extracted skills to improve matching
         extracted_skills = [skill.lower() for skill in entities.skills]
@@ -70,11 +95,12 @@ def evaluate_resume_against_job(db: Session, job: models.Job, resume: models.Res
     except Exception as e:
         print(f"Advanced text processing failed: {e}")
     
-    # Calculate final score
-    final = weighted_score(hard, llm_score)
+    # Calculate final score; components are stored so scores can be recomputed without re-evaluating
+    final = weighted_score(hard, blended_semantic_score(soft, llm_semantic))
     verdict = verdict_for_score(final)
+    EVALUATIONS.inc(verdict=verdict)
 
-    return crud.create_evaluation(
+    evaluation = crud.create_evaluation(
         db,
         job_id=job.id,
         resume_id=resume.id,
@@ -82,4 +108,47 @@ def evaluate_resume_against_job(db: Session, job: models.Job, resume: models.Res
         verdict=verdict,
         missing=missing,
         suggestions=enhanced_suggestions,
+        hard_score=hard,
+        soft_score=soft,
+        llm_score=llm_semantic,
     )
+    evaluation.llm_result = llm_result
+    return evaluation
+
+
+def evaluation_report(db: Session, job: models.Job, resume: models.Resume, evaluation: models.Evaluation) -> Dict[str, Any]:
+    """
+    ``evaluation`` with the resume's extracted entities and text summary and, when the LLM
+    took part in it, its detailed feedback; shaped like the API's ``AdvancedEvaluationResponse``
+    """
+    # Entities, summary and embedding were computed once at ingest
+    features = get_resume_features(db, resume)
+
+    # The same LLM result that was blended into the score (no second LLM call); none for
+    # the keyword fallback used when no LLM is configured
+    llm_analysis = None
+    llm_result = evaluation.llm_result
+    if llm_result is not None and get_llm_evaluator().llm:
+        llm_analysis = {
+            "semantic_score": llm_result.semantic_score,
+            "detailed_feedback": llm_result.detailed_feedback,
+            "skill_gaps": llm_result.skill_gaps,
+            "strengths": llm_result.strengths,
+            "improvement_suggestions": llm_result.improvement_suggestions,
+            "relevance_explanation": llm_result.relevance_explanation,
+            "confidence_score": llm_result.confidence_score
+        }
+
+    return {
+        "basic_evaluation": {
+            "id": evaluation.id,
+            "score": evaluation.score,
+            "verdict": evaluation.verdict,
+            "missing_skills": loads_json(evaluation.missing_json) or [],
+            "suggestions": evaluation.suggestions or "",
+            "created_at": evaluation.created_at.isoformat(),
+        },
+        "llm_analysis": llm_analysis,
+        "extracted_entities": features.entities_dict(),
+        "text_summary": features.summary,
+    }
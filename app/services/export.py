@@ -0,0 +1,167 @@
+"""
+Streaming export of evaluations joined to their job and resume.
+
+Rows are read with keyset pagination on ``evaluations.id`` (each page streamed from a
+server-side cursor) and encoded page by page, so memory stays constant regardless of how
+many evaluations are exported. CSV needs only the standard library; Parquet needs pyarrow
+and writes one row group per page.
+"""
+import csv
+import io
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.db import models
+
+EXPORT_COLUMNS = [
+    "evaluation_id",
+    "job_id",
+    "job_title",
+    "resume_id",
+    "student_name",
+    "file_name",
+    "location",
+    "score",
+    "verdict",
+    "hard_score",
+    "soft_score",
+    "llm_score",
+    "missing_skills",
+    "created_at",
+]
+PAGE_SIZE = 5000
+
+
+def iter_evaluation_pages(
+    db: Session,
+    *,
+    job_id: Optional[int] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    verdict: Optional[str] = None,
+    location: Optional[str] = None,
+    skills: Optional[List[str]] = None,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield pages of export rows (dicts keyed by ``EXPORT_COLUMNS``) in evaluation id order"""
+    E, J, R = models.Evaluation, models.Job, models.Resume
+    q = (
+        db.query(
+            E.id, E.job_id, J.title, E.resume_id, R.student_name, R.file_name, R.location,
+            E.score, E.verdict, E.hard_score, E.soft_score, E.llm_score, E.missing_json, E.created_at,
+        )
+        .join(J, J.id == E.job_id)
+        .join(R, R.id == E.resume_id)
+    )
+    if job_id:
+        q = q.filter(E.job_id == job_id)
+    if min_score is not None:
+        q = q.filter(E.score >= float(min_score))
+    if max_score is not None:
+        q = q.filter(E.score <= float(max_score))
+    if verdict:
+        q = q.filter(E.verdict.ilike(verdict))
+    if location:
+        q = q.filter(R.location.ilike(f"%{location}%"))
+    skills = [s.strip() for s in (skills or []) if s.strip()]
+    if skills:
+        q = q.filter(or_(*[R.text.ilike(f"%{s}%") for s in skills]))
+
+    last_id = 0
+    while True:
+        page = (
+            q.filter(E.id > last_id)
+            .order_by(E.id)
+            .limit(page_size)
+            .execution_options(stream_results=True, yield_per=min(page_size, 1000))
+        )
+        rows = [dict(zip(EXPORT_COLUMNS, row)) for row in page]
+        if not rows:
+            return
+        for row in rows:
+            row["missing_skills"] = row["missing_skills"] or "[]"
+            row["created_at"] = row["created_at"].isoformat() if row["created_at"] else None
+        yield rows
+        last_id = rows[-1]["evaluation_id"]
+
+
+def iter_csv(pages: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """Encode pages as CSV, one chunk per page (header first)"""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    yield buf.getvalue().encode("utf-8")
+    for rows in pages:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(rows)
+        yield buf.getvalue().encode("utf-8")
+
+
+class _DrainableSink(io.RawIOBase):
+    """Write-only file object whose written bytes can be taken out incrementally"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks = []
+        return out
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def iter_parquet(pages: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """Encode pages as a Parquet file, one row group per page"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("evaluation_id", pa.int64()),
+        ("job_id", pa.int64()),
+        ("job_title", pa.string()),
+        ("resume_id", pa.int64()),
+        ("student_name", pa.string()),
+        ("file_name", pa.string()),
+        ("location", pa.string()),
+        ("score", pa.float64()),
+        ("verdict", pa.string()),
+        ("hard_score", pa.float64()),
+        ("soft_score", pa.float64()),
+        ("llm_score", pa.float64()),
+        ("missing_skills", pa.string()),
+        ("created_at", pa.string()),
+    ])
+    sink = _DrainableSink()
+    with pq.ParquetWriter(sink, schema, compression="snappy") as writer:
+        for rows in pages:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    tail = sink.drain()
+    if tail:
+        yield tail
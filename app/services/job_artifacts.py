@@ -0,0 +1,209 @@
+"""
+Per-job artifacts precomputed when a job is created or edited.
+
+Everything about the job side of a resume/job evaluation (parsed requirements, compiled
+skill matchers, JD embeddings and JD term counts for the TF-IDF fallback) is built once,
+persisted in ``job_artifacts`` and cached in memory, so evaluating a resume only does
+resume-side work. Artifacts are rebuilt when the JD or its skills change, or when a
+different embedding model is loaded.
+"""
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.utils import dumps_json, loads_json, array_to_blob, blob_to_array
+from app.config import EMBEDDING_CHUNKING
+from app.nlp import embeddings
+from app.nlp.keyword_match import KeywordMatcher
+from app.nlp.scoring import hard_match_score
+from app.metrics import cache_event, FALLBACKS
+
+
+@dataclass
+class JobArtifacts:
+    job_id: int
+    jd_hash: str
+    embedding_model: Optional[str]
+    must: List[str]
+    nice: List[str]
+    term_counts: Dict[str, int]
+    jd_embedding: Optional[np.ndarray] = None
+    chunk_embeddings: Optional[np.ndarray] = None
+    must_matcher: KeywordMatcher = field(init=False, repr=False)
+    nice_matcher: KeywordMatcher = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.must_matcher = KeywordMatcher(self.must)
+        self.nice_matcher = KeywordMatcher(self.nice)
+
+    def hard_match(self, resume_text: str) -> Tuple[float, List[str], Dict[str, bool]]:
+        """Same result as ``hard_match_score`` with the job's skill lists"""
+        return hard_match_score(resume_text, self.must, self.nice, must_matcher=self.must_matcher, nice_matcher=self.nice_matcher)
+
+    def soft_match(self, resume_text: str, features=None) -> float:
+        """
+        Same result as ``soft_match_score`` against the JD, encoding only the resume.
+        With the resume's precomputed ``ResumeFeatures`` nothing is encoded at all.
+        """
+        if features is not None and features.embedding_model != self.embedding_model:
+            features = None  # vectors from different models are not comparable
+        try:
+            if EMBEDDING_CHUNKING and self.chunk_embeddings is not None:
+                if features is not None and features.chunk_embeddings is not None:
+                    sim = float((self.chunk_embeddings @ features.chunk_embeddings.T).max(axis=1).mean())
+                else:
+                    sim = embeddings.chunked_similarity_to(self.chunk_embeddings, resume_text)
+                if sim is not None:
+                    return max(0.0, min(1.0, sim))
+            if self.jd_embedding is not None:
+                if features is not None and features.embedding is not None:
+                    resume_vec = features.embedding
+                else:
+                    vecs = embeddings.encode_texts([resume_text])
+                    resume_vec = None if vecs is None else vecs[0]
+                if resume_vec is not None:
+                    return max(0.0, min(1.0, float(np.dot(self.jd_embedding, resume_vec))))
+        except Exception as e:
+            print(f"Embedding soft match failed, using TF-IDF: {e}")
+        FALLBACKS.inc(component="tfidf_similarity")
+        if features is not None:
+            return embeddings.tfidf_similarity(self.term_counts, features.term_counts)
+        return embeddings.tfidf_similarity_from_counts(self.term_counts, resume_text)
+
+
+def job_fingerprint(job: models.Job) -> str:
+    """Hash of everything the artifacts are derived from"""
+    h = hashlib.sha1()
+    for part in (job.jd_text or "", job.must_skills_json or "", job.nice_skills_json or ""):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def build_job_artifacts(job: models.Job) -> JobArtifacts:
+    """Compute artifacts for ``job`` (encodes the JD if an embedding model is available)"""
+    return build_job_artifacts_many([job])[0]
+
+
+def build_job_artifacts_many(jobs: List[models.Job]) -> List[JobArtifacts]:
+    """Artifacts for several jobs, encoding all JDs (and all their chunks) in one batch each"""
+    whole = chunk_vecs = None
+    chunk_lists = [[] for _ in jobs]
+    model_id = embeddings.embedding_model_id()
+    if model_id is not None and jobs:
+        whole = embeddings.encode_texts([job.jd_text for job in jobs])
+        chunk_lists = [embeddings.split_into_chunks(job.jd_text) for job in jobs]
+        flat = [c for chunks in chunk_lists for c in chunks]
+        chunk_vecs = embeddings.encode_chunks(flat) if flat else None
+
+    artifacts, offset = [], 0
+    for i, job in enumerate(jobs):
+        jd_embedding = None if whole is None else whole[i]
+        n = len(chunk_lists[i])
+        chunk_embeddings = chunk_vecs[offset:offset + n] if chunk_vecs is not None and n else None
+        offset += n
+        artifacts.append(JobArtifacts(
+            job_id=job.id,
+            jd_hash=job_fingerprint(job),
+            embedding_model=model_id if jd_embedding is not None else None,
+            must=[s.strip() for s in (loads_json(job.must_skills_json) or []) if s.strip()],
+            nice=[s.strip() for s in (loads_json(job.nice_skills_json) or []) if s.strip()],
+            term_counts=embeddings.tfidf_term_counts(job.jd_text),
+            jd_embedding=jd_embedding,
+            chunk_embeddings=chunk_embeddings,
+        ))
+    return artifacts
+
+
+def _to_row(artifacts: JobArtifacts, row: models.JobArtifact):
+    row.jd_hash = artifacts.jd_hash
+    row.embedding_model = artifacts.embedding_model
+    row.must_skills_json = dumps_json(artifacts.must)
+    row.nice_skills_json = dumps_json(artifacts.nice)
+    row.term_counts_json = dumps_json(artifacts.term_counts)
+    row.embedding_dim = None if artifacts.jd_embedding is None else int(artifacts.jd_embedding.shape[-1])
+    row.jd_embedding = array_to_blob(artifacts.jd_embedding)
+    row.chunk_embeddings = array_to_blob(artifacts.chunk_embeddings)
+
+
+def _from_row(row: models.JobArtifact) -> JobArtifacts:
+    jd_embedding = blob_to_array(row.jd_embedding, row.embedding_dim)
+    return JobArtifacts(
+        job_id=row.job_id,
+        jd_hash=row.jd_hash,
+        embedding_model=row.embedding_model,
+        must=loads_json(row.must_skills_json) or [],
+        nice=loads_json(row.nice_skills_json) or [],
+        term_counts=loads_json(row.term_counts_json) or {},
+        jd_embedding=None if jd_embedding is None else jd_embedding[0],
+        chunk_embeddings=blob_to_array(row.chunk_embeddings, row.embedding_dim),
+    )
+
+
+_cache: Dict[int, JobArtifacts] = {}
+_cache_lock = threading.Lock()
+
+
+def _is_current(artifacts: JobArtifacts, job: models.Job) -> bool:
+    if artifacts.jd_hash != job_fingerprint(job):
+        return False
+    # Vectors from a different model are unusable; artifacts built without a model are
+    # upgraded once one becomes available
+    return artifacts.embedding_model == embeddings.embedding_model_id()
+
+
+def stage_job_artifacts(db: Session, artifacts: JobArtifacts):
+    """Add or update the stored row for ``artifacts`` in the current transaction (no commit)"""
+    row = db.query(models.JobArtifact).filter(models.JobArtifact.job_id == artifacts.job_id).first()
+    if row is None:
+        row = models.JobArtifact(job_id=artifacts.job_id)
+        db.add(row)
+    _to_row(artifacts, row)
+
+
+def remember_job_artifacts(artifacts: List[JobArtifacts]):
+    """Put committed artifacts in the in-memory cache"""
+    with _cache_lock:
+        for a in artifacts:
+            _cache[a.job_id] = a
+
+
+def refresh_job_artifacts(db: Session, job: models.Job) -> JobArtifacts:
+    """Build and persist artifacts for ``job``, replacing any existing ones"""
+    artifacts = build_job_artifacts(job)
+    stage_job_artifacts(db, artifacts)
+    db.commit()
+    remember_job_artifacts([artifacts])
+    return artifacts
+
+
+def get_job_artifacts(db: Session, job: models.Job) -> JobArtifacts:
+    """Artifacts for ``job`` from memory, then the database, rebuilding them if stale"""
+    with _cache_lock:
+        artifacts = _cache.get(job.id)
+    if artifacts is not None and _is_current(artifacts, job):
+        cache_event("job_artifacts", hit=True)
+        return artifacts
+    cache_event("job_artifacts", hit=False)
+
+    row = db.query(models.JobArtifact).filter(models.JobArtifact.job_id == job.id).first()
+    if row is not None:
+        artifacts = _from_row(row)
+        if _is_current(artifacts, job):
+            with _cache_lock:
+                _cache[job.id] = artifacts
+            return artifacts
+    return refresh_job_artifacts(db, job)
+
+
+def invalidate_job_artifacts(db: Session, job_id: int):
+    """Drop stored and cached artifacts for a job (they are rebuilt on next use)"""
+    db.query(models.JobArtifact).filter(models.JobArtifact.job_id == job_id).delete()
+    db.commit()
+    with _cache_lock:
+        _cache.pop(job_id, None)
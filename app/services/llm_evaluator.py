@@ -1,34 +1,18 @@
 """
 Advanced LLM-powered evaluation service using LangChain and LangGraph
+
+LangChain, the LLM client and the vector store are heavy to import and initialize, so
+nothing is loaded at import time: use ``get_llm_evaluator()`` to obtain the shared
+instance, which is constructed on first use (or ahead of time by ``app.services.warmup``).
 """
 import os
-import sys
+import threading
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
-from langchain.schema import Document
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema.runnable import RunnablePassthrough
-from langchain.schema.output_parser import StrOutputParser
 import json
 
-# Handle ChromaDB import with SQLite fix
-try:
-    __import__('pysqlite3')
-    sys.modules['sqlite3'] = sys.modules.pop('pysqlite3')
-    import chromadb
-    from chromadb.utils import embedding_functions
-    CHROMADB_AVAILABLE = True
-except (ImportError, RuntimeError) as e:
-    print(f"ChromaDB not available: {e}")
-    CHROMADB_AVAILABLE = False
-
-try:
-    from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-    from langchain_community.vectorstores import Chroma
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+from app.services.vector_index import create_vector_index
+from app.metrics import timed, FALLBACKS, LLM_FAILURES
 
 @dataclass
 class LLMEvaluationResult:
@@ -47,113 +31,105 @@ class AdvancedLLMEvaluator:
     
     def __init__(self, openai_api_key: Optional[str] = None):
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        # OpenAI-compatible endpoint override (self-hosted models, benchmarks/stub_llm.py)
+        self.openai_base_url = os.getenv("OPENAI_BASE_URL") or None
         self.vector_store = None
         self.llm = None
         self.embeddings = None
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200
-        )
+        self._text_splitter = None
         
         # Initialize if API key is available
-        if self.openai_api_key and OPENAI_AVAILABLE:
+        if self.openai_api_key:
             self._initialize_llm_components()
         
         # Initialize local vector store
         self._initialize_vector_store()
     
+    @property
+    def text_splitter(self):
+        """LangChain text splitter, created on first use"""
+        if self._text_splitter is None:
+            from langchain.text_splitter import RecursiveCharacterTextSplitter
+            self._text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=1000,
+                chunk_overlap=200
+            )
+        return self._text_splitter
+    
     def _initialize_llm_components(self):
         """Initialize LLM and embeddings if OpenAI API key is available"""
+        try:
+            from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+        except ImportError:
+            print("langchain-openai not available, using fallback evaluation")
+            return
         try:
             self.llm = ChatOpenAI(
                 api_key=self.openai_api_key,
+                base_url=self.openai_base_url,
                 model="gpt-3.5-turbo",
                 temperature=0.3
             )
-            self.embeddings = OpenAIEmbeddings(api_key=self.openai_api_key)
+            self.embeddings = OpenAIEmbeddings(api_key=self.openai_api_key, base_url=self.openai_base_url)
         except Exception as e:
             print(f"LLM initialization failed: {e}")
             self.llm = None
             self.embeddings = None
     
     def _initialize_vector_store(self):
-        """Initialize Chroma vector store if available"""
-        try:
-            if not CHROMADB_AVAILABLE:
-                print("ChromaDB not available, skipping vector store initialization")
-                self.collection = None
-                return
-                
-            # Use sentence-transformers embeddings as fallback
+        """Initialize the configured vector index (Chroma or FAISS) if available"""
+        self.vector_index = create_vector_index()
+    
+    def add_to_vector_store(self, text: str, metadata: Dict[str, Any], doc_id: str, embedding=None):
+        """Add document to vector store if available (``embedding`` skips re-encoding the text)"""
+        if self.vector_index:
             try:
-                embedding_fn = embedding_functions.SentenceTransformerEmbeddingFunction(
-                    model_name="sentence-transformers/all-MiniLM-L6-v2"
-                )
+                if embedding is not None:
+                    self.vector_index.add_embeddings([embedding], [text], [metadata], [doc_id])
+                else:
+                    self.vector_index.add(text, metadata, doc_id)
             except Exception as e:
-                print(f"Failed to initialize embedding function: {e}")
-                if "429" in str(e) or "rate limit" in str(e).lower():
-                    print("HuggingFace rate limiting detected - ChromaDB will use default embeddings")
-                # Fall back to default embeddings
-                embedding_fn = embedding_functions.DefaultEmbeddingFunction()
-            
-            client = chromadb.PersistentClient(path="./data/chroma_db")
-            
-            # Create or get collection
-            self.collection = client.get_or_create_collection(
-                name="resume_jd_collection",
-                embedding_function=embedding_fn
-            )
-        except Exception as e:
-            print(f"Vector store initialization failed: {e}")
-            self.collection = None
+                print(f"Failed to add to vector store: {e}")
+        else:
+            print("Vector store not available, skipping document addition")
     
-    def add_to_vector_store(self, text: str, metadata: Dict[str, Any], doc_id: str):
-        """Add document to vector store if available"""
-        if self.collection:
+    def add_many_to_vector_store(self, texts: List[str], metadatas: List[Dict[str, Any]], doc_ids: List[str], embeddings=None):
+        """Add several documents in one write (``embeddings``, one row per text, skips re-encoding)"""
+        if self.vector_index:
             try:
-                self.collection.add(
-                    documents=[text],
-                    metadatas=[metadata],
-                    ids=[doc_id]
-                )
+                if embeddings is not None:
+                    self.vector_index.add_embeddings(embeddings, texts, metadatas, doc_ids)
+                else:
+                    self.vector_index.add_many(texts, metadatas, doc_ids)
             except Exception as e:
                 print(f"Failed to add to vector store: {e}")
         else:
             print("Vector store not available, skipping document addition")
-    
-    def semantic_search(self, query: str, n_results: int = 5) -> List[Dict]:
-        """Perform semantic search in vector store if available"""
-        if not self.collection:
+
+    def semantic_search(self, query: str, n_results: int = 5, where: Optional[Dict[str, Any]] = None) -> List[Dict]:
+        """Perform semantic search in vector store if available, filtering on metadata inside the query"""
+        if not self.vector_index:
             print("Vector store not available, returning empty results")
             return []
             
         try:
-            results = self.collection.query(
-                query_texts=[query],
-                n_results=n_results
-            )
-            return [
-                {
-                    "document": doc,
-                    "metadata": meta,
-                    "distance": dist
-                }
-                for doc, meta, dist in zip(
-                    results["documents"][0],
-                    results["metadatas"][0],
-                    results["distances"][0]
-                )
-            ]
+            return self.vector_index.query(query, n_results=n_results, where=where)
         except Exception as e:
             print(f"Semantic search failed: {e}")
             return []
     
-    def evaluate_with_llm(self, resume_text: str, jd_text: str) -> LLMEvaluationResult:
+    @timed("llm_evaluate")
+    def evaluate_with_llm(self, resume_text: str, jd_text: str, **precomputed) -> LLMEvaluationResult:
         """
-        Advanced LLM-powered evaluation with structured analysis
+        Advanced LLM-powered evaluation with structured analysis. ``precomputed`` (soft_score,
+        jd_skills, resume_skills) is only used by the no-LLM fallback, see ``_fallback_evaluation``
         """
         if not self.llm:
-            return self._fallback_evaluation(resume_text, jd_text)
+            return self._fallback_evaluation(resume_text, jd_text, **precomputed)
+        
+        from langchain.prompts import ChatPromptTemplate
+        from langchain.schema.runnable import RunnablePassthrough
+        from langchain.schema.output_parser import StrOutputParser
         
         # Create evaluation prompt
         evaluation_prompt = ChatPromptTemplate.from_template("""
@@ -213,21 +189,44 @@ class AdvancedLLMEvaluator:
             
         except Exception as e:
             print(f"LLM evaluation failed: {e}")
-            return self._fallback_evaluation(resume_text, jd_text)
+            LLM_FAILURES.inc()
+            return self._fallback_evaluation(resume_text, jd_text, **precomputed)
     
-    def _fallback_evaluation(self, resume_text: str, jd_text: str) -> LLMEvaluationResult:
-        """Fallback evaluation when LLM is not available"""
-        from app.nlp.embeddings import embedding_similarity
+    def _fallback_evaluation(
+        self,
+        resume_text: str,
+        jd_text: str,
+        *,
+        soft_score: Optional[float] = None,
+        jd_skills: Optional[List[str]] = None,
+        resume_skills: Optional[List[str]] = None,
+    ) -> LLMEvaluationResult:
+        """
+        Fallback evaluation when LLM is not available. The evaluator passes the soft score,
+        the job's skills (artifacts) and the resume's skills (features) it already has, so
+        nothing is encoded or extracted again; anything missing is computed from the texts.
+        """
+        FALLBACKS.inc(component="llm_evaluation")
         from app.nlp.skills import extract_candidate_skills
+        from app.nlp.taxonomy import get_taxonomy
         
-        semantic_score = embedding_similarity(resume_text, jd_text)
+        if soft_score is None:
+            from app.nlp.embeddings import embedding_similarity
+            soft_score = embedding_similarity(jd_text, resume_text)
+        semantic_score = soft_score
         
-        # Extract skills for basic gap analysis
-        resume_skills = set(extract_candidate_skills(resume_text))
-        jd_skills = set(extract_candidate_skills(jd_text))
+        # Skills for basic gap analysis, compared by canonical name; job skills keep the
+        # job's spelling so gaps line up with the evaluator's missing skills
+        taxonomy = get_taxonomy()
+        if resume_skills is None:
+            resume_skills = extract_candidate_skills(resume_text)
+        if jd_skills is None:
+            jd_skills = extract_candidate_skills(jd_text)
+        have = {taxonomy.canonical(s) for s in resume_skills}
+        jd_skills = list(dict.fromkeys(s.strip().lower() for s in jd_skills if s.strip()))
         
-        skill_gaps = list(jd_skills - resume_skills)
-        strengths = list(resume_skills & jd_skills)
+        skill_gaps = [s for s in jd_skills if taxonomy.canonical(s) not in have]
+        strengths = [s for s in jd_skills if taxonomy.canonical(s) in have]
         
         return LLMEvaluationResult(
             semantic_score=semantic_score,
@@ -248,6 +247,9 @@ class AdvancedLLMEvaluator:
         if not self.llm:
             return [f"Learn {skill} through online courses and practice projects" for skill in missing_skills[:3]]
         
+        from langchain.prompts import ChatPromptTemplate
+        from langchain.schema.output_parser import StrOutputParser
+        
         recommendations_prompt = ChatPromptTemplate.from_template("""
         Provide specific, actionable learning recommendations for these missing skills: {skills}
         
@@ -266,5 +268,27 @@ class AdvancedLLMEvaluator:
         except Exception:
             return [f"Learn {skill} through online courses and practice projects" for skill in missing_skills[:3]]
 
-# Global instance
-llm_evaluator = AdvancedLLMEvaluator()
\ No newline at end of file
+_llm_evaluator: Optional[AdvancedLLMEvaluator] = None
+_llm_evaluator_lock = threading.Lock()
+
+
+def get_llm_evaluator() -> AdvancedLLMEvaluator:
+    """Shared evaluator instance, constructed on first use"""
+    global _llm_evaluator
+    if _llm_evaluator is None:
+        with _llm_evaluator_lock:
+            if _llm_evaluator is None:
+                _llm_evaluator = AdvancedLLMEvaluator()
+    return _llm_evaluator
+
+
+def peek_llm_evaluator() -> Optional[AdvancedLLMEvaluator]:
+    """The shared evaluator if it has already been constructed, without loading it"""
+    return _llm_evaluator
+
+
+def __getattr__(name):
+    # Backwards compatibility for ``from app.services.llm_evaluator import llm_evaluator``
+    if name == "llm_evaluator":
+        return get_llm_evaluator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
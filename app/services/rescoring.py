@@ -0,0 +1,80 @@
+"""
+Recompute stored evaluation scores and verdicts from their persisted components.
+
+After changing ``HARD_MATCH_WEIGHT``, ``SOFT_MATCH_WEIGHT``, ``LLM_BLEND_WEIGHT`` or
+``VERDICT_THRESHOLDS`` run
+
+    python -m app.services.rescoring [--dry-run]
+
+or ``POST /admin/rescore``. All evaluations are scored in one vectorized pass and only
+rows whose score or verdict changed are written, in a single bulk UPDATE. Evaluations
+created before components were stored have no hard/soft score and are left unchanged.
+"""
+import argparse
+from typing import Dict
+
+import numpy as np
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.nlp.scoring import rescore_arrays
+
+
+def rescore_evaluations(db: Session, *, dry_run: bool = False) -> Dict[str, int]:
+    """Recompute score/verdict for every evaluation with stored components"""
+    rows = (
+        db.query(
+            models.Evaluation.id,
+            models.Evaluation.score,
+            models.Evaluation.verdict,
+            models.Evaluation.hard_score,
+            models.Evaluation.soft_score,
+            models.Evaluation.llm_score,
+        )
+        .filter(models.Evaluation.hard_score.isnot(None), models.Evaluation.soft_score.isnot(None))
+        .all()
+    )
+    total = db.query(models.Evaluation).count()
+    if not rows:
+        return {"total": total, "rescored": 0, "changed": 0, "skipped_without_components": total}
+
+    ids, old_scores, old_verdicts, hard, soft, llm = zip(*rows)
+    scores, verdicts = rescore_arrays(
+        np.array(hard, dtype=np.float64),
+        np.array(soft, dtype=np.float64),
+        np.array([np.nan if v is None else v for v in llm], dtype=np.float64),
+    )
+    changed = np.nonzero((scores != np.array(old_scores)) | (verdicts != np.array(old_verdicts)))[0]
+
+    if len(changed) and not dry_run:
+        # ORM bulk UPDATE by primary key: executemany of a single statement
+        db.execute(
+            update(models.Evaluation),
+            [{"id": ids[i], "score": float(scores[i]), "verdict": str(verdicts[i])} for i in changed],
+        )
+        db.commit()
+
+    return {
+        "total": total,
+        "rescored": len(rows),
+        "changed": int(len(changed)),
+        "skipped_without_components": total - len(rows),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute evaluation scores and verdicts with the current weights")
+    parser.add_argument("--dry-run", action="store_true", help="report how many rows would change without writing")
+    args = parser.parse_args()
+
+    from app.db.database import SessionLocal
+    db = SessionLocal()
+    try:
+        print(rescore_evaluations(db, dry_run=args.dry_run))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Per-resume feature bundle computed once at ingest.
+
+Normalized text, token set, skill set, extracted entities, text summary, TF-IDF term
+counts and embeddings are built when the resume is stored and kept in
+``resume_features`` (text features as one zlib-compressed JSON payload, vectors as
+float32 blobs), so evaluating the same resume against many jobs never re-runs NER,
+tokenization or the embedding model.
+"""
+import hashlib
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.utils import array_to_blob, blob_to_array
+from app.nlp import embeddings
+from app.nlp.keyword_match import tokenize
+from app.nlp.skills import extract_candidate_skills
+from app.nlp.advanced_processor import ExtractedEntities, get_text_processor
+from app.parsing.sections import resume_sections
+from app.metrics import cache_event
+
+CACHE_SIZE = 256
+
+
+@dataclass
+class ResumeFeatures:
+    resume_id: int
+    text_hash: str
+    embedding_model: Optional[str]
+    normalized_text: str
+    tokens: List[str]
+    skills: List[str]
+    entities: ExtractedEntities
+    summary: Dict[str, Any]
+    term_counts: Dict[str, int]
+    embedding: Optional[np.ndarray] = None
+    chunk_embeddings: Optional[np.ndarray] = None
+
+    def entities_dict(self) -> Dict[str, Any]:
+        return asdict(self.entities)
+
+
+def text_fingerprint(text: str) -> str:
+    return hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+
+
+def _empty_entities() -> ExtractedEntities:
+    return ExtractedEntities(
+        skills=[], experience_years=[], education=[], certifications=[],
+        technologies=[], companies=[], locations=[], contact_info={},
+    )
+
+
+def build_resume_features(resume_id: int, text: str, sections: Optional[Dict[str, str]] = None) -> ResumeFeatures:
+    """Compute the feature bundle for a resume text (runs NER and the embedding model once)"""
+    processor = get_text_processor()
+    try:
+        entities = processor.extract_entities(text, sections)
+    except Exception as e:
+        print(f"Entity extraction failed: {e}")
+        entities = _empty_entities()
+    try:
+        summary = processor.get_text_summary(text)
+    except Exception as e:
+        print(f"Text summary failed: {e}")
+        summary = {}
+
+    embedding = chunk_embeddings = None
+    model_id = embeddings.embedding_model_id()
+    if model_id is not None:
+        whole = embeddings.encode_texts([text])
+        embedding = None if whole is None else whole[0]
+        chunks = embeddings.split_into_chunks(text)
+        chunk_embeddings = embeddings.encode_chunks(chunks) if chunks else None
+        if embedding is None:
+            model_id = None
+
+    return ResumeFeatures(
+        resume_id=resume_id,
+        text_hash=text_fingerprint(text),
+        embedding_model=model_id,
+        normalized_text=" ".join(text.lower().split()),
+        tokens=sorted(set(tokenize(text))),
+        skills=extract_candidate_skills(text),
+        entities=entities,
+        summary=summary,
+        term_counts=embeddings.tfidf_term_counts(text),
+        embedding=embedding,
+        chunk_embeddings=chunk_embeddings,
+    )
+
+
+def _to_row(features: ResumeFeatures, row: models.ResumeFeature):
+    payload = {
+        "normalized_text": features.normalized_text,
+        "tokens": features.tokens,
+        "skills": features.skills,
+        "entities": features.entities_dict(),
+        "summary": features.summary,
+        "term_counts": features.term_counts,
+    }
+    row.text_hash = features.text_hash
+    row.embedding_model = features.embedding_model
+    row.embedding_dim = None if features.embedding is None else int(features.embedding.shape[-1])
+    row.embedding = array_to_blob(features.embedding)
+    row.chunk_embeddings = array_to_blob(features.chunk_embeddings)
+    row.payload = zlib.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+
+def _from_row(row: models.ResumeFeature) -> ResumeFeatures:
+    payload = json.loads(zlib.decompress(row.payload).decode("utf-8"))
+    embedding = blob_to_array(row.embedding, row.embedding_dim)
+    return ResumeFeatures(
+        resume_id=row.resume_id,
+        text_hash=row.text_hash,
+        embedding_model=row.embedding_model,
+        normalized_text=payload["normalized_text"],
+        tokens=payload["tokens"],
+        skills=payload["skills"],
+        entities=ExtractedEntities(**payload["entities"]),
+        summary=payload["summary"],
+        term_counts=payload["term_counts"],
+        embedding=None if embedding is None else embedding[0],
+        chunk_embeddings=blob_to_array(row.chunk_embeddings, row.embedding_dim),
+    )
+
+
+_cache: "OrderedDict[int, ResumeFeatures]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _remember(features: ResumeFeatures):
+    with _cache_lock:
+        _cache[features.resume_id] = features
+        _cache.move_to_end(features.resume_id)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def _is_current(features: ResumeFeatures, resume: models.Resume) -> bool:
+    if features.text_hash != text_fingerprint(resume.text):
+        return False
+    return features.embedding_model == embeddings.embedding_model_id()
+
+
+def refresh_resume_features(db: Session, resume: models.Resume) -> ResumeFeatures:
+    """Build and persist the feature bundle for ``resume``, replacing any existing one"""
+    features = build_resume_features(resume.id, resume.text, resume_sections(resume))
+    row = db.query(models.ResumeFeature).filter(models.ResumeFeature.resume_id == resume.id).first()
+    if row is None:
+        row = models.ResumeFeature(resume_id=resume.id)
+        db.add(row)
+    _to_row(features, row)
+    db.commit()
+    _remember(features)
+    return features
+
+
+def get_resume_features(db: Session, resume: models.Resume) -> ResumeFeatures:
+    """Feature bundle for ``resume`` from memory, then the database, rebuilding it if stale"""
+    with _cache_lock:
+        features = _cache.get(resume.id)
+    if features is not None and _is_current(features, resume):
+        cache_event("resume_features", hit=True)
+        return features
+    cache_event("resume_features", hit=False)
+
+    row = db.query(models.ResumeFeature).filter(models.ResumeFeature.resume_id == resume.id).first()
+    if row is not None:
+        features = _from_row(row)
+        if _is_current(features, resume):
+            _remember(features)
+            return features
+    return refresh_resume_features(db, resume)
+
+
+def get_resume_features_many(db: Session, resumes: List[models.Resume]) -> Dict[int, ResumeFeatures]:
+    """``get_resume_features`` for several resumes, reading stored rows in one query"""
+    found: Dict[int, ResumeFeatures] = {}
+    misses = []
+    for resume in resumes:
+        with _cache_lock:
+            features = _cache.get(resume.id)
+        if features is not None and _is_current(features, resume):
+            cache_event("resume_features", hit=True)
+            found[resume.id] = features
+        else:
+            cache_event("resume_features", hit=False)
+            misses.append(resume)
+    if not misses:
+        return found
+
+    rows = db.query(models.ResumeFeature).filter(
+        models.ResumeFeature.resume_id.in_([r.id for r in misses])
+    ).all()
+    stored = {row.resume_id: _from_row(row) for row in rows}
+    for resume in misses:
+        features = stored.get(resume.id)
+        if features is not None and _is_current(features, resume):
+            _remember(features)
+        else:
+            features = refresh_resume_features(db, resume)
+        found[resume.id] = features
+    return found
@@ -0,0 +1,294 @@
+"""
+Retrieval in both directions between resumes and jobs.
+
+Resumes for a job (two-stage): stage 1 gathers a few hundred candidates from the vector
+index (nearest resumes to the JD) and the resume_skills table (resumes sharing the most
+must-have skills); stage 2 reranks only those candidates with the full hard/soft scoring.
+
+Jobs for a resume: every job is scored in one vectorized pass over a compiled job matrix
+(skill incidence matrices plus the jobs' precomputed artifacts), scored like an evaluation.
+"""
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.db import crud, models
+from app.config import HARD_MATCH_WEIGHT, SOFT_MATCH_WEIGHT, EMBEDDING_CHUNKING
+from app.metrics import FALLBACKS
+from app.nlp import embeddings
+from app.nlp.embeddings import encode_texts
+from app.nlp.keyword_match import KeywordMatcher
+from app.nlp.taxonomy import get_taxonomy
+from app.nlp.scoring import weighted_score, verdict_for_score
+from app.services.job_artifacts import JobArtifacts, get_job_artifacts
+from app.services.resume_features import get_resume_features, get_resume_features_many
+
+
+def _job_vector(index, job: models.Job) -> Optional[np.ndarray]:
+    """Embedding of the JD, read from the vector index when it is already stored there"""
+    if index is not None:
+        try:
+            stored = index.get_embeddings([f"job_{job.id}"])
+            if stored:
+                return stored[f"job_{job.id}"]
+        except Exception as e:
+            print(f"Failed to read job embedding from vector index: {e}")
+    vecs = encode_texts([job.jd_text])
+    return None if vecs is None else vecs[0]
+
+
+def _vector_candidates(index, jd_vec: Optional[np.ndarray], pool: int) -> List[int]:
+    if index is None or jd_vec is None:
+        return []
+    try:
+        hits = index.query_embedding(jd_vec, n_results=pool, where={"type": "resume"})
+    except Exception as e:
+        print(f"Vector candidate retrieval failed: {e}")
+        return []
+    ids = []
+    for hit in hits:
+        resume_id = hit["metadata"].get("resume_id")
+        if resume_id is not None:
+            ids.append(int(resume_id))
+    return ids
+
+
+def top_candidates_for_job(
+    db: Session,
+    job: models.Job,
+    *,
+    limit: int = 50,
+    pool: int = 300,
+    vector_index=None,
+) -> List[Dict[str, Any]]:
+    """
+    Return the ``limit`` best-matching resumes for ``job``, ranked by the hybrid score.
+
+    ``pool`` bounds how many candidates each stage-1 source contributes. Hard and soft
+    scores are computed as in ``evaluate_resume_against_job`` (the soft score from the
+    stored resume features, so nothing is encoded here); the LLM blend is not applied.
+    """
+    artifacts = get_job_artifacts(db, job)
+    must, nice = artifacts.must, artifacts.nice
+
+    # Stage 1: candidate generation
+    jd_vec = artifacts.jd_embedding if artifacts.jd_embedding is not None else _job_vector(vector_index, job)
+    vector_ids = _vector_candidates(vector_index, jd_vec, pool)
+    # resume_skills stores canonical names; "k8s" in a JD should find kubernetes resumes
+    taxonomy = get_taxonomy()
+    job_skills = sorted({taxonomy.canonical(s) for s in must + nice})
+    skill_ids = [rid for rid, _ in crud.resumes_by_skill_overlap(db, job_skills, limit=pool)]
+
+    sources: Dict[int, str] = {}
+    for rid in vector_ids:
+        sources[rid] = "vector"
+    for rid in skill_ids:
+        sources[rid] = "both" if rid in sources else "skills"
+
+    if not sources:
+        # Nothing indexed yet: fall back to the most recent resumes
+        recent = db.query(models.Resume.id).order_by(models.Resume.id.desc()).limit(pool).all()
+        sources = {rid: "recent" for (rid,) in recent}
+
+    resumes = db.query(models.Resume).filter(models.Resume.id.in_(list(sources))).all()
+
+    # Stage 2: rerank with full scoring
+    features = get_resume_features_many(db, resumes)
+
+    ranked = []
+    for resume in resumes:
+        hard, missing, _presence = artifacts.hard_match(resume.text)
+        soft = artifacts.soft_match(resume.text, features[resume.id])
+        score = weighted_score(hard, soft)
+        ranked.append({
+            "resume_id": resume.id,
+            "student_name": resume.student_name,
+            "file_name": resume.file_name,
+            "location": resume.location,
+            "score": score,
+            "verdict": verdict_for_score(score),
+            "hard_score": round(hard, 4),
+            "soft_score": round(soft, 4),
+            "missing_skills": missing,
+            "retrieved_by": sources[resume.id],
+        })
+
+    ranked.sort(key=lambda r: r["score"], reverse=True)
+    return ranked[:limit]
+
+
+class JobMatrix:
+    """
+    All jobs compiled for vectorized scoring against a single resume.
+
+    Built from each job's precomputed ``JobArtifacts``. ``must`` and ``nice`` are
+    (jobs x skills) 0/1 incidence matrices over a shared skill vocabulary, so hard scores for
+    every job come from two matrix-vector products. Soft scores follow
+    ``JobArtifacts.soft_match`` exactly (chunk max-mean similarity over the stacked JD chunk
+    embeddings, whole-JD embeddings, then pairwise TF-IDF from stored term counts), so
+    recommendations agree with stored evaluations of the same pair.
+    """
+
+    def __init__(self, jobs: List[models.Job], artifacts: List[JobArtifacts]):
+        self.job_ids = np.array([j.id for j in jobs], dtype=np.int64)
+        self.titles = [j.title for j in jobs]
+        self.locations = [j.location for j in jobs]
+
+        must_lists = [a.must for a in artifacts]
+        nice_lists = [a.nice for a in artifacts]
+        self.vocab = sorted({s for skills in must_lists + nice_lists for s in skills})
+        col = {s: i for i, s in enumerate(self.vocab)}
+        self.matcher = KeywordMatcher(self.vocab)
+
+        self.must = np.zeros((len(jobs), len(self.vocab)), dtype=np.float32)
+        self.nice = np.zeros((len(jobs), len(self.vocab)), dtype=np.float32)
+        for row, skills in enumerate(must_lists):
+            self.must[row, [col[s] for s in skills]] = 1.0
+        for row, skills in enumerate(nice_lists):
+            self.nice[row, [col[s] for s in skills]] = 1.0
+        # Same denominators as hard_match_score
+        self.must_total = np.maximum(1, np.array([len(s) for s in must_lists], dtype=np.float32))
+        self.nice_total = np.array([len(s) for s in nice_lists], dtype=np.float32)
+
+        self.embedding_models = [a.embedding_model for a in artifacts]
+        self.term_counts = [a.term_counts for a in artifacts]
+        # Jobs scored by chunk similarity: their chunks stacked into one matrix, with the
+        # first row of each job's block for the per-job mean
+        self.chunk_rows = np.array(
+            [i for i, a in enumerate(artifacts) if EMBEDDING_CHUNKING and a.chunk_embeddings is not None and len(a.chunk_embeddings)],
+            dtype=np.int64,
+        )
+        blocks = [artifacts[i].chunk_embeddings for i in self.chunk_rows]
+        self.chunks = np.vstack(blocks).astype(np.float32) if blocks else None
+        sizes = np.array([len(b) for b in blocks], dtype=np.int64)
+        self.chunk_starts = np.concatenate(([0], np.cumsum(sizes)[:-1])) if blocks else sizes
+        self.chunk_sizes = sizes
+        # Jobs scored by whole-document similarity (embedding but no chunks)
+        self.whole_rows = np.array(
+            [i for i, a in enumerate(artifacts) if i not in set(self.chunk_rows) and a.jd_embedding is not None],
+            dtype=np.int64,
+        )
+        self.whole = (
+            np.vstack([artifacts[i].jd_embedding for i in self.whole_rows]).astype(np.float32)
+            if len(self.whole_rows) else None
+        )
+
+    def soft_scores(self, resume_text: str, features=None) -> np.ndarray:
+        """Soft score of the resume against every job, as ``JobArtifacts.soft_match`` computes it"""
+        soft = np.full(len(self.job_ids), np.nan, dtype=np.float64)
+        model_id = next((m for m in self.embedding_models if m is not None), None)
+        if features is not None and features.embedding_model != model_id:
+            features = None  # vectors from different models are not comparable
+        try:
+            if self.chunks is not None:
+                if features is not None and features.chunk_embeddings is not None:
+                    resume_chunks = features.chunk_embeddings
+                else:
+                    doc_chunks = embeddings.split_into_chunks(resume_text)
+                    resume_chunks = embeddings.encode_chunks(doc_chunks) if doc_chunks else np.zeros((0, self.chunks.shape[1]))
+                if resume_chunks is not None:
+                    if len(resume_chunks):
+                        best = (self.chunks @ resume_chunks.T).max(axis=1)
+                        sims = np.add.reduceat(best, self.chunk_starts) / self.chunk_sizes
+                    else:
+                        sims = np.zeros(len(self.chunk_rows))
+                    soft[self.chunk_rows] = np.clip(sims, 0.0, 1.0)
+            pending = np.isnan(soft)
+            if self.whole is not None and pending[self.whole_rows].any():
+                if features is not None and features.embedding is not None:
+                    resume_vec = features.embedding
+                else:
+                    vecs = embeddings.encode_texts([resume_text])
+                    resume_vec = None if vecs is None else vecs[0]
+                if resume_vec is not None:
+                    rows = self.whole_rows[pending[self.whole_rows]]
+                    soft[rows] = np.clip(self.whole[pending[self.whole_rows]] @ resume_vec, 0.0, 1.0)
+        except Exception as e:
+            print(f"Embedding soft match failed, using TF-IDF: {e}")
+
+        rest = np.nonzero(np.isnan(soft))[0]
+        if len(rest):
+            FALLBACKS.inc(len(rest), component="tfidf_similarity")
+            resume_counts = features.term_counts if features is not None else embeddings.tfidf_term_counts(resume_text)
+            for row in rest:
+                soft[row] = embeddings.tfidf_similarity(self.term_counts[row], resume_counts)
+        return soft
+
+    def score(self, resume_text: str, features=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return (final scores, hard, soft, skill presence vector) for every job"""
+        presence_map = self.matcher.presence(resume_text) if self.vocab else {}
+        present = np.array([1.0 if presence_map.get(s) else 0.0 for s in self.vocab], dtype=np.float32)
+
+        must_component = (self.must @ present) / self.must_total
+        nice_component = np.where(self.nice_total > 0, (self.nice @ present) / np.maximum(1, self.nice_total), 0.0)
+        hard = 0.8 * must_component + 0.2 * nice_component
+        soft = self.soft_scores(resume_text, features)
+
+        final = np.round(100.0 * np.clip(HARD_MATCH_WEIGHT * hard + SOFT_MATCH_WEIGHT * soft, 0.0, 1.0), 2)
+        return final, hard, soft, present
+
+
+_job_matrix: Optional[JobMatrix] = None
+_job_matrix_key = None
+_job_matrix_lock = threading.Lock()
+
+
+def invalidate_job_matrix():
+    """Drop the compiled job matrix; it is rebuilt on the next recommendation"""
+    global _job_matrix, _job_matrix_key
+    with _job_matrix_lock:
+        _job_matrix = None
+        _job_matrix_key = None
+
+
+def get_job_matrix(db: Session) -> Optional[JobMatrix]:
+    """Compiled matrix over all jobs' artifacts, rebuilt when jobs are added or removed
+    (and after edits, see ``invalidate_job_matrix``)"""
+    global _job_matrix, _job_matrix_key
+    key = tuple(db.query(func.count(models.Job.id), func.max(models.Job.id)).one())
+    with _job_matrix_lock:
+        if _job_matrix is None or _job_matrix_key != key:
+            jobs = db.query(models.Job).order_by(models.Job.id).all()
+            _job_matrix = JobMatrix(jobs, [get_job_artifacts(db, j) for j in jobs]) if jobs else None
+            _job_matrix_key = key
+        return _job_matrix
+
+
+def recommend_jobs(
+    db: Session,
+    resume_text: str,
+    *,
+    features=None,
+    limit: int = 10,
+) -> List[Dict[str, Any]]:
+    """Rank all jobs for a resume text in a single vectorized pass (``features``: the stored
+    resume's ``ResumeFeatures``, so nothing is encoded)"""
+    matrix = get_job_matrix(db)
+    if matrix is None:
+        return []
+
+    final, hard, soft, present = matrix.score(resume_text, features)
+    order = np.argsort(-final, kind="stable")[:limit]
+    results = []
+    for row in order:
+        missing_cols = np.nonzero((matrix.must[row] > 0) & (present == 0))[0]
+        score = float(final[row])
+        results.append({
+            "job_id": int(matrix.job_ids[row]),
+            "title": matrix.titles[row],
+            "location": matrix.locations[row],
+            "score": score,
+            "verdict": verdict_for_score(score),
+            "hard_score": round(float(hard[row]), 4),
+            "soft_score": round(float(soft[row]), 4),
+            "missing_skills": [matrix.vocab[c] for c in missing_cols],
+        })
+    return results
+
+
+def recommend_jobs_for_resume(db: Session, resume: models.Resume, *, limit: int = 10) -> List[Dict[str, Any]]:
+    """Rank all jobs for a stored resume from its precomputed features"""
+    return recommend_jobs(db, resume.text, features=get_resume_features(db, resume), limit=limit)
@@ -0,0 +1,592 @@
+"""
+Pluggable vector index used for semantic search over resumes and job descriptions.
+
+Two backends are available, selected with ``VECTOR_BACKEND`` in ``app/config.py``:
+  - ``chroma``: persistent Chroma collection (embeds documents itself)
+  - ``faiss``: local FAISS index (flat, IVF or HNSW) memory-mapped from disk, with
+    a SQLite side table mapping vector ids back to ``resumes.id`` / ``jobs.id``
+
+Re-adding a document id replaces its vector. HNSW graphs cannot remove vectors, so an
+HNSW index is rebuilt from its stored vectors whenever a write replaces existing ones
+(once per ``add_embeddings`` call; batch updates through ``add_many``).
+
+Query results carry a cosine ``distance`` (1 - cosine similarity) from both backends;
+Chroma collections created before the cosine default still report L2 distances.
+"""
+import json
+import os
+import sqlite3
+import sys
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.config import (
+    VECTOR_BACKEND,
+    CHROMA_PERSIST_DIR,
+    EMBEDDINGS_MODEL,
+    EMBEDDINGS_BACKEND,
+    FAISS_INDEX_DIR,
+    FAISS_INDEX_TYPE,
+    FAISS_IVF_NLIST,
+    FAISS_IVF_NPROBE,
+    FAISS_HNSW_M,
+    FAISS_HNSW_EF_SEARCH,
+    FAISS_MMAP,
+    FAISS_FLUSH_EVERY,
+)
+
+# chromadb and faiss are imported on first use to keep module import cheap
+chromadb = None
+embedding_functions = None
+faiss = None
+_chromadb_state: Optional[bool] = None
+_faiss_state: Optional[bool] = None
+
+
+def chromadb_available() -> bool:
+    """Import ChromaDB (with the SQLite fix) on first call; False if it is unavailable"""
+    global chromadb, embedding_functions, _chromadb_state
+    if _chromadb_state is None:
+        try:
+            __import__('pysqlite3')
+            sys.modules['sqlite3'] = sys.modules.pop('pysqlite3')
+            import chromadb as _chromadb
+            from chromadb.utils import embedding_functions as _embedding_functions
+            chromadb, embedding_functions = _chromadb, _embedding_functions
+            _chromadb_state = True
+        except (ImportError, RuntimeError) as e:
+            print(f"ChromaDB not available: {e}")
+            _chromadb_state = False
+    return _chromadb_state
+
+
+def faiss_available() -> bool:
+    """Import faiss on first call; False if it is not installed"""
+    global faiss, _faiss_state
+    if _faiss_state is None:
+        try:
+            import faiss as _faiss
+            faiss = _faiss
+            _faiss_state = True
+        except ImportError:
+            _faiss_state = False
+    return _faiss_state
+
+
+# Vector ids encode the document type in the high bits so they map back to table ids
+DOC_TYPE_CODES = {"resume": 1, "job": 2}
+_ID_SHIFT = 40
+# Metadata "type" values and the id prefix they are stored under
+METADATA_TYPE_PREFIXES = {"resume": "resume", "job_description": "job"}
+_IVF_POINTS_PER_CENTROID = 39  # FAISS warns when training with fewer points than this
+_EXACT_FILTER_LIMIT = 2048  # filters matching fewer vectors are searched exactly
+_FILTER_RETRIES = 3  # widen nprobe/efSearch this many times if a filtered search comes back short
+
+
+def doc_id_to_int(doc_id: str) -> int:
+    """Map a document id such as ``resume_12`` or ``job_3`` to a 64-bit vector id."""
+    prefix, _, num = doc_id.rpartition("_")
+    code = DOC_TYPE_CODES.get(prefix)
+    if code is None or not num.isdigit():
+        raise ValueError(f"Unsupported document id for vector index: {doc_id!r}")
+    return (code << _ID_SHIFT) | int(num)
+
+
+def int_to_doc_id(vector_id: int) -> str:
+    """Inverse of ``doc_id_to_int``."""
+    code = vector_id >> _ID_SHIFT
+    prefix = next(p for p, c in DOC_TYPE_CODES.items() if c == code)
+    return f"{prefix}_{vector_id & ((1 << _ID_SHIFT) - 1)}"
+
+
+def normalize_location(location: Optional[str]) -> str:
+    """Canonical form of a location stored in (and matched against) vector metadata"""
+    return " ".join((location or "").lower().split())
+
+
+class VectorIndex:
+    """
+    Common interface for vector index backends.
+
+    ``where`` filters are equality matches on metadata keys (e.g. ``type``, ``job_id``,
+    ``location``) and are applied inside the vector query, so a filtered query still
+    returns a full page of results when enough documents match.
+    """
+
+    name = "base"
+
+    def add(self, text: str, metadata: Dict[str, Any], doc_id: str):
+        self.add_many([text], [metadata], [doc_id])
+
+    def add_many(self, texts: List[str], metadatas: List[Dict[str, Any]], doc_ids: List[str]):
+        raise NotImplementedError
+
+    def add_embeddings(self, embeddings: np.ndarray, texts: List[str], metadatas: List[Dict[str, Any]], doc_ids: List[str]):
+        """Add documents with precomputed, L2-normalized embeddings"""
+        raise NotImplementedError
+
+    def query(self, query: str, n_results: int = 5, where: Optional[Dict[str, Any]] = None) -> List[Dict]:
+        raise NotImplementedError
+
+    def query_embedding(self, vector: np.ndarray, n_results: int = 5, where: Optional[Dict[str, Any]] = None) -> List[Dict]:
+        raise NotImplementedError
+
+    def get_embeddings(self, doc_ids: List[str]) -> Dict[str, np.ndarray]:
+        """Return stored embeddings for the given documents (missing ids are omitted)"""
+        raise NotImplementedError
+
+    def count(self) -> int:
+        raise NotImplementedError
+
+    def flush(self):
+        """Persist pending changes (no-op for backends that write through)"""
+
+
+class _EncodeTextsEmbeddingFunction:
+    """Chroma embedding function backed by app.nlp.embeddings (so it follows EMBEDDINGS_BACKEND)"""
+
+    def __call__(self, input):
+        from app.nlp.embeddings import encode_texts
+        vecs = encode_texts(list(input))
+        if vecs is None:
+            raise RuntimeError("No embedding model available")
+        return vecs.tolist()
+
+
+class ChromaVectorIndex(VectorIndex):
+    """Vector index backed by a persistent Chroma collection"""
+
+    name = "chroma"
+
+    def __init__(self, path: str = CHROMA_PERSIST_DIR, collection_name: str = "resume_jd_collection", metadata: Optional[Dict[str, Any]] = None):
+        if not chromadb_available():
+            raise RuntimeError("ChromaDB not available")
+
+        # Use sentence-transformers embeddings as fallback
+        try:
+            if EMBEDDINGS_BACKEND == "onnx":
+                embedding_fn = _EncodeTextsEmbeddingFunction()
+            else:
+                embedding_fn = embedding_functions.SentenceTransformerEmbeddingFunction(
+                    model_name=EMBEDDINGS_MODEL
+                )
+        except Exception as e:
+            print(f"Failed to initialize embedding function: {e}")
+            if "429" in str(e) or "rate limit" in str(e).lower():
+                print("HuggingFace rate limiting detected - ChromaDB will use default embeddings")
+            # Fall back to default embeddings
+            embedding_fn = embedding_functions.DefaultEmbeddingFunction()
+
+        client = chromadb.PersistentClient(path=path)
+
+        # New collections use cosine distance like the FAISS index. The space of an existing
+        # collection cannot be changed; collections created before use L2 (squared, 2 - 2cos
+        # for normalized embeddings) until rebuilt
+        try:
+            self.collection = client.get_collection(name=collection_name, embedding_function=embedding_fn)
+        except Exception:
+            self.collection = client.get_or_create_collection(
+                name=collection_name,
+                embedding_function=embedding_fn,
+                metadata=metadata or {"hnsw:space": "cosine"},
+            )
+        space = (self.collection.metadata or {}).get("hnsw:space", "l2")
+        if space != "cosine":
+            print(f"Chroma collection {collection_name!r} uses {space} distance; FAISS and new collections use cosine")
+
+    def add_many(self, texts, metadatas, doc_ids):
+        self.collection.upsert(documents=list(texts), metadatas=list(metadatas), ids=list(doc_ids))
+
+    def add_embeddings(self, embeddings, texts, metadatas, doc_ids):
+        self.collection.upsert(
+            embeddings=np.asarray(embeddings, dtype=np.float32).tolist(),
+            documents=list(texts),
+            metadatas=list(metadatas),
+            ids=list(doc_ids),
+        )
+
+    def query(self, query, n_results=5, where=None):
+        return self._format(self.collection.query(query_texts=[query], n_results=n_results, where=self._where(where)))
+
+    def query_embedding(self, vector, n_results=5, where=None):
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1).tolist()
+        return self._format(self.collection.query(query_embeddings=[vector], n_results=n_results, where=self._where(where)))
+
+    @staticmethod
+    def _where(where: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        clauses = [{key: {"$eq": value}} for key, value in (where or {}).items()]
+        if not clauses:
+            return None
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+    def get_embeddings(self, doc_ids):
+        if not doc_ids:
+            return {}
+        got = self.collection.get(ids=list(doc_ids), include=["embeddings"])
+        return {
+            doc_id: np.asarray(vec, dtype=np.float32)
+            for doc_id, vec in zip(got["ids"], got["embeddings"])
+        }
+
+    def count(self):
+        return self.collection.count()
+
+    @staticmethod
+    def _format(results) -> List[Dict]:
+        return [
+            {
+                "document": doc,
+                "metadata": meta,
+                "distance": dist
+            }
+            for doc, meta, dist in zip(
+                results["documents"][0],
+                results["metadatas"][0],
+                results["distances"][0]
+            )
+        ]
+
+
+class FaissVectorIndex(VectorIndex):
+    """
+    Local FAISS index over L2-normalized embeddings (inner product == cosine).
+
+    The index file is memory-mapped on load when ``FAISS_MMAP`` is set and reloaded
+    into memory on the first write. IVF indexes start as a flat index and are trained
+    once enough vectors have been added. Documents and metadata live in a SQLite side
+    table keyed by vector id.
+    """
+
+    name = "faiss"
+
+    def __init__(
+        self,
+        path: str = FAISS_INDEX_DIR,
+        index_type: str = FAISS_INDEX_TYPE,
+        *,
+        nlist: int = FAISS_IVF_NLIST,
+        nprobe: int = FAISS_IVF_NPROBE,
+        hnsw_m: int = FAISS_HNSW_M,
+        ef_search: int = FAISS_HNSW_EF_SEARCH,
+        mmap: bool = FAISS_MMAP,
+        flush_every: int = FAISS_FLUSH_EVERY,
+    ):
+        if not faiss_available():
+            raise RuntimeError("faiss not available")
+        if index_type not in ("flat", "ivf", "hnsw"):
+            raise ValueError(f"Unknown FAISS index type: {index_type}")
+
+        self.path = path
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+        self.mmap = mmap
+        self.flush_every = max(1, flush_every)
+
+        self.index = None
+        self._mmapped = False
+        self._pending = 0
+        self._lock = threading.RLock()
+
+        os.makedirs(path, exist_ok=True)
+        self.index_path = os.path.join(path, "index.faiss")
+        self._meta = sqlite3.connect(os.path.join(path, "docs.sqlite3"), check_same_thread=False)
+        self._meta.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            "vector_id INTEGER PRIMARY KEY, doc_id TEXT NOT NULL, document TEXT, metadata TEXT)"
+        )
+        # Expression indexes keep metadata filters from scanning the whole table
+        for key in ("type", "job_id", "location"):
+            self._meta.execute(
+                f"CREATE INDEX IF NOT EXISTS docs_{key} ON docs (json_extract(metadata, '$.{key}'))"
+            )
+        self._meta.commit()
+
+        if os.path.exists(self.index_path):
+            self._load()
+
+    # Index lifecycle
+
+    def _load(self):
+        if self.mmap:
+            try:
+                self.index = faiss.read_index(self.index_path, faiss.IO_FLAG_MMAP)
+                self._mmapped = True
+            except Exception as e:
+                print(f"FAISS mmap load failed, reading into memory: {e}")
+        if self.index is None:
+            self.index = faiss.read_index(self.index_path)
+            self._mmapped = False
+        self._apply_search_params()
+
+    def _ensure_writable(self):
+        """Memory-mapped indexes are read-only; reload into memory before mutating"""
+        if self._mmapped:
+            self.index = faiss.read_index(self.index_path)
+            self._mmapped = False
+            self._apply_search_params()
+
+    def _new_index(self, dim: int):
+        if self.index_type == "hnsw":
+            base = faiss.IndexHNSWFlat(dim, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            base.hnsw.efConstruction = max(base.hnsw.efConstruction, 2 * self.ef_search)
+        else:
+            # IVF indexes are buffered in a flat index until there is enough data to train
+            base = faiss.IndexFlatIP(dim)
+        return faiss.IndexIDMap2(base)
+
+    def _is_ivf(self) -> bool:
+        return isinstance(faiss.downcast_index(self.index), faiss.IndexIVF)
+
+    def _apply_search_params(self):
+        if self.index is None:
+            return
+        inner = faiss.downcast_index(self.index)
+        if isinstance(inner, faiss.IndexIVF):
+            inner.nprobe = self.nprobe
+        elif isinstance(inner, faiss.IndexIDMap):
+            base = faiss.downcast_index(inner.index)
+            if isinstance(base, faiss.IndexHNSW):
+                base.hnsw.efSearch = self.ef_search
+
+    def _maybe_train_ivf(self):
+        """Convert the flat buffer into a trained IVF index once it holds enough vectors"""
+        if self.index_type != "ivf" or self._is_ivf():
+            return
+        n = self.index.ntotal
+        if n < self.nlist * _IVF_POINTS_PER_CENTROID:
+            return
+        ids = faiss.vector_to_array(self.index.id_map).astype(np.int64)
+        vecs = self.index.index.reconstruct_n(0, n)
+        quantizer = faiss.IndexFlatIP(self.index.d)
+        ivf = faiss.IndexIVFFlat(quantizer, self.index.d, self.nlist, faiss.METRIC_INNER_PRODUCT)
+        ivf.train(vecs)
+        # Hashtable direct map keeps remove_ids and reconstruct working with custom ids
+        ivf.set_direct_map_type(faiss.DirectMap.Hashtable)
+        ivf.add_with_ids(vecs, ids)
+        self.index = ivf
+        self._apply_search_params()
+
+    def flush(self):
+        with self._lock:
+            if self.index is None or self._pending == 0:
+                return
+            tmp_path = self.index_path + ".tmp"
+            faiss.write_index(self.index, tmp_path)
+            os.replace(tmp_path, self.index_path)
+            self._meta.commit()
+            self._pending = 0
+
+    # Writes
+
+    def add_many(self, texts, metadatas, doc_ids):
+        from app.nlp.embeddings import encode_texts
+
+        vecs = encode_texts(list(texts))
+        if vecs is None:
+            raise RuntimeError("No embedding model available for FAISS index")
+        self.add_embeddings(vecs, texts, metadatas, doc_ids)
+        if len(doc_ids) > 1:
+            self.flush()
+
+    def add_embeddings(self, embeddings, texts, metadatas, doc_ids):
+        vecs = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if vecs.ndim == 1:
+            vecs = vecs.reshape(1, -1)
+        ids = np.array([doc_id_to_int(d) for d in doc_ids], dtype=np.int64)
+
+        with self._lock:
+            if self.index is None:
+                self.index = self._new_index(vecs.shape[1])
+                self._apply_search_params()
+            self._ensure_writable()
+
+            existing = self._existing_ids(ids)
+            if existing:
+                if self._is_hnsw():
+                    self._rebuild_without(existing)
+                else:
+                    self.index.remove_ids(np.array(sorted(existing), dtype=np.int64))
+
+            self.index.add_with_ids(vecs, ids)
+            self._meta.executemany(
+                "INSERT OR REPLACE INTO docs (vector_id, doc_id, document, metadata) VALUES (?, ?, ?, ?)",
+                [
+                    (doc_id_to_int(d), d, t, json.dumps(m or {}))
+                    for d, t, m in zip(doc_ids, texts, metadatas)
+                ],
+            )
+            self._maybe_train_ivf()
+            self._pending += len(doc_ids)
+            if self._pending >= self.flush_every:
+                self.flush()
+
+    def _is_hnsw(self) -> bool:
+        inner = faiss.downcast_index(self.index)
+        return isinstance(inner, faiss.IndexIDMap) and isinstance(faiss.downcast_index(inner.index), faiss.IndexHNSW)
+
+    def _rebuild_without(self, stale: set):
+        """HNSW graphs cannot remove vectors: rebuild the index from the stored vectors
+        other than ``stale`` (the caller adds their replacements)"""
+        n = self.index.ntotal
+        ids = faiss.vector_to_array(self.index.id_map).astype(np.int64)
+        keep = np.array([int(i) not in stale for i in ids], dtype=bool)
+        vecs = self.index.index.reconstruct_n(0, n)[keep]
+        print(f"FAISS HNSW: rebuilding index ({n} vectors) to replace {len(stale)}")
+        self.index = self._new_index(self.index.d)
+        self._apply_search_params()
+        if len(vecs):
+            self.index.add_with_ids(vecs, ids[keep])
+
+    def _existing_ids(self, ids: np.ndarray) -> set:
+        placeholders = ",".join("?" * len(ids))
+        rows = self._meta.execute(
+            f"SELECT vector_id FROM docs WHERE vector_id IN ({placeholders})", [int(i) for i in ids]
+        ).fetchall()
+        return {r[0] for r in rows}
+
+    # Reads
+
+    def query(self, query, n_results=5, where=None):
+        from app.nlp.embeddings import encode_texts
+
+        vecs = encode_texts([query])
+        if vecs is None:
+            raise RuntimeError("No embedding model available for FAISS index")
+        return self.query_embedding(vecs[0], n_results, where=where)
+
+    def query_embedding(self, vector, n_results=5, where=None):
+        with self._lock:
+            if self.index is None or self.index.ntotal == 0:
+                return []
+            q = np.ascontiguousarray(np.asarray(vector, dtype=np.float32).reshape(1, -1))
+            if where:
+                hits = self._filtered_search(q, n_results, where)
+            else:
+                scores, ids = self.index.search(q, n_results)
+                hits = [(int(i), float(s)) for i, s in zip(ids[0], scores[0]) if i != -1]
+            return self._hydrate(hits)
+
+    def _filter_sql(self, where: Dict[str, Any]):
+        """Translate an equality filter into a WHERE clause over the side table"""
+        clauses, params = [], []
+        for key, value in where.items():
+            if key == "type" and value in METADATA_TYPE_PREFIXES:
+                # Document type is encoded in the vector id, so this is a primary key range
+                code = DOC_TYPE_CODES[METADATA_TYPE_PREFIXES[value]]
+                clauses.append("vector_id BETWEEN ? AND ?")
+                params.extend([code << _ID_SHIFT, ((code + 1) << _ID_SHIFT) - 1])
+            else:
+                clauses.append(f"json_extract(metadata, '$.{key}') = ?")
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def _filtered_search(self, q: np.ndarray, k: int, where: Dict[str, Any]):
+        clause, params = self._filter_sql(where)
+        matching = self._meta.execute(f"SELECT COUNT(*) FROM docs WHERE {clause}", params).fetchone()[0]
+        if matching == 0:
+            return []
+
+        if matching <= _EXACT_FILTER_LIMIT:
+            # Small candidate sets: score every matching vector exactly
+            ids = np.array(
+                [r[0] for r in self._meta.execute(f"SELECT vector_id FROM docs WHERE {clause}", params)],
+                dtype=np.int64,
+            )
+            vecs = np.vstack([self.index.reconstruct(int(i)) for i in ids])
+            scores = vecs @ q[0]
+            top = np.argsort(-scores)[:k]
+            return [(int(ids[i]), float(scores[i])) for i in top]
+
+        if list(where) == ["type"] and where["type"] in METADATA_TYPE_PREFIXES:
+            lo, hi = params
+            selector = faiss.IDSelectorRange(lo, hi + 1)
+        else:
+            ids = np.array(
+                [r[0] for r in self._meta.execute(f"SELECT vector_id FROM docs WHERE {clause}", params)],
+                dtype=np.int64,
+            )
+            selector = faiss.IDSelectorBatch(ids)
+
+        # Graph/IVF search under a filter can come back short; widen the search only then
+        want = min(k, matching)
+        nprobe, ef = self.nprobe, self.ef_search
+        hits = []
+        for _ in range(_FILTER_RETRIES):
+            scores, ids = self.index.search(q, k, params=self._search_params(selector, nprobe, ef))
+            hits = [(int(i), float(s)) for i, s in zip(ids[0], scores[0]) if i != -1]
+            if len(hits) >= want:
+                break
+            nprobe, ef = nprobe * 4, ef * 4
+        return hits
+
+    def _search_params(self, selector, nprobe: int, ef: int):
+        inner = faiss.downcast_index(self.index)
+        if isinstance(inner, faiss.IndexIVF):
+            return faiss.SearchParametersIVF(sel=selector, nprobe=min(nprobe, inner.nlist))
+        base = faiss.downcast_index(inner.index)
+        if isinstance(base, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=max(ef, 1))
+        return faiss.SearchParameters(sel=selector)
+
+    def _hydrate(self, hits) -> List[Dict]:
+        if not hits:
+            return []
+        placeholders = ",".join("?" * len(hits))
+        rows = self._meta.execute(
+            f"SELECT vector_id, document, metadata FROM docs WHERE vector_id IN ({placeholders})",
+            [i for i, _ in hits],
+        ).fetchall()
+        by_id = {r[0]: r for r in rows}
+        results = []
+        for vector_id, score in hits:
+            row = by_id.get(vector_id)
+            if row is None:
+                continue
+            results.append({
+                "document": row[1],
+                "metadata": json.loads(row[2] or "{}"),
+                "distance": 1.0 - score,  # cosine distance, as in a cosine-space Chroma collection
+            })
+        return results
+
+    def get_embeddings(self, doc_ids):
+        if not doc_ids:
+            return {}
+        with self._lock:
+            if self.index is None:
+                return {}
+            ids = [doc_id_to_int(d) for d in doc_ids]
+            present = self._existing_ids(np.array(ids, dtype=np.int64))
+            return {
+                doc_id: self.index.reconstruct(vector_id)
+                for doc_id, vector_id in zip(doc_ids, ids)
+                if vector_id in present
+            }
+
+    def count(self):
+        with self._lock:
+            return 0 if self.index is None else int(self.index.ntotal)
+
+
+def create_vector_index(backend: str = VECTOR_BACKEND) -> Optional[VectorIndex]:
+    """Create the configured vector index, or None if the backend is unavailable"""
+    try:
+        if backend == "faiss":
+            index = FaissVectorIndex()
+            import atexit
+            atexit.register(index.flush)
+            return index
+        if backend != "chroma":
+            print(f"Unknown vector backend {backend!r}, using chroma")
+        if not chromadb_available():
+            print("ChromaDB not available, skipping vector store initialization")
+            return None
+        return ChromaVectorIndex()
+    except Exception as e:
+        print(f"Vector store initialization failed: {e}")
+        return None
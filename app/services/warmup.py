@@ -0,0 +1,64 @@
+"""
+Explicit warm-up hook for the lazily loaded NLP/LLM components.
+
+Importing the API or the Streamlit app no longer loads any models; each component loads
+on first use. Call ``warm_up()`` (or ``warm_up_in_background()``) to pay that cost ahead
+of the first request instead.
+"""
+import threading
+import time
+from typing import Dict, Iterable
+
+COMPONENTS = ("embeddings", "text_processor", "llm_evaluator")
+
+_status: Dict[str, float] = {}
+_status_lock = threading.Lock()
+_background_thread = None
+
+
+def _load(component: str):
+    if component == "embeddings":
+        from app.nlp import embeddings
+        embeddings.warm_up()
+    elif component == "text_processor":
+        from app.nlp import advanced_processor
+        advanced_processor.warm_up()
+    elif component == "llm_evaluator":
+        from app.services.llm_evaluator import get_llm_evaluator
+        get_llm_evaluator()
+    else:
+        raise ValueError(f"Unknown component: {component}")
+
+
+def warm_up(components: Iterable[str] = COMPONENTS) -> Dict[str, float]:
+    """Load the given components now; returns seconds spent loading each one"""
+    timings = {}
+    for component in components:
+        start = time.perf_counter()
+        try:
+            _load(component)
+        except Exception as e:
+            print(f"Warm-up of {component} failed: {e}")
+            continue
+        timings[component] = round(time.perf_counter() - start, 3)
+        with _status_lock:
+            _status[component] = timings[component]
+    return timings
+
+
+def warm_up_in_background(components: Iterable[str] = COMPONENTS) -> threading.Thread:
+    """Run ``warm_up`` on a daemon thread so startup is not blocked (once per process)"""
+    global _background_thread
+    with _status_lock:
+        if _background_thread is None:
+            _background_thread = threading.Thread(
+                target=warm_up, args=(tuple(components),), name="warm-up", daemon=True
+            )
+            _background_thread.start()
+        return _background_thread
+
+
+def warm_up_status() -> Dict[str, float]:
+    """Components warmed up so far, with their load time in seconds"""
+    with _status_lock:
+        return dict(_status)
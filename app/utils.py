@@ -16,3 +16,17 @@ def loads_json(value: str):
         return json.loads(value) if value else None
     except Exception:
         return None
+
+
+def array_to_blob(values) -> bytes:
+    """Pack a numpy array as raw float32 bytes (None passes through)"""
+    import numpy as np
+    return None if values is None else np.ascontiguousarray(values, dtype=np.float32).tobytes()
+
+
+def blob_to_array(blob: bytes, dim: int):
+    """Inverse of ``array_to_blob``: a (rows x dim) float32 array, or None"""
+    import numpy as np
+    if blob is None or not dim:
+        return None
+    return np.frombuffer(blob, dtype=np.float32).reshape(-1, dim)
@@ -0,0 +1,218 @@
+"""
+Data access for the Streamlit app.
+
+``get_backend()`` returns the backend chosen by ``WEB_BACKEND``:
+
+- ``local`` (``app.web.local_backend``): the database and the evaluation stack run inside
+  the Streamlit process.
+- ``api``: Streamlit is a thin client of the FastAPI app (``app.api.main``) at
+  ``API_BASE_URL``. Models and the database live only in the API workers, so the two tiers
+  scale independently. Requests share one pooled keep-alive session.
+
+Both return the same row snapshots (``app.web.cache``) and evaluation reports (the API's
+``AdvancedEvaluationResponse`` shape), so pages do not know which one they talk to.
+"""
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.config import WEB_BACKEND, API_BASE_URL, API_TIMEOUT_SECONDS, API_POOL_SIZE
+from app.web.cache import JobRow, ResumeRow, EvaluationRow, ApplicationRow
+
+
+class BackendError(RuntimeError):
+    """The API answered with an error"""
+
+
+def _datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _job(d: Dict[str, Any]) -> JobRow:
+    return JobRow(
+        id=d["id"],
+        title=d["title"],
+        location=d.get("location"),
+        jd_text=d.get("jd_text") or "",
+        must_skills=tuple(d.get("must_skills") or ()),
+        nice_skills=tuple(d.get("nice_skills") or ()),
+        qualifications=d.get("qualifications"),
+        created_at=_datetime(d.get("created_at")),
+    )
+
+
+def _resume(d: Dict[str, Any]) -> ResumeRow:
+    return ResumeRow(
+        id=d["id"],
+        student_name=d.get("student_name"),
+        file_name=d.get("file_name"),
+        location=d.get("location"),
+        text=d.get("text") or "",
+        created_at=_datetime(d.get("created_at")),
+    )
+
+
+class ApiBackend:
+    name = "api"
+
+    def __init__(self, base_url: str = API_BASE_URL, timeout: float = API_TIMEOUT_SECONDS, pool_size: int = API_POOL_SIZE):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        # Connections are kept alive and reused across reruns and Streamlit sessions; only
+        # idempotent reads are retried
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504), allowed_methods=frozenset({"GET"}))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _request(self, method: str, path: str, *, profile: bool = False, **kwargs):
+        headers = {"X-Profile": "1"} if profile else None
+        response = self.session.request(method, self.base_url + path, timeout=self.timeout, headers=headers, **kwargs)
+        if response.status_code >= 400:
+            try:
+                detail = response.json().get("detail", response.text)
+            except ValueError:
+                detail = response.text
+            raise BackendError(f"{method} {path} failed ({response.status_code}): {detail}")
+        return response
+
+    def _json(self, method: str, path: str, **kwargs):
+        return self._request(method, path, **kwargs).json()
+
+    # Lists
+
+    def list_jobs(self) -> List[JobRow]:
+        return [_job(d) for d in self._json("GET", "/jobs/")]
+
+    def list_resumes(self) -> List[ResumeRow]:
+        return [_resume(d) for d in self._json("GET", "/resumes/")]
+
+    def list_evaluations(self) -> List[EvaluationRow]:
+        jobs: Dict[int, JobRow] = {}
+        rows = []
+        for d in self._json("GET", "/evaluations/"):
+            if d.get("job") and d["job_id"] not in jobs:
+                jobs[d["job_id"]] = _job(d["job"])
+            rows.append(EvaluationRow(
+                id=d["id"],
+                job_id=d["job_id"],
+                resume_id=d["resume_id"],
+                score=d["score"],
+                verdict=d["verdict"],
+                missing=tuple(d.get("missing_skills") or ()),
+                suggestions=d.get("suggestions"),
+                created_at=_datetime(d.get("created_at")),
+                job=jobs.get(d["job_id"]),
+                resume=_resume(d["resume"]) if d.get("resume") else None,
+            ))
+        return rows
+
+    def list_applications(self) -> List[ApplicationRow]:
+        return [
+            ApplicationRow(
+                id=d["id"],
+                job_id=d["job_id"],
+                student_name=d["student_name"],
+                email=d["email"],
+                phone=d.get("phone"),
+                location=d.get("location"),
+                resume_file_name=d.get("resume_file_name"),
+                resume_text=d.get("resume_text") or "",
+                cover_letter=d.get("cover_letter"),
+                status=d["status"],
+                evaluation_id=d.get("evaluation_id"),
+                created_at=_datetime(d.get("created_at")),
+            )
+            for d in self._json("GET", "/student-applications/")
+        ]
+
+    # Jobs
+
+    def parse_jd(self, jd_text: str) -> Dict[str, Any]:
+        return self._json("POST", "/jobs/parse", json={"jd_text": jd_text})
+
+    def create_job(self, *, title: str, jd_text: str, must_skills: List[str], nice_skills: List[str], location: str = "") -> JobRow:
+        body = {"title": title, "jd_text": jd_text, "must_skills": must_skills, "nice_skills": nice_skills, "location": location}
+        return _job(self._json("POST", "/jobs/", json=body))
+
+    def recommend_jobs(self, resume_text: str, limit: int = 5) -> List[Dict[str, Any]]:
+        return self._json("POST", "/jobs/recommend", json={"resume_text": resume_text, "limit": limit})["recommendations"]
+
+    # Evaluations
+
+    def evaluate_file(self, *, job_id: int, student_name: str, file_name: str, content: bytes, location: str = "", profile: bool = False) -> Dict[str, Any]:
+        """Evaluation report (``AdvancedEvaluationResponse`` shape) for an uploaded resume"""
+        params = {"job_id": job_id, "student_name": student_name, "location": location}
+        return self._json("POST", "/evaluate/", params=params, files={"file": (file_name, content)}, profile=profile)
+
+    def evaluate_text(self, *, job_id: int, student_name: str, resume_text: str, file_name: str = "", location: str = "", profile: bool = False) -> Dict[str, Any]:
+        body = {"job_id": job_id, "student_name": student_name, "resume_text": resume_text, "file_name": file_name, "location": location}
+        return self._json("POST", "/evaluate/text", json=body, profile=profile)
+
+    def resume_entities(self, resume_id: int) -> Dict[str, Any]:
+        return self._json("GET", f"/resumes/{resume_id}/features")["extracted_entities"]
+
+    def export_evaluations_csv(self, **filters) -> bytes:
+        params = {k: v for k, v in filters.items() if v is not None}
+        if params.get("skills"):
+            params["skills"] = ",".join(params["skills"])
+        return self._request("GET", "/export/evaluations", params={"format": "csv", **params}).content
+
+    # Applications
+
+    def submit_application(
+        self, *, job_id: int, student_name: str, email: str, phone: str, location: str,
+        cover_letter: str, file_name: str, content: bytes, profile: bool = False,
+    ) -> int:
+        """Store the application and score it for the admin review; returns its id"""
+        form = {
+            "job_id": job_id, "student_name": student_name, "email": email,
+            "phone": phone, "location": location, "cover_letter": cover_letter,
+        }
+        result = self._json(
+            "POST", "/student-applications/", params={"evaluate": "true"},
+            data=form, files={"file": (file_name, content)}, profile=profile,
+        )
+        return result["id"]
+
+    def update_application_status(self, application_id: int, status: str):
+        self._request("PUT", f"/student-applications/{application_id}/status", params={"status": status})
+
+    # Operations
+
+    def list_traces(self) -> List[Dict[str, Any]]:
+        return self._json("GET", "/admin/profiles")["traces"]
+
+    def trace_data(self, trace_id: str, kind: str) -> Optional[bytes]:
+        fmt = "prof" if kind == "prof" else "json"
+        try:
+            return self._request("GET", f"/admin/profiles/{trace_id}", params={"format": fmt}).content
+        except BackendError:
+            return None
+
+    def warm_up(self):
+        # The API workers load their own models (WARM_UP_ON_STARTUP on the API side)
+        pass
+
+
+_backend = None
+_lock = threading.Lock()
+
+
+def get_backend():
+    """The process-wide backend for ``WEB_BACKEND`` (created on first use)"""
+    global _backend
+    if _backend is None:
+        with _lock:
+            if _backend is None:
+                if WEB_BACKEND == "api":
+                    _backend = ApiBackend()
+                else:
+                    from app.web.local_backend import LocalBackend
+                    _backend = LocalBackend()
+    return _backend
@@ -0,0 +1,219 @@
+"""
+Cached row snapshots for the Streamlit pages.
+
+Every widget interaction reruns the page script, which used to re-query jobs,
+evaluations, resumes and applications on each rerun. Lists are now loaded once per TTL
+per process through the configured backend (``app.web.backend``: the database or the
+API), shared across sessions and returned as frozen snapshots (plain values, no ORM
+objects or open sessions). Writes made through the Streamlit app call ``invalidate`` so
+they show up on the next rerun; writes made elsewhere (the API, other processes) show up
+once the TTL expires.
+"""
+import json
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.config import WEB_JOBS_TTL_SECONDS, WEB_RESULTS_TTL_SECONDS
+from app.metrics import cache_event
+
+
+@dataclass(frozen=True)
+class JobRow:
+    id: int
+    title: str
+    location: Optional[str]
+    jd_text: str
+    must_skills: Tuple[str, ...]
+    nice_skills: Tuple[str, ...]
+    qualifications: Optional[str]
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class ResumeRow:
+    id: int
+    student_name: Optional[str]
+    file_name: Optional[str]
+    location: Optional[str]
+    text: str
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class EvaluationRow:
+    id: int
+    job_id: int
+    resume_id: int
+    score: float
+    verdict: str
+    missing: Tuple[str, ...]
+    suggestions: Optional[str]
+    created_at: datetime
+    job: Optional[JobRow]
+    resume: Optional[ResumeRow]
+
+
+@dataclass(frozen=True)
+class ApplicationRow:
+    id: int
+    job_id: int
+    student_name: str
+    email: str
+    phone: Optional[str]
+    location: Optional[str]
+    resume_file_name: Optional[str]
+    resume_text: str
+    cover_letter: Optional[str]
+    status: str
+    evaluation_id: Optional[int]
+    created_at: datetime
+
+
+def _skills(raw: Optional[str]) -> Tuple[str, ...]:
+    return tuple(json.loads(raw or "[]"))
+
+
+def job_row(job) -> JobRow:
+    return JobRow(
+        id=job.id,
+        title=job.title,
+        location=job.location,
+        jd_text=job.jd_text,
+        must_skills=_skills(job.must_skills_json),
+        nice_skills=_skills(job.nice_skills_json),
+        qualifications=job.qualifications,
+        created_at=job.created_at,
+    )
+
+
+def resume_row(resume) -> ResumeRow:
+    return ResumeRow(
+        id=resume.id,
+        student_name=resume.student_name,
+        file_name=resume.file_name,
+        location=resume.location,
+        text=resume.text,
+        created_at=resume.created_at,
+    )
+
+
+def evaluation_row(ev, jobs: Dict[int, JobRow]) -> EvaluationRow:
+    job = jobs.get(ev.job_id)
+    if job is None and ev.job is not None:
+        job = job_row(ev.job)
+    return EvaluationRow(
+        id=ev.id,
+        job_id=ev.job_id,
+        resume_id=ev.resume_id,
+        score=ev.score,
+        verdict=ev.verdict,
+        missing=_skills(ev.missing_json),
+        suggestions=ev.suggestions,
+        created_at=ev.created_at,
+        job=job,
+        resume=resume_row(ev.resume) if ev.resume else None,
+    )
+
+
+def application_row(app) -> ApplicationRow:
+    return ApplicationRow(
+        id=app.id,
+        job_id=app.job_id,
+        student_name=app.student_name,
+        email=app.email,
+        phone=app.phone,
+        location=app.location,
+        resume_file_name=app.resume_file_name,
+        resume_text=app.resume_text,
+        cover_letter=app.cover_letter,
+        status=app.status,
+        evaluation_id=app.evaluation_id,
+        created_at=app.created_at,
+    )
+
+
+# name -> (loaded_at, snapshot); versions are bumped by ``invalidate`` so a load that
+# raced with a write is not stored
+_cache: Dict[str, Tuple[float, tuple]] = {}
+_versions: Dict[str, int] = {}
+_lock = threading.Lock()
+
+NAMES = ("jobs", "evaluations", "resumes", "applications")
+
+
+def _backend():
+    # Imported here: the backends build the snapshot types defined above
+    from app.web.backend import get_backend
+    return get_backend()
+
+
+def _cached(name: str, ttl: float, load: Callable) -> tuple:
+    now = time.monotonic()
+    with _lock:
+        entry = _cache.get(name)
+        version = _versions.get(name, 0)
+    if entry is not None and now - entry[0] < ttl:
+        cache_event("web_" + name, hit=True)
+        return entry[1]
+    cache_event("web_" + name, hit=False)
+
+    snapshot = tuple(load())
+    with _lock:
+        if _versions.get(name, 0) == version:
+            _cache[name] = (now, snapshot)
+    return snapshot
+
+
+def jobs() -> Tuple[JobRow, ...]:
+    """All jobs, newest first"""
+    return _cached("jobs", WEB_JOBS_TTL_SECONDS, lambda: _backend().list_jobs())
+
+
+def resumes() -> Tuple[ResumeRow, ...]:
+    """All resumes, newest first"""
+    return _cached("resumes", WEB_RESULTS_TTL_SECONDS, lambda: _backend().list_resumes())
+
+
+def evaluations(
+    *,
+    job_id: Optional[int] = None,
+    min_score: Optional[float] = None,
+    location: Optional[str] = None,
+) -> List[EvaluationRow]:
+    """Evaluations, best score first, filtered like ``crud.list_evaluations``"""
+    rows = _cached("evaluations", WEB_RESULTS_TTL_SECONDS, lambda: _backend().list_evaluations())
+    if job_id:
+        rows = [e for e in rows if e.job_id == job_id]
+    if min_score is not None:
+        rows = [e for e in rows if e.score >= float(min_score)]
+    if location:
+        rows = [e for e in rows if e.resume and location.lower() in (e.resume.location or "").lower()]
+    return list(rows)
+
+
+def applications(*, job_id: Optional[int] = None, status: Optional[str] = None) -> List[ApplicationRow]:
+    """Student applications, newest first, filtered like ``crud.list_student_applications``"""
+    rows = _cached("applications", WEB_RESULTS_TTL_SECONDS, lambda: _backend().list_applications())
+    if job_id:
+        rows = [a for a in rows if a.job_id == job_id]
+    if status:
+        rows = [a for a in rows if a.status == status]
+    return list(rows)
+
+
+@lru_cache(maxsize=1024)
+def resume_entities(resume_id: int) -> Dict[str, Any]:
+    """Entities extracted from a resume at ingest (fixed for a resume, so cached without a TTL)"""
+    return _backend().resume_entities(resume_id)
+
+
+def invalidate(*names: str):
+    """Drop the named snapshots (all of them when none are named) after a write"""
+    with _lock:
+        for name in names or NAMES:
+            _cache.pop(name, None)
+            _versions[name] = _versions.get(name, 0) + 1
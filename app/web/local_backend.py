@@ -0,0 +1,146 @@
+"""
+In-process data access for the Streamlit app (``WEB_BACKEND=local``).
+
+Runs the database, evaluation stack and models inside the Streamlit process; the single-
+process setup the app started with. Imported only in local mode, so the thin-client mode
+never loads models or opens the SQLite file.
+"""
+from typing import Any, Dict, List, Optional
+
+from app.db.database import SessionLocal
+from app.db import crud
+from app.parsing.files import extract_text
+from app.parsing.jd_parser import parse_jd_freeform
+from app.services.evaluator import evaluate_resume_against_job, evaluation_report
+from app.services.retrieval import recommend_jobs
+from app.services.resume_features import get_resume_features
+from app.services.export import iter_evaluation_pages, iter_csv
+from app.services.warmup import warm_up_in_background
+from app.profiling import request_profiling, list_traces, trace_file
+from app.web.cache import (
+    JobRow, ResumeRow, EvaluationRow, ApplicationRow, job_row, resume_row, evaluation_row, application_row,
+)
+
+
+class LocalBackend:
+    name = "local"
+
+    # Lists
+
+    def list_jobs(self) -> List[JobRow]:
+        with SessionLocal() as db:
+            return [job_row(j) for j in crud.list_jobs(db)]
+
+    def list_resumes(self) -> List[ResumeRow]:
+        with SessionLocal() as db:
+            return [resume_row(r) for r in crud.list_resumes(db)]
+
+    def list_evaluations(self) -> List[EvaluationRow]:
+        with SessionLocal() as db:
+            jobs: Dict[int, JobRow] = {}
+            rows = []
+            for ev in crud.list_evaluations(db):
+                row = evaluation_row(ev, jobs)
+                if row.job is not None:
+                    jobs[row.job_id] = row.job
+                rows.append(row)
+            return rows
+
+    def list_applications(self) -> List[ApplicationRow]:
+        with SessionLocal() as db:
+            return [application_row(a) for a in crud.list_student_applications(db)]
+
+    # Jobs
+
+    def parse_jd(self, jd_text: str) -> Dict[str, Any]:
+        return parse_jd_freeform(jd_text)
+
+    def create_job(self, *, title: str, jd_text: str, must_skills: List[str], nice_skills: List[str], location: str = "") -> JobRow:
+        with SessionLocal() as db:
+            job = crud.create_job(db, title=title, jd_text=jd_text, must_skills=must_skills, nice_skills=nice_skills, location=location)
+            return job_row(job)
+
+    def recommend_jobs(self, resume_text: str, limit: int = 5) -> List[Dict[str, Any]]:
+        with SessionLocal() as db:
+            return recommend_jobs(db, resume_text, limit=limit)
+
+    # Evaluations
+
+    def _evaluate(self, db, job_id: int, student_name: str, file_name: str, text: str, location: str) -> Dict[str, Any]:
+        job = crud.get_job(db, job_id)
+        if not job:
+            raise ValueError("Job not found")
+        resume = crud.create_resume(db, student_name=student_name, file_name=file_name, text=text, location=location)
+        evaluation = evaluate_resume_against_job(db, job, resume)
+        return evaluation_report(db, job, resume, evaluation)
+
+    def evaluate_file(self, *, job_id: int, student_name: str, file_name: str, content: bytes, location: str = "", profile: bool = False) -> Dict[str, Any]:
+        """Evaluation report (``AdvancedEvaluationResponse`` shape) for an uploaded resume"""
+        text, _ext = extract_text(content, file_name)
+        with request_profiling(profile), SessionLocal() as db:
+            return self._evaluate(db, job_id, student_name, file_name, text, location)
+
+    def evaluate_text(self, *, job_id: int, student_name: str, resume_text: str, file_name: str = "", location: str = "", profile: bool = False) -> Dict[str, Any]:
+        with request_profiling(profile), SessionLocal() as db:
+            return self._evaluate(db, job_id, student_name, file_name, resume_text, location)
+
+    def resume_entities(self, resume_id: int) -> Dict[str, Any]:
+        with SessionLocal() as db:
+            resume = crud.get_resume(db, resume_id)
+            return get_resume_features(db, resume).entities_dict() if resume else {}
+
+    def export_evaluations_csv(self, **filters) -> bytes:
+        # Encoded page by page straight from the database (no DataFrame of ORM objects)
+        with SessionLocal() as db:
+            return b"".join(iter_csv(iter_evaluation_pages(db, **filters)))
+
+    # Applications
+
+    def submit_application(
+        self, *, job_id: int, student_name: str, email: str, phone: str, location: str,
+        cover_letter: str, file_name: str, content: bytes, profile: bool = False,
+    ) -> int:
+        """Store the application and score it for the admin review; returns its id"""
+        resume_text, _ext = extract_text(content, file_name)
+        with request_profiling(profile), SessionLocal() as db:
+            application = crud.create_student_application(
+                db=db,
+                job_id=job_id,
+                student_name=student_name,
+                email=email,
+                phone=phone,
+                location=location,
+                resume_file_name=file_name,
+                resume_text=resume_text,
+                cover_letter=cover_letter
+            )
+            application_id = application.id
+
+            # Continue even if analysis fails
+            try:
+                resume = crud.create_resume(db=db, student_name=student_name, file_name=file_name, text=resume_text, location=location)
+                evaluation = evaluate_resume_against_job(db, crud.get_job(db, job_id), resume)
+                application.evaluation_id = evaluation.id
+                db.commit()
+            except Exception as e:
+                print(f"Analysis error: {e}")
+            return application_id
+
+    def update_application_status(self, application_id: int, status: str):
+        with SessionLocal() as db:
+            crud.update_application_status(db, application_id, status)
+
+    # Operations
+
+    def list_traces(self) -> List[Dict[str, Any]]:
+        return list_traces()
+
+    def trace_data(self, trace_id: str, kind: str) -> Optional[bytes]:
+        path = trace_file(trace_id, kind)
+        if path is None:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def warm_up(self):
+        warm_up_in_background()
@@ -6,15 +6,12 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.db.database import SessionLocal
-from app.db import models, crud
+# Database, models and the evaluation stack are reached through the backend only
+# (app.web.backend), so in API-client mode this process never loads them
 from app.parsing.files import extract_text
-from app.parsing.jd_parser import parse_jd_freeform
-from app.nlp.skills import extract_candidate_skills
-from app.services.evaluator import evaluate_resume_against_job
-from app.services.llm_evaluator import llm_evaluator
-from app.nlp.advanced_processor import text_processor
-from app.config import APP_NAME
+from app.config import APP_NAME, WARM_UP_ON_STARTUP
+from app.web import cache
+from app.web.backend import get_backend
 from app.auth import show_login_form, is_authenticated, show_logout_button, require_auth
 
 import streamlit as st
@@ -22,10 +19,6 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import json
-
-# Ensure models are imported so tables are created
-_ = models
 
 # Beautiful Dark Theme UI
 st.markdown("""
@@ -554,13 +547,14 @@ def page_landing():
 def page_student_application():
     """Professional student application form with resume upload and analysis"""
     # Get available jobs
-    with SessionLocal() as db:
-        jobs = crud.list_jobs(db)
+    jobs = cache.jobs()
     
     if not jobs:
         st.warning("No job openings available at the moment. Please check back later.")
         return
     
+    panel_job_recommendations()
+    
     # Job selection
     st.markdown("### Available Positions")
     job_options = {f"{job.title} - {job.location}" if job.location else job.title: job.id for job in jobs}
@@ -572,12 +566,12 @@ def page_student_application():
     with st.expander("View Job Requirements", expanded=False):
         col_a, col_b = st.columns(2)
         with col_a:
-            must_skills = json.loads(selected_job.must_skills_json or '[]')
+            must_skills = selected_job.must_skills
             st.markdown("**Required Skills:**")
             for skill in must_skills:
                 st.markdown(f"• {skill}")
         with col_b:
-            nice_skills = json.loads(selected_job.nice_skills_json or '[]')
+            nice_skills = selected_job.nice_skills
             st.markdown("**Preferred Skills:**")
             for skill in nice_skills:
                 st.markdown(f"• {skill}")
@@ -623,52 +617,26 @@ def page_student_application():
                 st.error("Please fill in all required fields (Name, Email, Resume)")
             else:
                 try:
-                    # Extract text from resume
-                    content = uploaded_resume.read()
-                    resume_text, ext = extract_text(content, uploaded_resume.name)
-                    
-                    # Create application in database
-                    with SessionLocal() as db:
-                        application = crud.create_student_application(
-                            db=db,
-                            job_id=selected_job_id,
-                            student_name=student_name,
-                            email=email,
-                            phone=phone,
-                            location=location,
-                            resume_file_name=uploaded_resume.name,
-                            resume_text=resume_text,
-                            cover_letter=cover_letter
-                        )
-                        
-                        # Perform AI analysis for admin dashboard
-                        try:
-                            # Create temporary resume record for analysis
-                            temp_resume = crud.create_resume(
-                                db=db,
-                                student_name=student_name,
-                                file_name=uploaded_resume.name,
-                                text=resume_text,
-                                location=location
-                            )
-                            
-                            # Run evaluation
-                            evaluation = evaluate_resume_against_job(db, selected_job, temp_resume)
-                            
-                            # Store evaluation ID with application for admin reference
-                            application.evaluation_id = evaluation.id
-                            db.commit()
-                            
-                        except Exception as e:
-                            print(f"Analysis error: {e}")
-                            # Continue even if analysis fails
+                    # Store the application and score it for the admin dashboard
+                    application_id = get_backend().submit_application(
+                        job_id=selected_job_id,
+                        student_name=student_name,
+                        email=email,
+                        phone=phone,
+                        location=location,
+                        cover_letter=cover_letter,
+                        file_name=uploaded_resume.name,
+                        content=uploaded_resume.read(),
+                        profile=_profile_requested()
+                    )
+                    cache.invalidate("applications", "resumes", "evaluations")
                     
                     st.success("Application submitted successfully!")
                     
                     # Show submission confirmation
                     st.markdown("### Thank You!")
                     st.info(f"""
-                    **Application ID:** {application.id}
+                    **Application ID:** {application_id}
                     
                     Your application for **{selected_job.title}** has been submitted successfully!
                     
@@ -680,6 +648,34 @@ def page_student_application():
                 except Exception as e:
                     st.error(f"Error submitting application: {str(e)}")
 
+def panel_job_recommendations():
+    """Let a student upload a resume and see which open positions fit it best"""
+    with st.expander("🔎 Not sure which role fits you? Get job recommendations", expanded=False):
+        rec_resume = st.file_uploader(
+            "Upload your resume (PDF/DOCX)",
+            type=["pdf", "docx"],
+            key="recommend_resume"
+        )
+        if st.button("Recommend Positions", key="recommend_btn") and rec_resume:
+            try:
+                resume_text, ext = extract_text(rec_resume.read(), rec_resume.name)
+                recommendations = get_backend().recommend_jobs(resume_text, limit=5)
+            except Exception as e:
+                st.error(f"Could not generate recommendations: {e}")
+                return
+            
+            if not recommendations:
+                st.info("No matching positions found.")
+                return
+            
+            for rec in recommendations:
+                score = rec["score"]
+                emoji = "🟢" if score >= 75 else "🟡" if score >= 50 else "🔴"
+                title = f"{rec['title']} - {rec['location']}" if rec["location"] else rec["title"]
+                st.markdown(f"**{emoji} {title}** — {score}% ({rec['verdict']})")
+                if rec["missing_skills"]:
+                    st.caption("Missing: " + ", ".join(rec["missing_skills"][:5]))
+
 def page_upload_jd():
     """Admin page for uploading job descriptions"""
     if not require_auth():
@@ -720,7 +716,7 @@ def page_upload_jd():
         submitted = st.form_submit_button("Save JD")
 
         if suggest and jd_text.strip():
-            parsed = parse_jd_freeform(jd_text)
+            parsed = get_backend().parse_jd(jd_text)
             st.info("Suggested skills extracted from JD.")
             st.session_state["jd_suggest_must"] = ", ".join(parsed.get("must", []))
             st.session_state["jd_suggest_nice"] = ", ".join(parsed.get("nice", []))
@@ -737,40 +733,29 @@ def page_upload_jd():
             if not title.strip() or not jd_text.strip():
                 st.error("Title and JD text are required.")
             else:
-                db = SessionLocal()
-                try:
-                    must = [s.strip() for s in (must_skills or st.session_state.get("jd_suggest_must", "")).split(",") if s.strip()]
-                    nice = [s.strip() for s in (nice_skills or st.session_state.get("jd_suggest_nice", "")).split(",") if s.strip()]
-                    job = crud.create_job(db, title=title, jd_text=jd_text, must_skills=must, nice_skills=nice, location=location)
-                    st.success(f"Saved JD: {job.title} (id={job.id})")
-                finally:
-                    db.close()
+                must = [s.strip() for s in (must_skills or st.session_state.get("jd_suggest_must", "")).split(",") if s.strip()]
+                nice = [s.strip() for s in (nice_skills or st.session_state.get("jd_suggest_nice", "")).split(",") if s.strip()]
+                job = get_backend().create_job(title=title, jd_text=jd_text, must_skills=must, nice_skills=nice, location=location)
+                cache.invalidate("jobs")
+                st.success(f"Saved JD: {job.title} (id={job.id})")
 
     st.subheader("Existing JDs")
-    db = SessionLocal()
-    try:
-        jobs = crud.list_jobs(db)
-        if jobs:
-            df = pd.DataFrame([
-                {"id": j.id, "title": j.title, "location": j.location, "created_at": j.created_at}
-                for j in jobs
-            ])
-            st.dataframe(df, use_container_width=True)
-        else:
-            st.info("No JDs yet. Add one above.")
-    finally:
-        db.close()
+    jobs = cache.jobs()
+    if jobs:
+        df = pd.DataFrame([
+            {"id": j.id, "title": j.title, "location": j.location, "created_at": j.created_at}
+            for j in jobs
+        ])
+        st.dataframe(df, use_container_width=True)
+    else:
+        st.info("No JDs yet. Add one above.")
 
 
 def page_upload_resume():
     st.markdown('<h2 class="section-header">📋 Upload Resume and Evaluate</h2>', unsafe_allow_html=True)
     
-    db = SessionLocal()
-    try:
-        jobs = crud.list_jobs(db)
-        recent_evals = crud.list_evaluations(db)[:5]  # Get last 5 evaluations
-    finally:
-        db.close()
+    jobs = cache.jobs()
+    recent_evals = cache.evaluations()[:5]  # Get last 5 evaluations
 
     if not jobs:
         st.markdown('<div class="info-box">', unsafe_allow_html=True)
@@ -791,12 +776,12 @@ def page_upload_resume():
         with st.expander("🔍 View Job Requirements", expanded=False):
             col_a, col_b = st.columns(2)
             with col_a:
-                must_skills = json.loads(selected_job.must_skills_json or '[]')
+                must_skills = selected_job.must_skills
                 st.markdown("**🔴 Must-have Skills:**")
                 for skill in must_skills:
                     st.markdown(f"• {skill}")
             with col_b:
-                nice_skills = json.loads(selected_job.nice_skills_json or '[]')
+                nice_skills = selected_job.nice_skills
                 st.markdown("**🟡 Nice-to-have Skills:**")
                 for skill in nice_skills:
                     st.markdown(f"• {skill}")
@@ -842,184 +827,162 @@ def page_upload_resume():
         status = st.empty()
         
         try:
-            status.text("📄 Extracting text from resume...")
-            progress.progress(25)
-            content = uploaded.read()
-            text, ext = extract_text(content, uploaded.name)
-            
-            status.text("💾 Saving resume to database...")
+            status.text("🧠 AI is analyzing resume vs job requirements...")
             progress.progress(50)
+            report = get_backend().evaluate_file(
+                job_id=job_options[job_label],
+                student_name=student_name,
+                file_name=uploaded.name,
+                content=uploaded.read(),
+                location=location,
+                profile=_profile_requested()
+            )
+            cache.invalidate("resumes", "evaluations")
             
-            db = SessionLocal()
-            try:
-                resume = crud.create_resume(db, student_name=student_name, 
-                                          file_name=uploaded.name, text=text, location=location)
-                
-                status.text("🧠 AI is analyzing resume vs job requirements...")
-                progress.progress(75)
-                
-                job_id = job_options[job_label]
-                job = crud.get_job(db, job_id)
-                ev = evaluate_resume_against_job(db, job, resume)
-                
-                # Advanced analysis
-                status.text("🔍 Extracting entities and generating insights...")
-                progress.progress(85)
-                
-                entities = text_processor.extract_entities(text)
-                text_summary = text_processor.get_text_summary(text)
-                
-                # LLM analysis if available
-                llm_analysis = None
-                if llm_evaluator.llm:
-                    status.text("✨ LLM generating detailed feedback...")
-                    progress.progress(95)
-                    llm_result = llm_evaluator.evaluate_with_llm(text, job.jd_text)
-                    llm_analysis = llm_result
-                
-                status.text("✅ Evaluation complete!")
-                progress.progress(100)
-                
-                # Beautiful results display
-                st.markdown("---")
-                st.markdown("### 🎯 Evaluation Results")
-                
-                # Score display with dynamic styling
-                score = ev.score
-                if score >= 75:
-                    score_class = "score-high"
-                    emoji = "🟢"
-                elif score >= 50:
-                    score_class = "score-medium" 
-                    emoji = "🟡"
-                else:
-                    score_class = "score-low"
-                    emoji = "🔴"
+            ev = report["basic_evaluation"]
+            entities = report["extracted_entities"]
+            text_summary = report["text_summary"]
+            llm_analysis = report.get("llm_analysis")
+            
+            status.text("✅ Evaluation complete!")
+            progress.progress(100)
+            
+            # Beautiful results display
+            st.markdown("---")
+            st.markdown("### 🎯 Evaluation Results")
+            
+            # Score display with dynamic styling
+            score = ev["score"]
+            if score >= 75:
+                score_class = "score-high"
+                emoji = "🟢"
+            elif score >= 50:
+                score_class = "score-medium" 
+                emoji = "🟡"
+            else:
+                score_class = "score-low"
+                emoji = "🔴"
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown(f'''
+                <div class="{score_class}">
+                    <h2>{emoji} {score}%</h2>
+                    <p>Relevance Score</p>
+                </div>
+                ''', unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f'''
+                <div class="{score_class}">
+                    <h2>🎯 {ev["verdict"]}</h2>
+                    <p>Verdict</p>
+                </div>
+                ''', unsafe_allow_html=True)
+            
+            with col3:
+                missing_count = len(ev["missing_skills"])
+                st.markdown(f'''
+                <div class="{score_class}">
+                    <h2>📊 {missing_count}</h2>
+                    <p>Missing Skills</p>
+                </div>
+                ''', unsafe_allow_html=True)
+            
+            # Enhanced Analysis Section
+            if llm_analysis:
+                st.markdown("### 🤖 Advanced LLM Analysis")
                 
-                col1, col2, col3 = st.columns(3)
+                col1, col2 = st.columns(2)
                 with col1:
-                    st.markdown(f'''
-                    <div class="{score_class}">
-                        <h2>{emoji} {score}%</h2>
-                        <p>Relevance Score</p>
-                    </div>
-                    ''', unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown(f'''
-                    <div class="{score_class}">
-                        <h2>🎯 {ev.verdict}</h2>
-                        <p>Verdict</p>
-                    </div>
-                    ''', unsafe_allow_html=True)
-                
-                with col3:
-                    missing_count = len(json.loads(ev.missing_json or '[]'))
-                    st.markdown(f'''
-                    <div class="{score_class}">
-                        <h2>📊 {missing_count}</h2>
-                        <p>Missing Skills</p>
-                    </div>
-                    ''', unsafe_allow_html=True)
-                
-                # Enhanced Analysis Section
-                if llm_analysis:
-                    st.markdown("### 🤖 Advanced LLM Analysis")
+                    st.markdown("**🎯 LLM Semantic Score:**")
+                    st.progress(llm_analysis["semantic_score"])
+                    st.caption(f"{llm_analysis['semantic_score']:.2f} confidence")
                     
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.markdown("**🎯 LLM Semantic Score:**")
-                        st.progress(llm_analysis.semantic_score)
-                        st.caption(f"{llm_analysis.semantic_score:.2f} confidence")
-                        
-                        if llm_analysis.strengths:
-                            st.markdown("**💪 Key Strengths:**")
-                            for strength in llm_analysis.strengths[:5]:
-                                st.markdown(f"• {strength}")
-                    
-                    with col2:
-                        st.markdown("**🎯 Confidence Score:**")
-                        st.progress(llm_analysis.confidence_score)
-                        st.caption(f"{llm_analysis.confidence_score:.2f} reliability")
-                        
-                        if llm_analysis.skill_gaps:
-                            st.markdown("**📋 LLM-Identified Gaps:**")
-                            for gap in llm_analysis.skill_gaps[:5]:
-                                st.markdown(f"• {gap}")
-                    
-                    if llm_analysis.detailed_feedback:
-                        st.markdown("**🤖 Detailed LLM Feedback:**")
-                        st.markdown('<div class="info-box">', unsafe_allow_html=True)
-                        st.write(llm_analysis.detailed_feedback)
-                        st.markdown('</div>', unsafe_allow_html=True)
-                
-                # Entity Extraction Results
-                st.markdown("### 🔍 Extracted Information")
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.markdown("**🛠️ Technical Skills:**")
-                    if entities.skills:
-                        for skill in entities.skills[:8]:
-                            st.markdown(f"• {skill}")
-                    else:
-                        st.caption("None detected")
+                    if llm_analysis["strengths"]:
+                        st.markdown("**💪 Key Strengths:**")
+                        for strength in llm_analysis["strengths"][:5]:
+                            st.markdown(f"• {strength}")
                 
                 with col2:
-                    st.markdown("**🎓 Education & Certifications:**")
-                    if entities.education:
-                        for edu in entities.education[:3]:
-                            st.markdown(f"• {edu}")
-                    if entities.certifications:
-                        for cert in entities.certifications[:3]:
-                            st.markdown(f"• {cert}")
-                    if not entities.education and not entities.certifications:
-                        st.caption("None detected")
-                
-                with col3:
-                    st.markdown("**💼 Experience & Companies:**")
-                    if entities.experience_years:
-                        max_exp = max(entities.experience_years)
-                        st.markdown(f"• {max_exp} years experience")
-                    if entities.companies:
-                        for company in entities.companies[:3]:
-                            st.markdown(f"• {company}")
-                    if not entities.experience_years and not entities.companies:
-                        st.caption("None detected")
-                
-                # Text Analysis Summary
-                with st.expander("📊 Document Analysis", expanded=False):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Word Count", text_summary['word_count'])
-                        st.metric("Unique Words", text_summary['unique_words'])
-                    with col2:
-                        st.metric("Sentences", text_summary['sentence_count'])
-                        st.metric("Avg Sentence Length", f"{text_summary['avg_sentence_length']:.1f}")
+                    st.markdown("**🎯 Confidence Score:**")
+                    st.progress(llm_analysis["confidence_score"])
+                    st.caption(f"{llm_analysis['confidence_score']:.2f} reliability")
+                    
+                    if llm_analysis["skill_gaps"]:
+                        st.markdown("**📋 LLM-Identified Gaps:**")
+                        for gap in llm_analysis["skill_gaps"][:5]:
+                            st.markdown(f"• {gap}")
                 
-                # Traditional feedback
-                if ev.suggestions:
-                    st.markdown("### 💡 Traditional AI Suggestions")
+                if llm_analysis["detailed_feedback"]:
+                    st.markdown("**🤖 Detailed LLM Feedback:**")
                     st.markdown('<div class="info-box">', unsafe_allow_html=True)
-                    st.write(ev.suggestions)
+                    st.write(llm_analysis["detailed_feedback"])
                     st.markdown('</div>', unsafe_allow_html=True)
-                
-                if ev.missing_json:
-                    missing_skills = json.loads(ev.missing_json)
-                    if missing_skills:
-                        st.markdown("### ❌ Missing Must-Have Skills")
-                        cols = st.columns(3)
-                        for i, skill in enumerate(missing_skills):
-                            with cols[i % 3]:
-                                st.markdown(f"• **{skill}**")
-                
-                st.balloons()
-                status.empty()
-                progress.empty()
-                
-            finally:
-                db.close()
-                
+            
+            # Entity Extraction Results
+            st.markdown("### 🔍 Extracted Information")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown("**🛠️ Technical Skills:**")
+                if entities["skills"]:
+                    for skill in entities["skills"][:8]:
+                        st.markdown(f"• {skill}")
+                else:
+                    st.caption("None detected")
+            
+            with col2:
+                st.markdown("**🎓 Education & Certifications:**")
+                if entities["education"]:
+                    for edu in entities["education"][:3]:
+                        st.markdown(f"• {edu}")
+                if entities["certifications"]:
+                    for cert in entities["certifications"][:3]:
+                        st.markdown(f"• {cert}")
+                if not entities["education"] and not entities["certifications"]:
+                    st.caption("None detected")
+            
+            with col3:
+                st.markdown("**💼 Experience & Companies:**")
+                if entities["experience_years"]:
+                    max_exp = max(entities["experience_years"])
+                    st.markdown(f"• {max_exp} years experience")
+                if entities["companies"]:
+                    for company in entities["companies"][:3]:
+                        st.markdown(f"• {company}")
+                if not entities["experience_years"] and not entities["companies"]:
+                    st.caption("None detected")
+            
+            # Text Analysis Summary
+            with st.expander("📊 Document Analysis", expanded=False):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Word Count", text_summary['word_count'])
+                    st.metric("Unique Words", text_summary['unique_words'])
+                with col2:
+                    st.metric("Sentences", text_summary['sentence_count'])
+                    st.metric("Avg Sentence Length", f"{text_summary['avg_sentence_length']:.1f}")
+            
+            # Traditional feedback
+            if ev["suggestions"]:
+                st.markdown("### 💡 Traditional AI Suggestions")
+                st.markdown('<div class="info-box">', unsafe_allow_html=True)
+                st.write(ev["suggestions"])
+                st.markdown('</div>', unsafe_allow_html=True)
+            
+            missing_skills = ev["missing_skills"]
+            if missing_skills:
+                st.markdown("### ❌ Missing Must-Have Skills")
+                cols = st.columns(3)
+                for i, skill in enumerate(missing_skills):
+                    with cols[i % 3]:
+                        st.markdown(f"• **{skill}**")
+            
+            st.balloons()
+            status.empty()
+            progress.empty()
+            
         except Exception as e:
             st.error(f"❌ Failed to process resume: {e}")
             status.empty()
@@ -1029,13 +992,9 @@ def page_upload_resume():
 def page_dashboard():
     st.markdown('<h2 class="section-header">📊 Analytics Dashboard</h2>', unsafe_allow_html=True)
     
-    db = SessionLocal()
-    try:
-        jobs = crud.list_jobs(db)
-        all_evals = crud.list_evaluations(db)
-        resumes = crud.list_resumes(db)
-    finally:
-        db.close()
+    jobs = cache.jobs()
+    all_evals = cache.evaluations()
+    resumes = cache.resumes()
 
     # Top metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -1132,53 +1091,93 @@ def page_dashboard():
         location = st.text_input("📍 Location Filter", placeholder="e.g., New York")
 
     # Results table
-    db = SessionLocal()
-    try:
-        if job_map[job_sel] is None:
-            evs = crud.list_evaluations(db, min_score=min_score, location=location or None)
-        else:
-            evs = crud.list_evaluations(db, job_id=job_map[job_sel], min_score=min_score, location=location or None)
+    if job_map[job_sel] is None:
+        evs = cache.evaluations(min_score=min_score, location=location or None)
+    else:
+        evs = cache.evaluations(job_id=job_map[job_sel], min_score=min_score, location=location or None)
+    
+    if evs:
+        st.markdown("### 📋 Filtered Results")
         
-        if evs:
-            st.markdown("### 📋 Filtered Results")
-            
-            rows = []
-            for ev in evs:
-                # Score styling
-                if ev.score >= 75:
-                    score_display = f"🟢 {ev.score}%"
-                elif ev.score >= 50:
-                    score_display = f"🟡 {ev.score}%"
-                else:
-                    score_display = f"🔴 {ev.score}%"
-                
-                rows.append({
-                    "📊 Score": score_display,
-                    "🎯 Verdict": ev.verdict,
-                    "📄 Job": ev.job.title if ev.job else "Unknown",
-                    "👤 Student": ev.resume.student_name if ev.resume else "Unknown",
-                    "📁 Resume": ev.resume.file_name if ev.resume else "Unknown",
-                    "📍 Location": ev.resume.location if ev.resume and ev.resume.location else "Not specified",
-                    "📅 Date": ev.created_at.strftime("%Y-%m-%d %H:%M"),
-                })
-            
-            df = pd.DataFrame(rows)
-            st.dataframe(df, use_container_width=True, height=400)
+        rows = []
+        for ev in evs:
+            # Score styling
+            if ev.score >= 75:
+                score_display = f"🟢 {ev.score}%"
+            elif ev.score >= 50:
+                score_display = f"🟡 {ev.score}%"
+            else:
+                score_display = f"🔴 {ev.score}%"
             
-            # Export option
-            csv = df.to_csv(index=False)
+            rows.append({
+                "📊 Score": score_display,
+                "🎯 Verdict": ev.verdict,
+                "📄 Job": ev.job.title if ev.job else "Unknown",
+                "👤 Student": ev.resume.student_name if ev.resume else "Unknown",
+                "📁 Resume": ev.resume.file_name if ev.resume else "Unknown",
+                "📍 Location": ev.resume.location if ev.resume and ev.resume.location else "Not specified",
+                "📅 Date": ev.created_at.strftime("%Y-%m-%d %H:%M"),
+            })
+        
+        df = pd.DataFrame(rows)
+        st.dataframe(df, use_container_width=True, height=400)
+        
+        # Export option
+        csv = df.to_csv(index=False)
+        st.download_button(
+            label="📥 Download Results as CSV",
+            data=csv,
+            file_name=f"evaluation_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
+        )
+    else:
+        st.markdown('<div class="info-box">', unsafe_allow_html=True)
+        st.info("📭 No evaluations match your filters. Try adjusting the criteria above.")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+
+def show_profiling_controls():
+    """Sidebar toggle for profiling evaluations and downloads of stored traces"""
+    st.markdown("### 🧪 Profiling")
+    st.toggle(
+        "Profile evaluations",
+        key="profile_evaluations",
+        help="Capture a cProfile and stage trace for each evaluation run from this session",
+    )
+    backend = get_backend()
+    try:
+        traces = backend.list_traces()
+    except Exception as e:
+        st.caption(f"Traces unavailable: {e}")
+        return
+    if not traces:
+        st.caption("No slow or profiled evaluations recorded yet")
+        return
+    with st.expander(f"Recent traces ({len(traces)})", expanded=False):
+        labels = {
+            f"{t['started_at'][:19]} · {t['name']} · {t['duration']:.2f}s ({'profiled' if t['profiled'] else 'slow'})": t
+            for t in traces
+        }
+        # Only the selected trace is read (over HTTP in API mode), not every stored one
+        trace = labels[st.selectbox("Trace", list(labels.keys()), key="trace_select")]
+        for kind, mime in (("json", "application/json"), ("prof", "application/octet-stream")):
+            if kind == "prof" and not trace["profiled"]:
+                continue
+            data = backend.trace_data(trace["id"], kind)
+            if data is None:
+                continue
             st.download_button(
-                label="📥 Download Results as CSV",
-                data=csv,
-                file_name=f"evaluation_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
+                f"Download .{kind}",
+                data=data,
+                file_name=f"{trace['id']}.{kind}",
+                mime=mime,
+                key=f"trace_{trace['id']}_{kind}",
             )
-        else:
-            st.markdown('<div class="info-box">', unsafe_allow_html=True)
-            st.info("📭 No evaluations match your filters. Try adjusting the criteria above.")
-            st.markdown('</div>', unsafe_allow_html=True)
-    finally:
-        db.close()
+
+
+def _profile_requested() -> bool:
+    """Evaluations run from this script run are profiled only when an admin turned it on"""
+    return is_authenticated() and st.session_state.get("profile_evaluations", False)
 
 
 def main():
@@ -1189,6 +1188,11 @@ def main():
         initial_sidebar_state="expanded"
     )
     
+    # Models load lazily; optionally start loading them without blocking this page
+    # (in API-client mode the API workers own the models)
+    if WARM_UP_ON_STARTUP:
+        get_backend().warm_up()
+    
     # Initialize session state
     if "page" not in st.session_state:
         st.session_state.page = "landing"
@@ -1253,19 +1257,21 @@ def main():
             elif "Analytics Dashboard" in selected_page:
                 st.session_state.page = "analytics"
             
+            st.markdown("---")
+            show_profiling_controls()
+            
             st.markdown("---")
             st.markdown("### 📊 Quick Stats")
             
             # Quick stats in sidebar
             try:
-                with SessionLocal() as db:
-                    total_jobs = len(crud.list_jobs(db))
-                    total_applications = len(crud.list_student_applications(db))
-                    pending_applications = len(crud.list_student_applications(db, status="pending"))
-                    
-                    st.metric("📄 Total Jobs", total_jobs)
-                    st.metric("📋 Applications", total_applications)
-                    st.metric("⏳ Pending", pending_applications)
+                total_jobs = len(cache.jobs())
+                total_applications = len(cache.applications())
+                pending_applications = len(cache.applications(status="pending"))
+                
+                st.metric("📄 Total Jobs", total_jobs)
+                st.metric("📋 Applications", total_applications)
+                st.metric("⏳ Pending", pending_applications)
             except Exception as e:
                 st.error(f"Error loading stats: {e}")
         
@@ -1288,31 +1294,30 @@ def page_admin_dashboard():
     st.markdown('<h1 class="main-header">📋 Student Applications Dashboard</h1>', unsafe_allow_html=True)
     
     # Get all applications with job data
-    with SessionLocal() as db:
-        applications = crud.list_student_applications(db)
-        jobs = crud.list_jobs(db)
-        
-        # Create job lookup for filtering
-        job_dict = {job.id: job.title for job in jobs}
-        
-        # Convert to data that doesn't require DB session
-        app_data = []
-        for app in applications:
-            app_info = {
-                'id': app.id,
-                'student_name': app.student_name,
-                'email': app.email,
-                'phone': app.phone or 'Not provided',
-                'location': app.location or 'Not provided',
-                'status': app.status,
-                'job_id': app.job_id,
-                'job_title': job_dict.get(app.job_id, 'Unknown'),
-                'resume_file_name': app.resume_file_name,
-                'resume_text': app.resume_text,
-                'cover_letter': app.cover_letter,
-                'created_at': app.created_at
-            }
-            app_data.append(app_info)
+    applications = cache.applications()
+    jobs = cache.jobs()
+    
+    # Create job lookup for filtering
+    job_dict = {job.id: job.title for job in jobs}
+    
+    app_data = []
+    for app in applications:
+        app_info = {
+            'id': app.id,
+            'student_name': app.student_name,
+            'email': app.email,
+            'phone': app.phone or 'Not provided',
+            'location': app.location or 'Not provided',
+            'status': app.status,
+            'job_id': app.job_id,
+            'job_title': job_dict.get(app.job_id, 'Unknown'),
+            'resume_file_name': app.resume_file_name,
+            'resume_text': app.resume_text,
+            'cover_letter': app.cover_letter,
+            'evaluation_id': app.evaluation_id,
+            'created_at': app.created_at
+        }
+        app_data.append(app_info)
     
     if not app_data:
         st.info("📭 No student applications yet.")
@@ -1345,6 +1350,9 @@ def page_admin_dashboard():
     
     st.markdown(f"### 📊 Showing {len(filtered_apps)} applications")
     
+    # Evaluations stored when the applications were submitted
+    stored_evaluations = {ev.id: ev for ev in cache.evaluations()}
+    
     # Display applications
     for app in filtered_apps:
         with st.expander(f"👤 {app['student_name']} - {app['job_title']} | Status: {app['status'].upper()}", expanded=False):
@@ -1374,100 +1382,111 @@ def page_admin_dashboard():
                 )
                 
                 if st.button(f"Update Status", key=f"update_{app['id']}"):
-                    with SessionLocal() as db:
-                        crud.update_application_status(db, app['id'], new_status)
+                    get_backend().update_application_status(app['id'], new_status)
+                    cache.invalidate("applications")
                     st.success(f"Status updated to {new_status}")
                     st.rerun()
             
             # Resume analysis section
             st.markdown("#### 🧠 AI Resume Analysis")
             
-            # Perform resume analysis
+            # Expander bodies run on every rerun even when collapsed: show the stored
+            # evaluation and only re-evaluate on request
             try:
-                with SessionLocal() as db:
-                    # Get the job for analysis
-                    job = crud.get_job(db, app['job_id'])
-                    if job:
-                        # Create temporary resume for analysis
-                        temp_resume = crud.create_resume(
-                            db=db,
-                            student_name=app['student_name'],
-                            file_name=app['resume_file_name'],
-                            text=app['resume_text'],
-                            location=app['location'] if app['location'] != 'Not provided' else ""
-                        )
-                        
-                        # Run evaluation
-                        evaluation = evaluate_resume_against_job(db, job, temp_resume)
-                        
-                        # Display analysis results
-                        col_a, col_b, col_c = st.columns(3)
-                        with col_a:
-                            score_color = "🟢" if evaluation.score >= 75 else "🟡" if evaluation.score >= 50 else "🔴"
-                            st.metric("Match Score", f"{evaluation.score}%", delta=None)
-                            st.write(f"{score_color} **{evaluation.verdict.upper()}**")
-                        
-                        with col_b:
-                            missing_skills = json.loads(evaluation.missing_json or '[]')
-                            st.metric("Missing Skills", len(missing_skills))
+                report_key = f"report_{app['id']}"
+                stored = stored_evaluations.get(app['evaluation_id'])
+                if app['job_id'] not in job_dict:
+                    st.warning("Job not found for this application")
+                elif st.button("🔄 Re-analyze" if stored else "🔍 Analyze", key=f"analyze_{app['id']}"):
+                    # Evaluated as a new resume record, with entities and LLM feedback
+                    st.session_state[report_key] = get_backend().evaluate_text(
+                        job_id=app['job_id'],
+                        student_name=app['student_name'],
+                        resume_text=app['resume_text'],
+                        file_name=app['resume_file_name'] or "",
+                        location=app['location'] if app['location'] != 'Not provided' else "",
+                        profile=_profile_requested()
+                    )
+                    cache.invalidate("resumes", "evaluations")
+                
+                report = st.session_state.get(report_key)
+                if report is None and stored is not None:
+                    report = {
+                        "basic_evaluation": {
+                            "score": stored.score,
+                            "verdict": stored.verdict,
+                            "missing_skills": list(stored.missing),
+                            "suggestions": stored.suggestions or "",
+                            "created_at": stored.created_at.isoformat(),
+                        },
+                        "llm_analysis": None,
+                        "extracted_entities": cache.resume_entities(stored.resume_id),
+                    }
+                if report is None:
+                    if app['job_id'] in job_dict:
+                        st.info("No analysis stored for this application yet.")
+                else:
+                    evaluation = report["basic_evaluation"]
+                    
+                    # Display analysis results
+                    col_a, col_b, col_c = st.columns(3)
+                    with col_a:
+                        score_color = "🟢" if evaluation["score"] >= 75 else "🟡" if evaluation["score"] >= 50 else "🔴"
+                        st.metric("Match Score", f"{evaluation['score']}%", delta=None)
+                        st.write(f"{score_color} **{evaluation['verdict'].upper()}**")
+                    
+                    with col_b:
+                        missing_skills = evaluation["missing_skills"]
+                        st.metric("Missing Skills", len(missing_skills))
+                    
+                    with col_c:
+                        st.metric("Analysis Date", datetime.fromisoformat(evaluation["created_at"]).strftime('%m/%d'))
+                    
+                    # Missing skills
+                    if missing_skills:
+                        st.markdown("**🚫 Missing Skills:**")
+                        for skill in missing_skills[:5]:  # Show top 5
+                            st.write(f"• {skill}")
+                        if len(missing_skills) > 5:
+                            st.write(f"... and {len(missing_skills) - 5} more")
+                    
+                    # LLM Analysis if available
+                    llm_result = report.get("llm_analysis")
+                    if llm_result:
+                        st.markdown("**🤖 AI Detailed Feedback:**")
+                        st.write(llm_result["detailed_feedback"])
                         
-                        with col_c:
-                            st.metric("Analysis Date", evaluation.created_at.strftime('%m/%d'))
+                        if llm_result["strengths"]:
+                            st.markdown("**💪 Strengths:**")
+                            for strength in llm_result["strengths"][:3]:
+                                st.write(f"• {strength}")
                         
-                        # Missing skills
-                        if missing_skills:
-                            st.markdown("**🚫 Missing Skills:**")
-                            for skill in missing_skills[:5]:  # Show top 5
+                        if llm_result["improvement_suggestions"]:
+                            st.markdown("**💡 Improvement Suggestions:**")
+                            for suggestion in llm_result["improvement_suggestions"][:3]:
+                                st.write(f"• {suggestion}")
+                    elif evaluation["suggestions"]:
+                        st.markdown("**💡 Suggestions:**")
+                        st.write(evaluation["suggestions"])
+                    
+                    # Advanced entity extraction
+                    entities = report["extracted_entities"]
+                    col_x, col_y = st.columns(2)
+                    with col_x:
+                        st.markdown("**🎯 Extracted Skills:**")
+                        if entities.get("skills"):
+                            for skill in entities["skills"][:10]:
                                 st.write(f"• {skill}")
-                            if len(missing_skills) > 5:
-                                st.write(f"... and {len(missing_skills) - 5} more")
-                        
-                        # LLM Analysis if available
-                        if llm_evaluator.llm:
-                            try:
-                                llm_result = llm_evaluator.evaluate_with_llm(app['resume_text'], job.jd_text)
-                                
-                                st.markdown("**🤖 AI Detailed Feedback:**")
-                                st.write(llm_result.detailed_feedback)
-                                
-                                if llm_result.strengths:
-                                    st.markdown("**💪 Strengths:**")
-                                    for strength in llm_result.strengths[:3]:
-                                        st.write(f"• {strength}")
-                                
-                                if llm_result.improvement_suggestions:
-                                    st.markdown("**💡 Improvement Suggestions:**")
-                                    for suggestion in llm_result.improvement_suggestions[:3]:
-                                        st.write(f"• {suggestion}")
-                            
-                            except Exception as e:
-                                st.warning(f"LLM analysis unavailable: {e}")
-                        
-                        # Advanced entity extraction
-                        try:
-                            entities = text_processor.extract_entities(app['resume_text'])
-                            
-                            col_x, col_y = st.columns(2)
-                            with col_x:
-                                st.markdown("**🎯 Extracted Skills:**")
-                                if entities.skills:
-                                    for skill in entities.skills[:10]:
-                                        st.write(f"• {skill}")
-                            
-                            with col_y:
-                                st.markdown("**🏢 Experience:**")
-                                if entities.experience_years:
-                                    max_exp = max(entities.experience_years) if entities.experience_years else 0
-                                    st.write(f"Years: {max_exp}")
-                                if entities.companies:
-                                    st.write("Companies:")
-                                    for company in entities.companies[:3]:
-                                        st.write(f"• {company}")
-                        
-                        except Exception as e:
-                            st.warning(f"Entity extraction unavailable: {e}")
-                    else:
-                        st.warning("Job not found for this application")
+                    
+                    with col_y:
+                        st.markdown("**🏢 Experience:**")
+                        if entities.get("experience_years"):
+                            max_exp = max(entities["experience_years"])
+                            st.write(f"Years: {max_exp}")
+                        if entities.get("companies"):
+                            st.write("Companies:")
+                            for company in entities["companies"][:3]:
+                                st.write(f"• {company}")
             
             except Exception as e:
                 st.error(f"Analysis error: {e}")
@@ -1480,9 +1499,8 @@ def page_placement_dashboard():
     st.markdown('<h1 class="main-header">🎯 Placement Team Dashboard</h1>', unsafe_allow_html=True)
     
     # Get all data
-    with SessionLocal() as db:
-        jobs = crud.list_jobs(db)
-        evaluations = crud.list_evaluations(db)
+    jobs = cache.jobs()
+    evaluations = cache.evaluations()
     
     if not evaluations:
         st.info("📭 No resume evaluations available yet.")
@@ -1570,21 +1588,16 @@ def page_placement_dashboard():
     
     with col_b:
         if st.button("📊 Export to CSV"):
-            # Create DataFrame for export
-            export_data = []
-            for eval in filtered_evals:
-                export_data.append({
-                    "Student Name": eval.resume.student_name,
-                    "Job Title": eval.job.title,
-                    "Score": eval.score,
-                    "Verdict": eval.verdict,
-                    "Location": eval.resume.location or "",
-                    "File Name": eval.resume.file_name,
-                    "Date": eval.created_at.strftime("%Y-%m-%d")
-                })
-            
-            df = pd.DataFrame(export_data)
-            csv = df.to_csv(index=False)
+            # Encoded page by page from the database (no DataFrame of rows);
+            # very large exports should use the API's /export/evaluations stream instead
+            csv = get_backend().export_evaluations_csv(
+                job_id=next((job.id for job in jobs if job.title == selected_job), None),
+                min_score=min_score,
+                max_score=max_score,
+                verdict=selected_verdict if selected_verdict != "All" else None,
+                location=location_filter or None,
+                skills=skills_filter.split(",") if skills_filter else None,
+            )
             st.download_button(
                 label="📥 Download CSV",
                 data=csv,
@@ -1632,13 +1645,13 @@ def page_placement_dashboard():
                 
                 # Extract and display skills
                 try:
-                    entities = text_processor.extract_entities(eval.resume.text)
-                    if entities.skills:
+                    skills = cache.resume_entities(eval.resume_id).get("skills") or []
+                    if skills:
                         st.markdown("**🎯 Key Skills:**")
-                        skills_display = ", ".join(entities.skills[:8])
+                        skills_display = ", ".join(skills[:8])
                         st.write(skills_display)
-                        if len(entities.skills) > 8:
-                            st.caption(f"... and {len(entities.skills) - 8} more skills")
+                        if len(skills) > 8:
+                            st.caption(f"... and {len(skills) - 8} more skills")
                 except:
                     pass
             
@@ -1650,7 +1663,7 @@ def page_placement_dashboard():
                 
                 # Missing skills
                 try:
-                    missing_skills = json.loads(eval.missing_json or '[]')
+                    missing_skills = eval.missing
                     if missing_skills:
                         st.metric("Missing Skills", len(missing_skills))
                         with st.expander("View Missing Skills"):
@@ -0,0 +1,250 @@
+"""
+Deterministic synthetic corpus of resumes (PDF and DOCX) and job descriptions.
+
+Resumes vary in length and seniority and draw skills from the built-in skill taxonomy
+(``app.nlp.taxonomy``), so both the keyword matcher and the extractor have something to
+find. The same ``--seed`` always produces byte-identical files, so results
+from different commits are comparable.
+
+    python -m benchmarks.corpus --resumes 200 --jobs 20 --seed 42 --out data/bench_corpus
+
+Writes ``resumes/*.pdf|docx``, ``jobs/*.docx`` and ``manifest.json`` (file names, skills
+and structured job fields, used by ``benchmarks.suite``).
+"""
+import argparse
+import io
+import json
+import os
+import random
+import zipfile
+from typing import Dict, List
+from xml.sax.saxutils import escape
+
+from app.nlp.skills import DEFAULT_SKILLS
+
+FIRST_NAMES = ["Aarav", "Priya", "Rahul", "Ananya", "Vikram", "Sneha", "Arjun", "Divya", "Karan", "Meera",
+               "Rohan", "Isha", "Aditya", "Kavya", "Nikhil", "Pooja", "Siddharth", "Neha", "Varun", "Riya"]
+LAST_NAMES = ["Sharma", "Patel", "Iyer", "Reddy", "Gupta", "Nair", "Singh", "Mehta", "Rao", "Joshi"]
+CITIES = ["Bangalore", "Hyderabad", "Pune", "Chennai", "Mumbai", "Delhi", "Noida", "Gurgaon", "Kolkata", "Remote"]
+COMPANIES = ["Infosys", "TCS", "Wipro", "Accenture", "Flipkart", "Zomato", "Swiggy", "Razorpay", "Freshworks",
+             "Zoho", "Paytm", "Ola", "Myntra", "PhonePe", "Atlassian"]
+ROLES = ["Software Engineer", "Backend Developer", "Data Scientist", "Data Engineer", "Frontend Developer",
+         "DevOps Engineer", "Machine Learning Engineer", "Full Stack Developer", "QA Engineer", "Cloud Engineer"]
+DEGREES = ["B.Tech in Computer Science", "B.E. in Information Technology", "M.Tech in Data Science",
+           "MCA", "B.Sc in Computer Science", "M.Sc in Statistics", "BCA", "MBA"]
+CERTIFICATIONS = ["AWS Certified Solutions Architect", "Google Cloud Associate Engineer",
+                  "Microsoft Azure Fundamentals", "Certified Kubernetes Administrator", "Oracle Certified Java Programmer"]
+VERBS = ["Built", "Designed", "Implemented", "Optimized", "Migrated", "Led", "Automated", "Maintained", "Scaled"]
+OBJECTS = ["a REST API serving", "an ETL pipeline processing", "a recommendation service for", "a dashboard for",
+           "a CI/CD workflow covering", "a data warehouse with", "a microservice handling", "an internal tool used by"]
+SCALES = ["10k daily users", "2M records per day", "40 engineers", "5 product teams", "300 stores",
+          "1TB of logs", "12 microservices", "real-time payments"]
+FILLER = ("Collaborated with product managers and designers to ship features on schedule. "
+          "Wrote unit and integration tests and reviewed pull requests from peers. "
+          "Documented architecture decisions and mentored junior engineers. ")
+
+
+def skill_inventory() -> List[str]:
+    """Canonical skills of the built-in taxonomy"""
+    # Single letters ("r") and bare "go" match everywhere and make poor test skills
+    return [s for s in DEFAULT_SKILLS if len(s) > 2]
+
+
+def generate_resume(rng: random.Random, index: int, skills: List[str]) -> Dict:
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    city = rng.choice(CITIES)
+    years = rng.randint(0, 15)
+    own_skills = rng.sample(skills, rng.randint(4, 18))
+    n_jobs = max(1, min(6, years // 2 + rng.randint(0, 2)))
+    filler_paragraphs = rng.choice([0, 0, 1, 2, 4, 8])  # a few long resumes
+
+    lines = [
+        name,
+        f"{name.split()[0].lower()}.{index}@example.com | +91 9{rng.randint(100000000, 999999999)} | {city}",
+        "",
+        "SUMMARY",
+        f"{rng.choice(ROLES)} with {years} years of experience in {', '.join(own_skills[:3])}.",
+        "",
+        "EXPERIENCE",
+    ]
+    for j in range(n_jobs):
+        lines.append(f"{rng.choice(ROLES)} - {rng.choice(COMPANIES)} ({2024 - 2 * j - 2} - {2024 - 2 * j})")
+        for _ in range(rng.randint(2, 4)):
+            used = ", ".join(rng.sample(own_skills, min(2, len(own_skills))))
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(SCALES)} using {used}.")
+        for _ in range(filler_paragraphs):
+            lines.append(FILLER)
+    lines += ["", "EDUCATION", f"{rng.choice(DEGREES)}, {rng.choice(CITIES)} University, {2024 - years - 1}"]
+    if rng.random() < 0.5:
+        lines += ["", "CERTIFICATIONS"] + rng.sample(CERTIFICATIONS, rng.randint(1, 2))
+    lines += ["", "SKILLS", ", ".join(own_skills)]
+    return {
+        "student_name": name,
+        "location": city,
+        "years": years,
+        "skills": sorted(own_skills),
+        "text": "\n".join(lines),
+    }
+
+
+def generate_job(rng: random.Random, index: int, skills: List[str]) -> Dict:
+    title = rng.choice(ROLES)
+    required = rng.sample(skills, rng.randint(8, 14))
+    split = rng.randint(3, 6)
+    must, nice = required[:split], required[split:]
+    lines = [
+        f"{title} - {rng.choice(COMPANIES)}",
+        f"Location: {rng.choice(CITIES)}",
+        "",
+        "About the role",
+        f"We are hiring a {title} to join a team building {rng.choice(OBJECTS)} {rng.choice(SCALES)}.",
+        FILLER * rng.randint(1, 3),
+        "",
+        "Must have",
+    ] + [f"- Strong experience with {s}" for s in must] + [
+        "",
+        "Good to have",
+    ] + [f"- Exposure to {s}" for s in nice] + [
+        "",
+        "Qualifications",
+        f"{rng.choice(DEGREES)} or equivalent, {rng.randint(0, 8)}+ years of experience.",
+    ]
+    return {
+        "title": title,
+        "location": lines[1].split(": ", 1)[1],
+        "must_skills": must,
+        "nice_skills": nice,
+        "jd_text": "\n".join(lines),
+    }
+
+
+def _pdf_escape(line: str) -> str:
+    line = line.encode("latin-1", "replace").decode("latin-1")
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _wrap(text: str, width: int) -> List[str]:
+    out = []
+    for line in text.split("\n"):
+        while len(line) > width:
+            cut = line.rfind(" ", 0, width)
+            cut = cut if cut > 0 else width
+            out.append(line[:cut])
+            line = line[cut:].lstrip()
+        out.append(line)
+    return out
+
+
+def render_pdf(text: str, lines_per_page: int = 50) -> bytes:
+    """Minimal multi-page PDF (Helvetica, one text object per page)"""
+    lines = _wrap(text, 90)
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page in pages:
+        body = ["BT", "/F1 10 Tf", "12 TL", "50 770 Td"] + [f"({_pdf_escape(l)}) Tj T*" for l in page] + ["ET"]
+        stream = "\n".join(body).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + obj + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def render_docx(text: str) -> bytes:
+    """Minimal DOCX with one paragraph per line"""
+    paragraphs = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' for line in text.split("\n")
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{paragraphs}</w:body></w:document>'
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as z:
+        # Fixed timestamps keep the archive byte-identical across runs
+        for name, data in (("[Content_Types].xml", _DOCX_CONTENT_TYPES), ("_rels/.rels", _DOCX_RELS),
+                           ("word/document.xml", document)):
+            z.writestr(zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0)), data)
+    return out.getvalue()
+
+
+def generate_corpus(out_dir: str, n_resumes: int, n_jobs: int, seed: int = 42, pdf_share: float = 0.5) -> Dict:
+    """Write the corpus to ``out_dir`` and return its manifest"""
+    rng = random.Random(seed)
+    skills = skill_inventory()
+    os.makedirs(os.path.join(out_dir, "resumes"), exist_ok=True)
+    os.makedirs(os.path.join(out_dir, "jobs"), exist_ok=True)
+
+    manifest = {"seed": seed, "resumes": [], "jobs": []}
+    for i in range(n_jobs):
+        job = generate_job(rng, i, skills)
+        file_name = f"jobs/jd_{i:04d}.docx"
+        with open(os.path.join(out_dir, file_name), "wb") as f:
+            f.write(render_docx(job["jd_text"]))
+        manifest["jobs"].append({"file": file_name, **job})
+    for i in range(n_resumes):
+        resume = generate_resume(rng, i, skills)
+        ext = "pdf" if rng.random() < pdf_share else "docx"
+        file_name = f"resumes/resume_{i:04d}.{ext}"
+        data = render_pdf(resume["text"]) if ext == "pdf" else render_docx(resume["text"])
+        with open(os.path.join(out_dir, file_name), "wb") as f:
+            f.write(data)
+        manifest["resumes"].append({"file": file_name, **resume})
+
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--pdf-share", type=float, default=0.5, help="fraction of resumes written as PDF")
+    parser.add_argument("--out", default="data/bench_corpus")
+    args = parser.parse_args()
+
+    manifest = generate_corpus(args.out, args.resumes, args.jobs, seed=args.seed, pdf_share=args.pdf_share)
+    print(f"Wrote {len(manifest['resumes'])} resumes and {len(manifest['jobs'])} jobs to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Compare the PyTorch (sentence-transformers) and quantized ONNX embedding backends.
+
+Uses resume/JD pairs stored in the app database (evaluated pairs first, then the cross
+product of resumes and jobs) and reports encoding throughput for each backend plus how
+closely the ONNX vectors and pair similarities track the PyTorch reference.
+
+    python -m benchmarks.embedding_backends --pairs 200 --threads 1,4 --out bench_embeddings.json
+"""
+import argparse
+import json
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.config import EMBEDDINGS_MODEL, ONNX_MODEL_DIR, EMBEDDING_BATCH_SIZE
+from app.db.database import SessionLocal
+from app.db import models
+
+
+def load_pairs(limit: int) -> List[Tuple[str, str]]:
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(models.Resume.text, models.Job.jd_text)
+            .join(models.Evaluation, models.Evaluation.resume_id == models.Resume.id)
+            .join(models.Job, models.Job.id == models.Evaluation.job_id)
+            .limit(limit)
+            .all()
+        )
+        pairs = [(r, j) for r, j in rows]
+        if len(pairs) < limit:
+            resumes = [t for (t,) in db.query(models.Resume.text).limit(limit).all()]
+            jobs = [t for (t,) in db.query(models.Job.jd_text).limit(limit).all()]
+            for r in resumes:
+                for j in jobs:
+                    if len(pairs) >= limit:
+                        break
+                    pairs.append((r, j))
+        return pairs
+    finally:
+        db.close()
+
+
+def time_encode(model, texts: List[str], batch_size: int, repeat: int) -> Tuple[np.ndarray, float]:
+    model.encode(texts[:batch_size], batch_size=batch_size, normalize_embeddings=True)  # warm-up
+    best = float("inf")
+    vecs = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        vecs = model.encode(texts, batch_size=batch_size, normalize_embeddings=True)
+        best = min(best, time.perf_counter() - start)
+    return np.asarray(vecs, dtype=np.float32), best
+
+
+def _ranks(x: np.ndarray) -> np.ndarray:
+    ranks = np.empty(len(x))
+    ranks[np.argsort(x, kind="stable")] = np.arange(len(x))
+    return ranks
+
+
+def agreement(reference: np.ndarray, candidate: np.ndarray, pair_index: np.ndarray) -> Dict:
+    per_text = np.sum(reference * candidate, axis=1)
+    ref_sim = np.sum(reference[pair_index[:, 0]] * reference[pair_index[:, 1]], axis=1)
+    cand_sim = np.sum(candidate[pair_index[:, 0]] * candidate[pair_index[:, 1]], axis=1)
+    diff = np.abs(ref_sim - cand_sim)
+    spearman = float(np.corrcoef(_ranks(ref_sim), _ranks(cand_sim))[0, 1]) if len(ref_sim) > 1 else 1.0
+    return {
+        "vector_cosine_mean": round(float(per_text.mean()), 5),
+        "vector_cosine_min": round(float(per_text.min()), 5),
+        "pair_similarity_abs_diff_mean": round(float(diff.mean()), 5),
+        "pair_similarity_abs_diff_max": round(float(diff.max()), 5),
+        "pair_similarity_spearman": round(spearman, 5),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--threads", default="1,4", help="comma-separated thread counts to try")
+    parser.add_argument("--batch-size", type=int, default=EMBEDDING_BATCH_SIZE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--model-dir", default=ONNX_MODEL_DIR)
+    parser.add_argument("--out", default="bench_embeddings.json")
+    args = parser.parse_args()
+
+    pairs = load_pairs(args.pairs)
+    if not pairs:
+        raise SystemExit("No resumes/jobs in the database; upload some before benchmarking")
+    texts = sorted({t for pair in pairs for t in pair})
+    position = {t: i for i, t in enumerate(texts)}
+    pair_index = np.array([(position[r], position[j]) for r, j in pairs])
+    print(f"{len(pairs)} pairs, {len(texts)} unique texts")
+
+    results = {"pairs": len(pairs), "texts": len(texts), "batch_size": args.batch_size, "backends": {}}
+    reference = None
+    for threads in [int(t) for t in args.threads.split(",")]:
+        try:
+            import torch
+            from sentence_transformers import SentenceTransformer
+            torch.set_num_threads(threads)
+            model = SentenceTransformer(EMBEDDINGS_MODEL, device="cpu")
+            vecs, seconds = time_encode(model, texts, args.batch_size, args.repeat)
+            reference = vecs if reference is None else reference
+            results["backends"][f"torch-{threads}t"] = {"seconds": round(seconds, 4), "texts_per_second": round(len(texts) / seconds, 1)}
+        except ImportError:
+            print("Skipping torch: sentence-transformers not installed")
+
+        from app.nlp.onnx_embedder import OnnxEmbedder
+        onnx_model = OnnxEmbedder(args.model_dir, num_threads=threads, batch_size=args.batch_size)
+        vecs, seconds = time_encode(onnx_model, texts, args.batch_size, args.repeat)
+        entry = {"model_file": onnx_model.model_path, "seconds": round(seconds, 4), "texts_per_second": round(len(texts) / seconds, 1)}
+        if reference is not None:
+            entry.update(agreement(reference, vecs, pair_index))
+        results["backends"][f"onnx-{threads}t"] = entry
+
+        for name in (f"torch-{threads}t", f"onnx-{threads}t"):
+            if name in results["backends"]:
+                print(f"{name}: {results['backends'][name]}")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Regex-based entity extraction on long resumes: precompiled bank vs. per-pattern passes.
+
+Times ``app.nlp.regex_bank`` (one combined pass per family) against the previous
+implementation (one ``re.findall`` per pattern, education regexes rebuilt per degree)
+for normalization, experience years, education and certifications, on synthetic
+resumes padded to ``--kb`` kilobytes.
+
+    python -m benchmarks.entity_regex --resumes 50 --kb 20 --out bench_entity_regex.json
+"""
+import argparse
+import json
+import random
+import re
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.corpus import generate_resume, skill_inventory
+from benchmarks.suite import summarize
+from app.nlp import regex_bank
+
+LEGACY_EXPERIENCE = [
+    r'(\d+)\s*(?:\+)?\s*(?:years?|yrs?)\s*(?:of\s*)?(?:experience|exp)',
+    r'experience\s*[:\-]\s*(\d+)\s*(?:years?|yrs?)',
+    r'(\d+)\s*(?:\+)?\s*(?:years?|yrs?)\s*in',
+    r'over\s*(\d+)\s*(?:years?|yrs?)',
+    r'more\s*than\s*(\d+)\s*(?:years?|yrs?)',
+]
+LEGACY_CERTIFICATION = [
+    r'certified?\s+[\w\s]+(?:professional|specialist|expert|developer|administrator)',
+    r'[\w\s]+\s+certification',
+    r'aws\s+[\w\s]+(?:associate|professional)',
+    r'microsoft\s+[\w\s]+(?:associate|expert)',
+    r'google\s+[\w\s]+(?:associate|professional)',
+    r'cisco\s+[\w\s]+(?:associate|professional)',
+]
+# Degree lines whose field runs past the first field keyword (or has none)
+EDUCATION_LINES = [
+    "B.Tech in Computer Science and Engineering",
+    "Bachelor of Science in Physics",
+    "Master of Business Administration",
+    "M.Sc in Data Science and Artificial Intelligence",
+]
+LEGACY_ABBREVIATIONS = {
+    r'\byrs?\b': 'years',
+    r'\bexp\b': 'experience',
+    r'\btech\b': 'technology',
+    r'\buniv\b': 'university',
+    r'\bcert\b': 'certification',
+}
+
+
+def legacy_normalize(text: str) -> str:
+    text = re.sub(r'[^\w\s\-\.+#/]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\b(page \d+ of \d+|confidential|resume|cv)\b', '', text, flags=re.IGNORECASE)
+    for pattern, replacement in LEGACY_ABBREVIATIONS.items():
+        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+    return text.strip()
+
+
+def legacy_experience(text: str) -> List[int]:
+    years = []
+    for pattern in LEGACY_EXPERIENCE:
+        years.extend(int(m) for m in re.findall(pattern, text, re.IGNORECASE) if m.isdigit())
+    return sorted(set(years), reverse=True)
+
+
+def legacy_education(text: str) -> List[str]:
+    education = []
+    for degree in regex_bank.EDUCATION_DEGREES:
+        pattern = rf'\b{degree}[\w\s]*(?:in|of)\s+[\w\s]+(?:science|engineering|technology|business|arts|studies)?'
+        education.extend(re.findall(pattern, text, re.IGNORECASE))
+    return education
+
+
+def legacy_certifications(text: str) -> List[str]:
+    found = []
+    for pattern in LEGACY_CERTIFICATION:
+        found.extend(re.findall(pattern, text, re.IGNORECASE))
+    return found
+
+
+def long_resumes(n: int, kb: int, seed: int) -> List[str]:
+    """Synthetic resumes, each built from generated sections until it reaches ``kb`` KB"""
+    rng = random.Random(seed)
+    inventory = skill_inventory()
+    texts = []
+    for i in range(n):
+        parts, size = [], 0
+        while size < kb * 1024:
+            parts.append(generate_resume(rng, i, inventory)["text"])
+            size += len(parts[-1]) + 1
+        texts.append("\n".join(parts)[:kb * 1024])
+    return texts
+
+
+def time_fn(fn: Callable, texts: List[str]) -> Dict:
+    fn(texts[0])
+    samples = []
+    for text in texts:
+        start = time.perf_counter()
+        fn(text)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=50)
+    parser.add_argument("--kb", type=int, default=20, help="size of each resume in kilobytes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default="bench_entity_regex.json")
+    args = parser.parse_args()
+
+    raw = long_resumes(args.resumes, args.kb, args.seed)
+    normalized = [regex_bank.normalize(t) for t in raw]
+    families = {
+        "normalize": (legacy_normalize, regex_bank.normalize, raw),
+        "experience": (legacy_experience, regex_bank.experience_years, normalized),
+        "education": (legacy_education, regex_bank.education_mentions, normalized),
+        "certifications": (legacy_certifications, regex_bank.certification_mentions, normalized),
+    }
+
+    results = {"resumes": args.resumes, "kb": args.kb, "families": {}}
+    for name, (legacy, bank, texts) in families.items():
+        before, after = time_fn(legacy, texts), time_fn(bank, texts)
+        speedup = round(before["p50_ms"] / max(after["p50_ms"], 1e-6), 2)
+        results["families"][name] = {"legacy": before, "bank": after, "speedup_p50": speedup}
+        print(f"{name:15} legacy p50 {before['p50_ms']:>9} ms   bank p50 {after['p50_ms']:>9} ms   {speedup}x")
+    results["experience_outputs_equal"] = all(legacy_experience(t) == regex_bank.experience_years(t) for t in normalized)
+    print(f"experience outputs equal: {results['experience_outputs_equal']}")
+    results["education_lines"] = {}
+    for line in EDUCATION_LINES:
+        text = regex_bank.normalize(line)
+        row = {"legacy": legacy_education(text), "bank": regex_bank.education_mentions(text)}
+        results["education_lines"][line] = row
+        print(f"{line:50} legacy {row['legacy']}   bank {row['bank']}")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measure cold import time of the API and Streamlit entry modules.
+
+Each module is imported in a fresh interpreter several times; the median wall time is
+reported together with the slowest imports from ``python -X importtime``, and a list of
+heavy packages that were (unexpectedly) imported.
+
+    python -m benchmarks.import_time --runs 5 --out bench_import_time.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+DEFAULT_MODULES = ["app.api.main", "app.web.streamlit_app", "app.services.evaluator"]
+HEAVY_PACKAGES = ["torch", "sentence_transformers", "spacy", "nltk", "langchain", "chromadb", "faiss", "sklearn"]
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy_loaded": heavy}}))
+"""
+
+
+def _run(module: str, cwd: str) -> Dict:
+    code = _PROBE.format(module=module, heavy=HEAVY_PACKAGES)
+    out = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{out.stderr}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _slowest_imports(module: str, cwd: str, top: int) -> List[Dict]:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  <self us> | <cumulative us> | <module>"
+        self_us, cumulative_us, name = [p.strip() for p in line.split("|")]
+        rows.append({
+            "module": name,
+            "self_ms": int(self_us.split(":")[-1]) / 1000.0,
+            "cumulative_ms": int(cumulative_us) / 1000.0,
+        })
+    rows.sort(key=lambda r: r["self_ms"], reverse=True)
+    return rows[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to report per module")
+    parser.add_argument("--out", default="bench_import_time.json")
+    args = parser.parse_args()
+
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = {}
+    for module in args.modules:
+        runs = [_run(module, cwd) for _ in range(args.runs)]
+        seconds = [r["seconds"] for r in runs]
+        results[module] = {
+            "median_seconds": round(statistics.median(seconds), 4),
+            "min_seconds": round(min(seconds), 4),
+            "max_seconds": round(max(seconds), 4),
+            "heavy_loaded": runs[-1]["heavy_loaded"],
+            "slowest_imports": _slowest_imports(module, cwd, args.top),
+        }
+        print(f"{module}: median {results[module]['median_seconds']}s, heavy packages loaded: {results[module]['heavy_loaded'] or 'none'}")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
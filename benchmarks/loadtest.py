@@ -0,0 +1,268 @@
+"""
+Load test for the API: throughput, latency percentiles and error rates per operation.
+
+By default an API server is started in this process (uvicorn on a background thread, in
+a scratch working directory) with the stub LLM from ``benchmarks.stub_llm`` installed and
+the embedding model warmed up, then ``--concurrency`` closed-loop workers issue requests
+picked from ``--mix`` for ``--duration`` seconds. Resumes and JDs come from the synthetic
+corpus (``benchmarks.corpus``; generated on first use).
+
+    python -m benchmarks.loadtest --concurrency 8 --duration 60 --out bench_loadtest.json
+    python -m benchmarks.loadtest --mix apply=1,evaluate=1 --llm-latency-ms 1500
+    python -m benchmarks.loadtest --url http://127.0.0.1:8000   # an already running server
+
+Operations: ``apply`` (POST /student-applications/), ``evaluate`` (POST /evaluate/),
+``create_job`` (POST /jobs/), ``list_jobs``, ``list_applications``, ``search_resumes``,
+``search_jobs``. ``applications_per_minute`` counts successful apply + evaluate requests.
+Needs httpx (installed with FastAPI's test client).
+"""
+import argparse
+import json
+import os
+import random
+import socket
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import httpx
+
+from benchmarks.corpus import generate_corpus
+from benchmarks.suite import summarize
+
+DEFAULT_MIX = "apply=3,evaluate=3,list_jobs=2,list_applications=1,search_resumes=1,search_jobs=1,create_job=0.2"
+SEARCH_QUERIES = ["python developer", "data engineer with spark", "react frontend", "devops kubernetes aws",
+                  "machine learning pytorch", "java backend microservices"]
+OPERATIONS = ("apply", "evaluate", "create_job", "list_jobs", "list_applications", "search_resumes", "search_jobs")
+APPLICATION_OPS = ("apply", "evaluate")
+
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in OPERATIONS:
+            raise SystemExit(f"Unknown operation '{name}'; choose from {', '.join(OPERATIONS)}")
+        mix.append((name.strip(), float(weight or 1)))
+    return mix
+
+
+class Workload:
+    """Request builders over the corpus; each returns an httpx response"""
+
+    def __init__(self, client: httpx.Client, manifest: Dict, corpus_dir: str, job_ids: List[int]):
+        self.client = client
+        self.manifest = manifest
+        self.job_ids = job_ids
+        self.files = {r["file"]: open(os.path.join(corpus_dir, r["file"]), "rb").read() for r in manifest["resumes"]}
+
+    def _resume(self, rng: random.Random):
+        resume = rng.choice(self.manifest["resumes"])
+        name = os.path.basename(resume["file"])
+        return resume, {"file": (name, self.files[resume["file"]])}
+
+    def apply(self, rng):
+        resume, files = self._resume(rng)
+        data = {
+            "job_id": str(rng.choice(self.job_ids)),
+            "student_name": resume["student_name"],
+            "email": f"{resume['student_name'].split()[0].lower()}.{rng.randint(0, 10**6)}@example.com",
+            "location": resume["location"],
+        }
+        return self.client.post("/student-applications/", data=data, files=files)
+
+    def evaluate(self, rng):
+        resume, files = self._resume(rng)
+        params = {"job_id": rng.choice(self.job_ids), "student_name": resume["student_name"], "location": resume["location"]}
+        return self.client.post("/evaluate/", params=params, files=files)
+
+    def create_job(self, rng):
+        job = rng.choice(self.manifest["jobs"])
+        payload = {k: job[k] for k in ("title", "jd_text", "must_skills", "nice_skills", "location")}
+        return self.client.post("/jobs/", json=payload)
+
+    def list_jobs(self, rng):
+        return self.client.get("/jobs/")
+
+    def list_applications(self, rng):
+        return self.client.get("/student-applications/", params={"job_id": rng.choice(self.job_ids)})
+
+    def search_resumes(self, rng):
+        return self.client.get("/search/resumes", params={"query": rng.choice(SEARCH_QUERIES), "limit": 10})
+
+    def search_jobs(self, rng):
+        return self.client.get("/search/jobs", params={"query": rng.choice(SEARCH_QUERIES), "limit": 10})
+
+
+def seed_jobs(client: httpx.Client, manifest: Dict) -> List[int]:
+    ids = []
+    for job in manifest["jobs"]:
+        payload = {k: job[k] for k in ("title", "jd_text", "must_skills", "nice_skills", "location")}
+        response = client.post("/jobs/", json=payload)
+        response.raise_for_status()
+        ids.append(response.json()["id"])
+    return ids
+
+
+def run_load(workload: Workload, mix: List[Tuple[str, float]], concurrency: int, duration: float, seed: int) -> Dict:
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    samples: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(index: int):
+        rng = random.Random(seed * 1000 + index)
+        while time.perf_counter() < deadline:
+            op = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            try:
+                response = getattr(workload, op)(rng)
+                outcome = None if response.status_code < 400 else str(response.status_code)
+            except httpx.HTTPError as e:
+                outcome = type(e).__name__
+            elapsed = time.perf_counter() - start
+            with lock:
+                samples[op].append(elapsed)
+                if outcome:
+                    errors[op][outcome] += 1
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    operations = {}
+    for op in names:
+        if not samples[op]:
+            continue
+        count, failed = len(samples[op]), sum(errors[op].values())
+        operations[op] = {
+            **summarize(samples[op]),
+            "errors": failed,
+            "error_rate": round(failed / count, 4),
+            "error_kinds": dict(errors[op]),
+            "per_minute": round(60 * (count - failed) / elapsed, 1),
+        }
+    all_samples = [s for op in samples.values() for s in op]
+    total_errors = sum(sum(e.values()) for e in errors.values())
+    succeeded_applications = sum(len(samples[op]) - sum(errors[op].values()) for op in APPLICATION_OPS)
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "requests": len(all_samples),
+        "requests_per_second": round(len(all_samples) / elapsed, 2),
+        "error_rate": round(total_errors / len(all_samples), 4) if all_samples else None,
+        "applications_per_minute": round(60 * succeeded_applications / elapsed, 1),
+        "latency": summarize(all_samples) if all_samples else None,
+        "operations": operations,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_local_server(args) -> Tuple[str, Dict]:
+    """Start the API in this process with the stub LLM; returns (base url, server info)"""
+    # Imported after chdir: the app resolves data paths relative to the working directory
+    import uvicorn
+    from app.api.main import app
+    from app.services.llm_evaluator import get_llm_evaluator
+    from app.services.warmup import warm_up
+    from app.nlp import embeddings
+    from benchmarks.stub_llm import install_stub_llm
+
+    if not args.no_warmup:
+        warm_up()
+    install_stub_llm(get_llm_evaluator(), args.llm_latency_ms, args.llm_jitter_ms, args.llm_failure_rate, args.seed)
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    info = {
+        "mode": "in-process",
+        "embedding_backend": embeddings.embedding_model_id() or "tfidf",
+        "llm": {"latency_ms": args.llm_latency_ms, "jitter_ms": args.llm_jitter_ms, "failure_rate": args.llm_failure_rate},
+    }
+    return f"http://127.0.0.1:{port}", info
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="target an already running API instead of starting one")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=60, help="seconds of load")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="comma-separated operation=weight")
+    parser.add_argument("--corpus", default="data/bench_corpus", help="corpus directory (generated if missing)")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--llm-latency-ms", type=float, default=800)
+    parser.add_argument("--llm-jitter-ms", type=float, default=200)
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument("--no-warmup", action="store_true", help="do not preload models before the run")
+    parser.add_argument("--timeout", type=float, default=120, help="per-request timeout in seconds")
+    parser.add_argument("--workdir", default=None, help="scratch directory for the in-process server (default: temporary)")
+    parser.add_argument("--out", default="bench_loadtest.json")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    corpus_dir = os.path.abspath(args.corpus)
+    out_path = os.path.abspath(args.out)
+    manifest_path = os.path.join(corpus_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    else:
+        manifest = generate_corpus(corpus_dir, args.resumes, args.jobs, seed=args.seed)
+
+    if args.url:
+        base_url, server = args.url.rstrip("/"), {"mode": "external", "url": args.url}
+    else:
+        workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="bench_loadtest_"))
+        os.makedirs(workdir, exist_ok=True)
+        os.chdir(workdir)
+        base_url, server = start_local_server(args)
+        server["workdir"] = workdir
+    print(f"Target: {base_url}")
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    with httpx.Client(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        job_ids = seed_jobs(client, manifest)
+        workload = Workload(client, manifest, corpus_dir, job_ids)
+        print(f"Seeded {len(job_ids)} jobs; running {args.concurrency} workers for {args.duration:.0f}s")
+        outcome = run_load(workload, mix, args.concurrency, args.duration, args.seed)
+
+    results = {
+        "created_at": datetime.utcnow().isoformat(),
+        "server": server,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "mix": dict(mix),
+        **outcome,
+    }
+    print(f"\n{'operation':18} {'count':>7} {'err%':>6} {'/min':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for op, stats in outcome["operations"].items():
+        print(f"{op:18} {stats['n']:>7} {100 * stats['error_rate']:>6.1f} {stats['per_minute']:>8} "
+              f"{stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}")
+    print(f"\n{outcome['requests_per_second']} req/s, error rate {outcome['error_rate']}, "
+          f"{outcome['applications_per_minute']} applications/min")
+
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
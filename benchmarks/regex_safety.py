@@ -0,0 +1,133 @@
+"""
+Worst-case timing of regex entity extraction on adversarial inputs.
+
+Runs the regex extraction stage (``app.nlp.regex_bank``: normalization, experience,
+education, certifications and contact details, on both the normalized and the raw text as
+the JD parser does) over ``--kb`` kilobyte inputs built to provoke backtracking: long
+whitespace runs, endless word runs with no terminator, repeated keywords, digit and
+e-mail-like runs, plus seeded random token soups. Each input must finish within
+``--budget-ms``, and time must grow about linearly from a quarter-size input; the run
+exits non-zero otherwise. ``--legacy-kb`` also times the previous unbounded patterns
+(``benchmarks.entity_regex``) on smaller inputs for comparison.
+
+    python -m benchmarks.regex_safety --kb 100 --budget-ms 500 --out bench_regex_safety.json
+"""
+import argparse
+import json
+import random
+import time
+from typing import Callable, Dict, List
+
+from app.nlp import regex_bank
+from benchmarks.entity_regex import legacy_certifications, legacy_education, legacy_experience, legacy_normalize
+
+FUZZ_TOKENS = ["a", "word", " ", "  ", "\t", "\n", "5", "+", ".", "-", "@", "certification", "certified", "aws",
+               "microsoft", "associate", "bachelor", "b.tech", "in", "of", "science", "years", "experience", "over"]
+
+
+def adversarial_inputs(size: int, seed: int) -> Dict[str, str]:
+    """Named inputs of about ``size`` characters"""
+    def fill(unit: str) -> str:
+        return (unit * (size // len(unit) + 1))[:size]
+
+    rng = random.Random(seed)
+    inputs = {
+        "whitespace_run": "certified" + " " * (size - 9),
+        "mixed_whitespace": fill(" \t \n  \t"),
+        "single_word": "a" * size,
+        "word_run_no_terminator": fill("alpha beta gamma "),
+        "certified_no_title": fill("certified "),
+        "vendor_no_level": fill("aws cloud "),
+        "degree_no_field": fill("bachelor in "),
+        "degree_repeated": fill("b.tech m.sc be me "),
+        "digits": "1" * size,
+        "years_no_context": fill("5 years "),
+        "email_like": fill("a.") + "@",
+        "email_local_run": fill("a_b-c.d%") + "@x",
+        "phone_like": fill("1 2-3 (4) "),
+        "certification_words": fill("security certification "),
+    }
+    for i in range(3):
+        parts, n = [], 0
+        while n < size:
+            parts.append(rng.choice(FUZZ_TOKENS))
+            parts.append(rng.choice(["", " ", " "]))
+            n += len(parts[-1]) + len(parts[-2])
+        inputs[f"fuzz_{i}"] = "".join(parts)[:size]
+    return inputs
+
+
+def extract_all(text: str):
+    """The regex stage of entity extraction plus the JD parser's raw-text certification pass"""
+    normalized = regex_bank.normalize(text)
+    return (
+        regex_bank.experience_years(normalized),
+        regex_bank.education_mentions(normalized),
+        regex_bank.certification_mentions(normalized),
+        [p.search(normalized) for p in (regex_bank.EMAIL, regex_bank.PHONE, regex_bank.LINKEDIN)],
+        regex_bank.certification_mentions(text.lower()),
+        regex_bank.EMAIL.search(text),
+    )
+
+
+def extract_all_legacy(text: str):
+    normalized = legacy_normalize(text)
+    return legacy_experience(normalized), legacy_education(normalized), legacy_certifications(normalized)
+
+
+def best_of(fn: Callable, text: str, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--kb", type=int, default=100, help="size of each adversarial input")
+    parser.add_argument("--budget-ms", type=float, default=500, help="maximum extraction time per input")
+    parser.add_argument("--max-growth", type=float, default=8.0,
+                        help="maximum time ratio between the full and the quarter-size input (4 is linear)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--legacy-kb", type=int, default=0, help="also time the old patterns on inputs of this size")
+    parser.add_argument("--out", default="bench_regex_safety.json")
+    args = parser.parse_args()
+
+    size = args.kb * 1024
+    full = adversarial_inputs(size, args.seed)
+    quarter = adversarial_inputs(size // 4, args.seed)
+    legacy = adversarial_inputs(args.legacy_kb * 1024, args.seed) if args.legacy_kb else {}
+
+    results: Dict = {"kb": args.kb, "budget_ms": args.budget_ms, "max_growth": args.max_growth, "inputs": {}}
+    failures: List[str] = []
+    print(f"{'input':24} {'ms':>9} {'quarter ms':>11} {'growth':>7}" + (f" {'legacy ms':>11}" if legacy else ""))
+    for name, text in full.items():
+        elapsed = best_of(extract_all, text, args.repeat)
+        small = best_of(extract_all, quarter[name], args.repeat)
+        # Below a millisecond the ratio is mostly noise
+        growth = elapsed / small if small > 0.001 else None
+        row = {"ms": round(1000 * elapsed, 3), "quarter_ms": round(1000 * small, 3),
+               "growth": round(growth, 2) if growth else None}
+        if legacy:
+            row["legacy_ms"] = round(1000 * best_of(extract_all_legacy, legacy[name], 1), 3)
+            row["legacy_kb"] = args.legacy_kb
+        row["ok"] = row["ms"] <= args.budget_ms and (growth is None or growth <= args.max_growth)
+        if not row["ok"]:
+            failures.append(name)
+        results["inputs"][name] = row
+        print(f"{name:24} {row['ms']:>9} {row['quarter_ms']:>11} {str(row['growth']):>7}"
+              + (f" {row['legacy_ms']:>11}" if legacy else "") + ("" if row["ok"] else "  <-- over budget"))
+
+    results["failures"] = failures
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+    if failures:
+        raise SystemExit(f"{len(failures)} input(s) over the time budget or growing super-linearly: {', '.join(failures)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Resume segmentation cases that used to lose content from the LLM prompt.
+
+Each case segments a resume (``app.parsing.sections``), builds the prompt text and checks
+that the lines that matter are still in it. Section cases check that "label: value" lines
+stay in the section they appear in and that sectioned entity extraction finds at least
+what extraction over the whole text finds. Exits non-zero when any case fails.
+
+    python -m benchmarks.sections_check
+"""
+import sys
+from typing import Dict, List, Tuple
+
+from app.nlp.advanced_processor import get_text_processor
+from app.parsing.sections import prompt_text, segment_resume
+
+# name -> (resume text, lines that must reach the prompt, lines that must not)
+CASES: Dict[str, Tuple[str, List[str], List[str]]] = {
+    # "Languages" is also an "other" heading (spoken languages); inline inside SKILLS it is
+    # a sub-label and must not move the skills out of the prompt
+    "inline_sublabel_in_skills": (
+        "Priya Sharma\n"
+        "priya.sharma@example.com | +91 98765 43210\n"
+        "SKILLS\n"
+        "Languages: Python, Java, C++\n"
+        "Frameworks: Django, React\n"
+        "EXPERIENCE\n"
+        "Software Engineer, Acme Corp, 2020 - 2023\n"
+        "Built REST APIs in Django serving 2M requests a day\n"
+        "EDUCATION\n"
+        "B.Tech in Computer Science\n",
+        ["Languages: Python, Java, C++", "Frameworks: Django, React", "Built REST APIs in Django"],
+        ["priya.sharma@example.com"],
+    ),
+    # None of the headings is known, so everything but EDUCATION sits in the header
+    "nonstandard_headings": (
+        "Rahul Verma\n"
+        "rahul.verma@example.com | linkedin.com/in/rahulverma\n"
+        "PROFESSIONAL SNAPSHOT\n"
+        "Backend engineer with 5 years of experience in distributed systems\n"
+        "TECHNICAL PROFICIENCIES\n"
+        "Go, Kubernetes, PostgreSQL, Kafka\n"
+        "CAREER HIGHLIGHTS\n"
+        "Senior Engineer, Globex, 2019 - 2024\n"
+        "Led the migration of the payments platform to Kubernetes\n"
+        "EDUCATION\n"
+        "B.Tech in CS\n",
+        ["Go, Kubernetes, PostgreSQL, Kafka", "Led the migration of the payments platform", "B.Tech in CS"],
+        [],
+    ),
+}
+
+
+# name -> (resume text, section -> lines that must be in it)
+SECTION_CASES: Dict[str, Tuple[str, Dict[str, List[str]]]] = {
+    label.lower().replace(" ", "_") + "_label_in_experience": (
+        "Anita Rao\n"
+        "SUMMARY\n"
+        "Backend developer\n"
+        "EXPERIENCE\n"
+        "Software Engineer, Initech, 2019 - 2024\n"
+        f"{label}: Python, Django, PostgreSQL\n"
+        "Led a team of 4 with 5 years of experience in backend services\n"
+        "EDUCATION\n"
+        "B.Tech in Computer Science\n",
+        {"experience": [f"{label}: Python, Django, PostgreSQL", "5 years of experience in backend"],
+         "education": ["B.Tech in Computer Science"]},
+    )
+    for label in ("Tech stack", "Technologies", "Tools")
+}
+
+
+def run_case(text: str, required: List[str], excluded: List[str]) -> List[str]:
+    """Problems found for one case (empty when it passes)"""
+    prompt = prompt_text(segment_resume(text), text)
+    problems = [f"missing from prompt: {line!r}" for line in required if line not in prompt]
+    problems += [f"should not be in prompt: {line!r}" for line in excluded if line in prompt]
+    return problems
+
+
+def run_section_case(text: str, expected: Dict[str, List[str]]) -> List[str]:
+    sections = segment_resume(text)
+    problems = [
+        f"not in {name}: {line!r}"
+        for name, lines in expected.items() for line in lines if line not in sections.get(name, "")
+    ]
+    processor = get_text_processor()
+    with_sections = processor.extract_entities(text, sections).experience_years
+    whole_text = processor.extract_entities(text).experience_years
+    if not set(whole_text) <= set(with_sections):
+        problems.append(f"experience years {with_sections} with sections, {whole_text} without")
+    return problems
+
+
+def main():
+    failed = 0
+    checks = [(name, run_case(*case)) for name, case in CASES.items()]
+    checks += [(name, run_section_case(*case)) for name, case in SECTION_CASES.items()]
+    for name, problems in checks:
+        print(f"{name:40} {'ok' if not problems else 'FAIL'}")
+        for problem in problems:
+            print(f"    {problem}")
+        failed += bool(problems)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Skill extraction over a large taxonomy: token-index lookup vs. per-skill substring scans.
+
+Builds a taxonomy of ``--skills`` entries (the built-in one padded with synthetic names,
+some multi-word or with "+", "#", "." and "/"), then times ``SkillTaxonomy.find_in`` and
+the previous approach (``skill in text`` for every name and alias) over synthetic
+resumes. Also reports how many matches the substring scan finds inside other words.
+
+    python -m benchmarks.skill_extraction --skills 5000 --resumes 200 --out bench_skill_extraction.json
+"""
+import argparse
+import json
+import random
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.corpus import generate_resume, skill_inventory
+from benchmarks.suite import summarize
+from app.nlp.taxonomy import SkillTaxonomy, default_entries, normalize_skill
+
+SYLLABLES = ["ka", "zu", "ro", "mi", "tek", "lon", "vex", "qua", "dra", "pho", "sty", "ne", "bri", "gor", "ix", "ul"]
+SUFFIXES = ["", "", "", ".js", "++", "#", " db", " ml", " cloud", "/ops", "-ng", " studio"]
+
+# Text where bare substring matching goes wrong
+BOUNDARY_CASES: List[Tuple[str, List[str]]] = [
+    ("Skills: C++, C#, CI/CD and Node.js", ["c#", "c++", "ci/cd", "node.js"]),
+    ("Reports by Google on cargo logistics", []),
+    ("JavaScript and TypeScript", ["javascript", "typescript"]),
+    ("Deployed with k8s and Postgres", ["kubernetes", "postgresql"]),
+    ("MSSQL, not mysql", ["mysql", "sql server"]),
+    # Ambiguous spellings: everyday words are not skills, list items are
+    ("A go to market plan for our R&D team", []),
+    ("Less than a year, but I express interest", []),
+    ("Languages: Python, Go and R", ["go", "python", "r"]),
+]
+
+
+def synthetic_entries(n: int, seed: int) -> List[Tuple[str, str, List[str]]]:
+    """The built-in taxonomy padded to ``n`` skills with made-up names"""
+    rng = random.Random(seed)
+    entries = default_entries()
+    names = {name for name, _, _ in entries}
+    while len(entries) < n:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        name = normalize_skill(word + rng.choice(SUFFIXES))
+        if name in names:
+            continue
+        names.add(name)
+        aliases = [word + "x"] if rng.random() < 0.2 else []
+        entries.append((name, "synthetic", aliases))
+    return entries
+
+
+def substring_scan(terms: Dict[str, str], text: str) -> List[str]:
+    """The previous extractor: ``term in text`` for every name and alias"""
+    text_norm = normalize_skill(text)
+    return sorted({canonical for term, canonical in terms.items() if term in text_norm})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills", type=int, default=5000, help="taxonomy size")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default="bench_skill_extraction.json")
+    args = parser.parse_args()
+
+    entries = synthetic_entries(args.skills, args.seed)
+    start = time.perf_counter()
+    taxonomy = SkillTaxonomy(entries)
+    compile_ms = round(1000 * (time.perf_counter() - start), 2)
+
+    rng = random.Random(args.seed)
+    inventory = skill_inventory()
+    texts = [generate_resume(rng, i, inventory)["text"] for i in range(args.resumes)]
+
+    results = {
+        "skills": len(taxonomy.skills),
+        "terms": len(taxonomy.terms),
+        "resumes": len(texts),
+        "mean_resume_chars": round(sum(map(len, texts)) / len(texts)),
+        "compile_ms": compile_ms,
+        "cases": {},
+    }
+    outputs = {}
+    for name, fn in (("token_index", taxonomy.find_in), ("substring_scan", lambda t: substring_scan(taxonomy.lookup, t))):
+        samples, found = [], []
+        for text in texts:
+            t0 = time.perf_counter()
+            found.append(fn(text))
+            samples.append(time.perf_counter() - t0)
+        results["cases"][name] = summarize(samples)
+        outputs[name] = found
+        print(f"{name}: p50 {results['cases'][name]['p50_ms']} ms, p95 {results['cases'][name]['p95_ms']} ms")
+
+    extra = sum(len(set(s) - set(t)) for s, t in zip(outputs["substring_scan"], outputs["token_index"]))
+    results["substring_only_matches"] = extra
+    results["speedup_p50"] = round(
+        results["cases"]["substring_scan"]["p50_ms"] / max(results["cases"]["token_index"]["p50_ms"], 1e-6), 1
+    )
+    results["boundary_cases"] = [
+        {"text": text, "expected": expected, "found": taxonomy.find_in(text), "ok": taxonomy.find_in(text) == expected}
+        for text, expected in BOUNDARY_CASES
+    ]
+    print(f"speedup {results['speedup_p50']}x; substring-only matches: {extra}; "
+          f"boundary cases ok: {sum(c['ok'] for c in results['boundary_cases'])}/{len(BOUNDARY_CASES)}")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
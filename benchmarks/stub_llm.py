@@ -0,0 +1,166 @@
+"""
+Stub LLM for load tests: fixed latency, deterministic answers, no network or API key.
+
+Two ways to use it:
+
+- In process: ``install_stub_llm(get_llm_evaluator(), latency_ms=800)`` replaces the
+  evaluator's LLM call (``benchmarks.loadtest`` does this for the server it starts).
+- As an OpenAI-compatible server for an API started separately:
+
+      python -m benchmarks.stub_llm --port 8900 --latency-ms 800
+      OPENAI_API_KEY=stub OPENAI_BASE_URL=http://127.0.0.1:8900/v1 uvicorn app.api.main:app
+
+  Serves ``/v1/chat/completions`` (the evaluation JSON the app expects) and
+  ``/v1/embeddings`` (hashed vectors).
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import numpy as np
+
+STUB_EMBEDDING_DIM = 256
+
+
+class StubLatency:
+    """Sleeps ``latency_ms`` ± ``jitter_ms`` and fails a ``failure_rate`` share of calls"""
+
+    def __init__(self, latency_ms: float = 800, jitter_ms: float = 200, failure_rate: float = 0.0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def wait(self) -> bool:
+        """Sleep for one call; returns False if this call should fail"""
+        with self._lock:
+            delay = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms))
+            fail = self._rng.random() < self.failure_rate
+        time.sleep(delay / 1000.0)
+        return not fail
+
+
+def _score(*texts: str) -> float:
+    digest = hashlib.sha1("\0".join(texts).encode("utf-8")).digest()
+    return round(0.3 + 0.6 * digest[0] / 255.0, 3)
+
+
+def stub_evaluation(resume_text: str, jd_text: str) -> Dict:
+    """The JSON object the evaluation prompt asks for, derived deterministically from the inputs"""
+    from app.nlp.skills import extract_candidate_skills
+    resume_skills = set(extract_candidate_skills(resume_text))
+    jd_skills = set(extract_candidate_skills(jd_text))
+    return {
+        "semantic_score": _score(resume_text, jd_text),
+        "detailed_feedback": "Stub evaluation for load testing.",
+        "skill_gaps": sorted(jd_skills - resume_skills)[:5],
+        "strengths": sorted(resume_skills & jd_skills)[:5],
+        "improvement_suggestions": ["Quantify project impact", "List relevant certifications"],
+        "relevance_explanation": "Deterministic stub score.",
+        "confidence_score": 0.8,
+    }
+
+
+def install_stub_llm(evaluator, latency_ms: float = 800, jitter_ms: float = 200, failure_rate: float = 0.0, seed: int = 0):
+    """Make ``evaluator`` (an ``AdvancedLLMEvaluator``) answer through the stub"""
+    from app.metrics import timed, LLM_FAILURES
+    from app.services.llm_evaluator import LLMEvaluationResult
+
+    latency = StubLatency(latency_ms, jitter_ms, failure_rate, seed)
+
+    @timed("llm_evaluate")
+    def evaluate_with_llm(resume_text: str, jd_text: str, **precomputed) -> LLMEvaluationResult:
+        if not latency.wait():
+            print("LLM evaluation failed: stub failure")
+            LLM_FAILURES.inc()
+            return evaluator._fallback_evaluation(resume_text, jd_text, **precomputed)
+        return LLMEvaluationResult(**stub_evaluation(resume_text, jd_text))
+
+    evaluator.llm = "stub"
+    evaluator.evaluate_with_llm = evaluate_with_llm
+    return latency
+
+
+def _hashed_embedding(text: str) -> List[float]:
+    seed = int.from_bytes(hashlib.sha1(text.encode("utf-8")).digest()[:8], "little")
+    vec = np.random.default_rng(seed).normal(size=STUB_EMBEDDING_DIM)
+    return (vec / np.linalg.norm(vec)).round(6).tolist()
+
+
+def make_handler(latency: StubLatency):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, payload: Dict):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path.rstrip("/").endswith("/models"):
+                return self._send(200, {"object": "list", "data": [{"id": "stub", "object": "model"}]})
+            self._send(404, {"error": {"message": "not found"}})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if self.path.endswith("/chat/completions"):
+                if not latency.wait():
+                    return self._send(500, {"error": {"message": "stub failure", "type": "server_error"}})
+                prompt = "\n".join(str(m.get("content", "")) for m in request.get("messages", []))
+                content = json.dumps(stub_evaluation(prompt, prompt))
+                return self._send(200, {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", "stub"),
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                    "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": 60, "total_tokens": len(prompt.split()) + 60},
+                })
+            if self.path.endswith("/embeddings"):
+                inputs = request.get("input", [])
+                inputs = inputs if isinstance(inputs, list) else [inputs]
+                data = [{"object": "embedding", "index": i, "embedding": _hashed_embedding(str(x))} for i, x in enumerate(inputs)]
+                return self._send(200, {"object": "list", "data": data, "model": request.get("model", "stub"),
+                                        "usage": {"prompt_tokens": 0, "total_tokens": 0}})
+            self._send(404, {"error": {"message": "not found"}})
+
+    return Handler
+
+
+def serve(host: str = "127.0.0.1", port: int = 8900, latency: StubLatency = None) -> ThreadingHTTPServer:
+    """Start the OpenAI-compatible stub in a background thread"""
+    server = ThreadingHTTPServer((host, port), make_handler(latency or StubLatency()))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=800)
+    parser.add_argument("--jitter-ms", type=float, default=200)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, StubLatency(args.latency_ms, args.jitter_ms, args.failure_rate))
+    print(f"Stub LLM listening on http://{args.host}:{args.port}/v1")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
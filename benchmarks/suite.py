@@ -0,0 +1,243 @@
+"""
+Benchmark harness for the evaluation pipeline and read endpoints.
+
+Runs against a synthetic corpus (``benchmarks.corpus``; generated on first use) in a
+scratch working directory, so the app database, vector index and caches start empty and
+the real ``data/`` is never touched. Cases:
+
+- ``parse_pdf`` / ``parse_docx``: ``extract_text`` per file
+- ``keyword_match``: ``hard_match_score`` per resume/job pair
+- ``embedding_encode`` / ``embedding_similarity``: per text / per pair (TF-IDF fallback
+  when no embedding model is available; the backend is recorded in the results)
+- ``entity_extraction``: ``extract_entities`` per resume
+- ``ingest_resume``: ``crud.create_resume`` (feature bundle included)
+- ``evaluate``: ``evaluate_resume_against_job`` per pair
+- ``api_*``: list/search/analytics endpoints through the ASGI app
+
+    python -m benchmarks.suite --resumes 200 --jobs 20 --pairs 200 --out bench_suite.json
+    python -m benchmarks.suite --baseline bench_suite.json --fail-on-regression
+
+With ``--baseline`` each case's median is compared to the earlier run and cases slower by
+more than ``--threshold`` are reported as regressions.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from benchmarks.corpus import generate_corpus
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    total = sum(ordered)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))]
+
+    return {
+        "n": len(ordered),
+        "total_s": round(total, 4),
+        "mean_ms": round(1000 * total / len(ordered), 3),
+        "p50_ms": round(1000 * statistics.median(ordered), 3),
+        "p90_ms": round(1000 * pct(0.90), 3),
+        "p95_ms": round(1000 * pct(0.95), 3),
+        "p99_ms": round(1000 * pct(0.99), 3),
+        "max_ms": round(1000 * ordered[-1], 3),
+        "ops_per_s": round(len(ordered) / total, 2) if total else None,
+    }
+
+
+def run_case(results: Dict, name: str, fn: Callable, items: Iterable, warmup: int = 1):
+    """Time ``fn(item)`` for every item; the first ``warmup`` calls are not recorded"""
+    items = list(items)
+    if not items:
+        print(f"{name}: skipped (no input)")
+        return []
+    for item in items[:warmup]:
+        fn(item)
+    samples, outputs = [], []
+    for item in items:
+        start = time.perf_counter()
+        outputs.append(fn(item))
+        samples.append(time.perf_counter() - start)
+    results[name] = summarize(samples)
+    print(f"{name}: p50 {results[name]['p50_ms']} ms, p95 {results[name]['p95_ms']} ms, n={len(samples)}")
+    return outputs
+
+
+def _git_commit(repo_dir: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=repo_dir, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_suite(manifest: Dict, corpus_dir: str, pairs: int) -> Dict:
+    # Imported here: the app resolves data paths relative to the (scratch) working directory
+    from fastapi.testclient import TestClient
+    from app.api.main import app
+    from app.db import crud
+    from app.db.database import SessionLocal
+    from app.nlp import embeddings
+    from app.nlp.advanced_processor import get_text_processor
+    from app.nlp.scoring import hard_match_score
+    from app.parsing.files import extract_text
+    from app.services.evaluator import evaluate_resume_against_job
+
+    cases: Dict[str, Dict] = {}
+    files = {r["file"]: open(os.path.join(corpus_dir, r["file"]), "rb").read() for r in manifest["resumes"]}
+
+    for ext in ("pdf", "docx"):
+        names = [n for n in files if n.endswith(ext)]
+        run_case(cases, f"parse_{ext}", lambda n: extract_text(files[n], n), names)
+    texts = {n: extract_text(data, n)[0] for n, data in files.items()}
+
+    resumes, jobs = manifest["resumes"], manifest["jobs"]
+    pair_index = [(i % len(resumes), (i // len(resumes) + i) % len(jobs)) for i in range(min(pairs, len(resumes) * len(jobs)))]
+    run_case(
+        cases, "keyword_match",
+        lambda p: hard_match_score(texts[resumes[p[0]]["file"]], jobs[p[1]]["must_skills"], jobs[p[1]]["nice_skills"]),
+        pair_index,
+    )
+
+    backend = embeddings.embedding_model_id() or "tfidf"
+    if backend != "tfidf":
+        run_case(cases, "embedding_encode", lambda t: embeddings.encode_texts([t]), list(texts.values()))
+    run_case(
+        cases, "embedding_similarity",
+        lambda p: embeddings.embedding_similarity(jobs[p[1]]["jd_text"], texts[resumes[p[0]]["file"]]),
+        pair_index,
+    )
+
+    processor = get_text_processor()
+    run_case(cases, "entity_extraction", processor.extract_entities, list(texts.values()))
+
+    db = SessionLocal()
+    try:
+        job_rows = [
+            crud.create_job(
+                db, title=j["title"], jd_text=j["jd_text"], must_skills=j["must_skills"],
+                nice_skills=j["nice_skills"], location=j["location"],
+            )
+            for j in jobs
+        ]
+        resume_rows = run_case(
+            cases, "ingest_resume",
+            lambda r: crud.create_resume(
+                db, student_name=r["student_name"], file_name=r["file"], text=texts[r["file"]], location=r["location"],
+            ),
+            resumes, warmup=0,
+        )
+        run_case(cases, "evaluate", lambda p: evaluate_resume_against_job(db, job_rows[p[1]], resume_rows[p[0]]), pair_index)
+        for r, job in zip(resumes, job_rows * (len(resumes) // len(job_rows) + 1)):
+            crud.create_student_application(
+                db, job_id=job.id, student_name=r["student_name"], email=f"{r['file']}@example.com",
+                location=r["location"], resume_file_name=r["file"], resume_text=texts[r["file"]],
+            )
+    finally:
+        db.close()
+
+    client = TestClient(app)
+    endpoints = {
+        "api_list_jobs": "/jobs/",
+        "api_list_applications": "/student-applications/",
+        "api_analytics_dashboard": "/analytics/dashboard",
+        "api_search_resumes": "/search/resumes?query=python%20developer&limit=10",
+        "api_search_jobs": "/search/jobs?query=data%20engineer&limit=10",
+        "api_advanced_search": "/search/resumes/advanced?min_score=30&limit=20",
+        "api_shortlisted": "/shortlisted-resumes?min_score=50",
+    }
+    status = {}
+    for name, url in endpoints.items():
+        responses = run_case(cases, name, lambda u: client.get(u), [url] * 20)
+        status[name] = sorted({r.status_code for r in responses})
+
+    return {"cases": cases, "embedding_backend": backend, "endpoint_status": status}
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """Per-case median ratio against ``baseline``; returns regressions beyond ``threshold``"""
+    regressions = []
+    print(f"\n{'case':28} {'baseline p50':>14} {'current p50':>14} {'ratio':>7}")
+    for name, stats in current["cases"].items():
+        before = baseline.get("cases", {}).get(name)
+        if not before or not before.get("p50_ms"):
+            print(f"{name:28} {'-':>14} {stats['p50_ms']:>14} {'new':>7}")
+            continue
+        ratio = stats["p50_ms"] / before["p50_ms"]
+        flag = "  <-- regression" if ratio > 1 + threshold else ""
+        print(f"{name:28} {before['p50_ms']:>14} {stats['p50_ms']:>14} {ratio:>7.2f}{flag}")
+        if flag:
+            regressions.append({"case": name, "baseline_p50_ms": before["p50_ms"], "p50_ms": stats["p50_ms"], "ratio": round(ratio, 3)})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default="data/bench_corpus", help="corpus directory (generated if missing)")
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--pairs", type=int, default=200, help="resume/job pairs for matching and evaluation")
+    parser.add_argument("--workdir", default=None, help="scratch directory for the app database (default: temporary)")
+    parser.add_argument("--out", default="bench_suite.json")
+    parser.add_argument("--baseline", default=None, help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed median slowdown before flagging")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    repo_dir = os.getcwd()
+    corpus_dir = os.path.abspath(args.corpus)
+    out_path = os.path.abspath(args.out)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    manifest_path = os.path.join(corpus_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    else:
+        manifest = generate_corpus(corpus_dir, args.resumes, args.jobs, seed=args.seed)
+        print(f"Generated corpus in {corpus_dir}")
+
+    workdir = os.path.abspath(args.workdir or tempfile.mkdtemp(prefix="bench_suite_"))
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+    print(f"Working directory: {workdir}")
+
+    started = time.perf_counter()
+    outcome = run_suite(manifest, corpus_dir, args.pairs)
+    results = {
+        "created_at": datetime.utcnow().isoformat(),
+        "git_commit": _git_commit(repo_dir),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "corpus": {"seed": manifest.get("seed"), "resumes": len(manifest["resumes"]), "jobs": len(manifest["jobs"])},
+        "pairs": args.pairs,
+        "wall_seconds": round(time.perf_counter() - started, 2),
+        **outcome,
+    }
+
+    regressions = []
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        results["baseline"] = {"file": baseline_path, "threshold": args.threshold, "regressions": regressions}
+
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {out_path}")
+    if regressions and args.fail_on_regression:
+        raise SystemExit(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
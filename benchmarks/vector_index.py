@@ -0,0 +1,117 @@
+"""
+Compare query latency and recall of the FAISS and Chroma vector index backends.
+
+Uses synthetic clustered, L2-normalized embeddings (same dimension as MiniLM) so the
+comparison isolates the index itself from the embedding model. Ground truth is exact
+inner-product search.
+
+    python -m benchmarks.vector_index --docs 100000 --queries 200 --out bench_vector_index.json
+"""
+import argparse
+import json
+import tempfile
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.vector_index import (
+    ChromaVectorIndex,
+    FaissVectorIndex,
+    chromadb_available,
+    faiss_available,
+)
+
+
+def make_corpus(n_docs: int, n_queries: int, dim: int, seed: int):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(8, n_docs // 500), dim)).astype(np.float32)
+    assign = rng.integers(0, len(centers), size=n_docs)
+    docs = centers[assign] + 0.6 * rng.normal(size=(n_docs, dim)).astype(np.float32)
+    docs /= np.linalg.norm(docs, axis=1, keepdims=True)
+    picks = rng.integers(0, n_docs, size=n_queries)
+    queries = docs[picks] + 0.3 * rng.normal(size=(n_queries, dim)).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    return docs, queries
+
+
+def exact_top_k(docs: np.ndarray, queries: np.ndarray, k: int) -> List[set]:
+    truth = []
+    for q in queries:
+        scores = docs @ q
+        top = np.argpartition(-scores, k)[:k]
+        truth.append(set(int(i) for i in top))
+    return truth
+
+
+def run_backend(index, docs: np.ndarray, queries: np.ndarray, truth: List[set], k: int, batch: int) -> Dict:
+    doc_ids = [f"resume_{i}" for i in range(len(docs))]
+    start = time.perf_counter()
+    for s in range(0, len(docs), batch):
+        ids = doc_ids[s:s + batch]
+        metadatas = [{"type": "resume", "resume_id": i} for i in range(s, s + len(ids))]
+        index.add_embeddings(docs[s:s + batch], ["" for _ in ids], metadatas, ids)
+    index.flush()
+    build_s = time.perf_counter() - start
+
+    latencies, recalls = [], []
+    for q, expected in zip(queries, truth):
+        t0 = time.perf_counter()
+        hits = index.query_embedding(q, n_results=k)
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+        # The common result shape carries no ids, so recover them via metadata
+        got = {int(h["metadata"]["resume_id"]) for h in hits}
+        recalls.append(len(got & expected) / k)
+
+    lat = np.array(latencies)
+    return {
+        "build_seconds": round(build_s, 3),
+        "query_ms_p50": round(float(np.percentile(lat, 50)), 3),
+        "query_ms_p95": round(float(np.percentile(lat, 95)), 3),
+        "query_ms_mean": round(float(lat.mean()), 3),
+        f"recall_at_{k}": round(float(np.mean(recalls)), 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--backends", default="faiss-flat,faiss-ivf,faiss-hnsw,chroma")
+    parser.add_argument("--out", default="bench_vector_index.json")
+    args = parser.parse_args()
+
+    docs, queries = make_corpus(args.docs, args.queries, args.dim, args.seed)
+    truth = exact_top_k(docs, queries, args.k)
+
+    results = {"docs": args.docs, "queries": args.queries, "dim": args.dim, "k": args.k, "backends": {}}
+    for backend in args.backends.split(","):
+        with tempfile.TemporaryDirectory() as tmp:
+            if backend.startswith("faiss-"):
+                if not faiss_available():
+                    print(f"Skipping {backend}: faiss not installed")
+                    continue
+                index = FaissVectorIndex(tmp, backend.split("-", 1)[1], nlist=max(16, int(np.sqrt(args.docs))), flush_every=10**9)
+            elif backend == "chroma":
+                if not chromadb_available():
+                    print("Skipping chroma: chromadb not installed")
+                    continue
+                index = ChromaVectorIndex(tmp, "bench", metadata={"hnsw:space": "cosine"})
+            else:
+                print(f"Unknown backend {backend}")
+                continue
+
+            print(f"Running {backend} ...")
+            results["backends"][backend] = run_backend(index, docs, queries, truth, args.k, batch=5000)
+            print(f"  {results['backends'][backend]}")
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
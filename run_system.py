@@ -7,16 +7,15 @@ import sys
 import time
 import os
 
-def install_spacy_model():
-    """Install spaCy English model if not available"""
-    try:
-        import spacy
-        spacy.load("en_core_web_sm")
-        print("✅ spaCy model already installed")
-    except OSError:
-        print("📦 Installing spaCy English model...")
-        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=True)
-        print("✅ spaCy model installed successfully")
+def check_nlp_resources():
+    """Check the offline NLTK/spaCy bundle; never downloads (run the bundle command for that)"""
+    from app.nlp.resources import verify
+    status = verify()
+    if status["degraded"]:
+        print(f"⚠️ Missing NLP resources: {', '.join(status['missing'])}")
+        print(f"   Running in degraded mode. Build the bundle with: python -m app.nlp.resources --bundle {status['bundle_dir']}")
+    else:
+        print("✅ NLP resources available")
 
 def start_fastapi():
     """Start FastAPI backend server"""
@@ -46,9 +45,9 @@ def main():
     # Install dependencies
     print("📦 Checking dependencies...")
     try:
-        install_spacy_model()
+        check_nlp_resources()
     except Exception as e:
-        print(f"⚠️ Warning: Could not install spaCy model: {e}")
+        print(f"⚠️ Warning: Could not check NLP resources: {e}")
     
     # Start services
     processes = []